@@ -2,12 +2,31 @@
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 
 from agent_manager.config import Config
 from agent_manager.core import create_repo
-from agent_manager.output import MessageType, VerbosityLevel, message
+from agent_manager.output import MessageType, VerbosityLevel, buffered_output, message, replay_output
+
+# Maximum number of repository URLs checked at the same time
+MAX_VALIDATE_WORKERS = 8
+
+
+def _validate_repo_url(config: Config, url: str) -> tuple[bool, list[tuple[str, bool]]]:
+    """Validate one repository URL, holding back the messages it produces.
+
+    Args:
+        config: Config instance
+        url: Repository URL to validate
+
+    Returns:
+        Tuple of the validation result and the messages produced while checking
+    """
+    with buffered_output() as lines:
+        valid = config.validate_repo_url(url)
+    return valid, lines
 
 
 class ConfigCommands:
@@ -211,6 +230,10 @@ class ConfigCommands:
     def validate_all(config: Config) -> None:
         """Validate all repository URLs in the configuration.
 
+        URLs are checked concurrently, since remote checks mostly wait on the
+        network; results are reported in hierarchy order, each with the
+        messages its check produced.
+
         Args:
             config: Config instance
         """
@@ -225,19 +248,27 @@ class ConfigCommands:
         config_data = config.read()
         message("\nValidating all repositories...\n", MessageType.INFO, VerbosityLevel.EXTRA_VERBOSE)
 
+        hierarchy = config_data["hierarchy"]
+        total = len(hierarchy)
+
         all_valid = True
-        for idx, entry in enumerate(config_data["hierarchy"]):
-            name = entry["name"]
-            url = entry["url"]
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_VALIDATE_WORKERS, total))) as executor:
+            futures = [executor.submit(_validate_repo_url, config, entry["url"]) for entry in hierarchy]
+
+            for idx, (entry, future) in enumerate(zip(hierarchy, futures, strict=True), 1):
+                name = entry["name"]
+                url = entry["url"]
+
+                message(f"[{idx}/{total}] {name}: {url}", MessageType.NORMAL, VerbosityLevel.ALWAYS)
 
-            total = len(config_data["hierarchy"])
-            message(f"[{idx + 1}/{total}] {name}: {url}", MessageType.NORMAL, VerbosityLevel.ALWAYS)
+                valid, lines = future.result()
+                replay_output(lines)
 
-            if config.validate_repo_url(url):
-                message("  ✓ Valid", MessageType.SUCCESS, VerbosityLevel.ALWAYS)
-            else:
-                message("  ✗ Invalid or inaccessible", MessageType.ERROR, VerbosityLevel.ALWAYS)
-                all_valid = False
+                if valid:
+                    message("  ✓ Valid", MessageType.SUCCESS, VerbosityLevel.ALWAYS)
+                else:
+                    message("  ✗ Invalid or inaccessible", MessageType.ERROR, VerbosityLevel.ALWAYS)
+                    all_valid = False
 
         message("", MessageType.NORMAL, VerbosityLevel.ALWAYS)
         if all_valid:
@@ -9,7 +9,7 @@ import yaml
 
 from agent_manager.core import create_repo, discover_repo_types
 from agent_manager.output import MessageType, VerbosityLevel, message
-from agent_manager.utils import is_file_url, resolve_file_path
+from agent_manager.utils import atomic_write_text, is_file_url, resolve_file_path
 
 
 class HierarchyEntry(TypedDict):
@@ -290,9 +290,8 @@ class Config:
                 if key != "hierarchy":
                     clean_config[key] = value
 
-            # Write to file
-            with open(self.config_file, "w") as f:
-                yaml.dump(clean_config, f, default_flow_style=False, sort_keys=False)
+            # Write to file atomically so a crash never leaves a truncated config
+            atomic_write_text(self.config_file, yaml.dump(clean_config, default_flow_style=False, sort_keys=False))
             print(f"\n✓ Configuration saved to {self.config_file}")
         except ConfigError as e:
             print(f"Error: Invalid configuration - {e}")
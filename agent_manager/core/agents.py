@@ -13,13 +13,14 @@ def discover_agent_plugins(include_disabled: bool = False) -> dict[str, dict]:
     """Discover all available agent plugins.
 
     Agent plugins are discovered by searching for installed packages
-    that start with 'am_agent_' prefix.
+    that start with 'am_agent_' prefix. The returned dictionary is ordered
+    by agent name so callers can iterate it without sorting again.
 
     Args:
         include_disabled: If True, include disabled agent plugins
 
     Returns:
-        Dictionary mapping agent names to plugin info:
+        Dictionary mapping agent names to plugin info, sorted by name:
         {
             "claude": {
                 "package_name": "am_agent_claude",
@@ -36,7 +37,8 @@ def discover_agent_plugins(include_disabled: bool = False) -> dict[str, dict]:
     if not include_disabled:
         plugins = filter_disabled_plugins(plugins, "agents")
 
-    return plugins
+    # Sort once here so every consumer gets a stable, ordered view
+    return dict(sorted(plugins.items()))
 
 
 def get_agent_names() -> list[str]:
@@ -45,8 +47,7 @@ def get_agent_names() -> list[str]:
     Returns:
         List of agent names (e.g., ["claude", "copilot"])
     """
-    plugins = discover_agent_plugins()
-    return sorted(plugins.keys())
+    return list(discover_agent_plugins())
 
 
 def load_agent(agent_name: str, plugins: dict[str, dict] | None = None):
@@ -67,7 +68,7 @@ def load_agent(agent_name: str, plugins: dict[str, dict] | None = None):
 
     if agent_name not in plugins:
         message(f"Agent '{agent_name}' not found", MessageType.ERROR, VerbosityLevel.ALWAYS)
-        available = ", ".join(sorted(plugins.keys())) if plugins else "none"
+        available = ", ".join(plugins) if plugins else "none"
         message(f"Available agents: {available}", MessageType.NORMAL, VerbosityLevel.ALWAYS)
         sys.exit(1)
 
@@ -93,7 +94,7 @@ def run_agents(agent_names: list[str], config_data: dict, scope: str = "default"
     plugins = discover_agent_plugins()
 
     # Determine which agents to run
-    agents_to_run = sorted(plugins.keys()) if agent_names == ["all"] or "all" in agent_names else agent_names
+    agents_to_run = list(plugins) if agent_names == ["all"] or "all" in agent_names else agent_names
 
     # Check if we have any agents
     if not agents_to_run:
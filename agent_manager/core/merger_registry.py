@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from agent_manager.output import MessageType, VerbosityLevel, message
+from agent_manager.output import MessageType, VerbosityLevel, debug_enabled, message
 from agent_manager.plugins.mergers.abstract_merger import AbstractMerger
 from agent_manager.plugins.mergers.copy_merger import CopyMerger
 
@@ -64,24 +64,30 @@ class MergerRegistry:
         filename = file_path.name
         extension = file_path.suffix
 
+        # Called once per merged file, so skip building debug text unless it will be shown
+        debug = debug_enabled()
+
         # Priority 1: Exact filename match
         if filename in self.filename_mergers:
             merger = self.filename_mergers[filename]
-            message(f"Using {merger.__name__} for filename: {filename}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+            if debug:
+                message(f"Using {merger.__name__} for filename: {filename}", MessageType.DEBUG, VerbosityLevel.DEBUG)
             return merger
 
         # Priority 2: Extension match
         if extension in self.extension_mergers:
             merger = self.extension_mergers[extension]
-            message(f"Using {merger.__name__} for extension: {extension}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+            if debug:
+                message(f"Using {merger.__name__} for extension: {extension}", MessageType.DEBUG, VerbosityLevel.DEBUG)
             return merger
 
         # Priority 3: Default fallback
-        message(
-            f"No specific merger for {filename}, using default: {self.default_merger.__name__}",
-            MessageType.DEBUG,
-            VerbosityLevel.DEBUG,
-        )
+        if debug:
+            message(
+                f"No specific merger for {filename}, using default: {self.default_merger.__name__}",
+                MessageType.DEBUG,
+                VerbosityLevel.DEBUG,
+            )
         return self.default_merger
 
     def list_registered_mergers(self) -> dict[str, list[str]]:
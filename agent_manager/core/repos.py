@@ -4,9 +4,10 @@ import importlib
 import inspect
 import pkgutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from agent_manager.output import MessageType, VerbosityLevel, message
+from agent_manager.output import MessageType, VerbosityLevel, buffered_output, message, replay_output
 from agent_manager.utils import get_disabled_plugins
 
 
@@ -120,32 +121,73 @@ def create_repo(name: str, url: str, repos_dir: Path, repo_type: str):
     return repo_class(name, url, repos_dir)
 
 
+# Maximum number of repositories cloned/updated at the same time
+MAX_UPDATE_WORKERS = 8
+
+
+def _update_repository(repo, force: bool) -> tuple[bool | BaseException, list[tuple[str, bool]]]:
+    """Update a single repository if needed, holding back its output.
+
+    Args:
+        repo: Repository object to update
+        force: If True, update even if repo appears up to date
+
+    Returns:
+        Tuple of the outcome and the messages the repository produced. The
+        outcome is True if the repository was updated, False if it was
+        already up to date, or the exception (including SystemExit) it raised.
+    """
+    with buffered_output() as lines:
+        try:
+            if force or repo.needs_update():
+                repo.update()
+                outcome = True
+            else:
+                outcome = False
+        except (SystemExit, Exception) as e:
+            outcome = e
+    return outcome, lines
+
+
 def update_repositories(config_data: dict, force: bool = False) -> None:
     """Update all repositories in the hierarchy.
 
+    Repositories are updated concurrently in a thread pool, since clones and
+    pulls mostly wait on the network. Each repository's messages are held
+    back and shown under its own progress line, in hierarchy order. A failing
+    repository does not stop the others; failures are reported once all
+    updates have finished.
+
     Args:
         config_data: The configuration data with repo objects
         force: If True, update even if repo appears up to date
     """
     message("\nUpdating repositories...\n", MessageType.NORMAL, VerbosityLevel.ALWAYS)
 
+    hierarchy = config_data["hierarchy"]
+    total = len(hierarchy)
+
     errors = False
-    for idx, entry in enumerate(config_data["hierarchy"], 1):
-        name = entry["name"]
-        repo = entry["repo"]  # Use the repo object from config
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_UPDATE_WORKERS, total))) as executor:
+        futures = [executor.submit(_update_repository, entry["repo"], force) for entry in hierarchy]
 
-        message(f"[{idx}/{len(config_data['hierarchy'])}] {name}", MessageType.NORMAL, VerbosityLevel.ALWAYS)
+        # Report results in hierarchy order
+        for idx, (entry, future) in enumerate(zip(hierarchy, futures, strict=True), 1):
+            name = entry["name"]
+            message(f"[{idx}/{total}] {name}", MessageType.NORMAL, VerbosityLevel.ALWAYS)
 
-        try:
-            # Check if update is needed
-            if force or repo.needs_update():
-                repo.update()
-            else:
-                message(f"  {name} is up to date, skipping", MessageType.NORMAL, VerbosityLevel.ALWAYS)
+            outcome, lines = future.result()
+            replay_output(lines)
 
-        except Exception as e:
-            message(f"Failed to update '{name}': {e}", MessageType.ERROR, VerbosityLevel.ALWAYS)
-            errors = True
+            if outcome is False:
+                message(f"  {name} is up to date, skipping", MessageType.NORMAL, VerbosityLevel.ALWAYS)
+            elif isinstance(outcome, SystemExit):
+                # Repo types may exit after reporting their own error; keep the other updates going
+                message(f"Failed to update '{name}'", MessageType.ERROR, VerbosityLevel.ALWAYS)
+                errors = True
+            elif isinstance(outcome, Exception):
+                message(f"Failed to update '{name}': {outcome}", MessageType.ERROR, VerbosityLevel.ALWAYS)
+                errors = True
 
     if errors:
         message("\n✗ Some repositories failed to update", MessageType.ERROR, VerbosityLevel.ALWAYS)
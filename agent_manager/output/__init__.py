@@ -5,8 +5,11 @@ from agent_manager.output.output import (
     MessageType,
     OutputManager,
     VerbosityLevel,
+    buffered_output,
+    debug_enabled,
     get_output,
     message,
+    replay_output,
     set_verbosity,
 )
 
@@ -15,7 +18,10 @@ __all__ = [
     "MessageType",
     "OutputManager",
     "VerbosityLevel",
+    "buffered_output",
+    "debug_enabled",
     "get_output",
     "message",
+    "replay_output",
     "set_verbosity",
 ]
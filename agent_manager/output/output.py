@@ -1,6 +1,9 @@
 """Output and logging utilities for agent-manager."""
 
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import IntEnum
 
 
@@ -91,6 +94,17 @@ class OutputManager:
         """
         self.verbosity = level
 
+    def is_enabled(self, verbosity: VerbosityLevel) -> bool:
+        """Check whether messages at a verbosity level would be shown.
+
+        Args:
+            verbosity: Verbosity level required by the message
+
+        Returns:
+            True if the current verbosity is high enough to show the message
+        """
+        return self.verbosity >= verbosity
+
     def message(
         self,
         text: str,
@@ -115,7 +129,7 @@ class OutputManager:
                       DEBUG: requires -vvv
         """
         # Only print if verbosity is high enough
-        if self.verbosity < verbosity:
+        if not self.is_enabled(verbosity):
             return
 
         # Get prefix and color for this message type
@@ -129,11 +143,27 @@ class OutputManager:
         if self.use_color and color:
             final_message = f"{color}{final_message}{Color.RESET}"
 
+        # Hold the line back if this thread is collecting its output
+        buffer = getattr(_buffers, "lines", None)
+        if buffer is not None:
+            buffer.append((final_message, msg_type == MessageType.ERROR))
+            return
+
         # Determine output file (errors go to stderr, everything else to stdout)
         # Evaluated at runtime to support mocking in tests
         file = sys.stderr if msg_type == MessageType.ERROR else sys.stdout
 
-        print(final_message, file=file)
+        # print() writes the text and the newline separately; keep lines from
+        # concurrent workers (e.g. parallel repo updates) from interleaving
+        with _print_lock:
+            print(final_message, file=file)
+
+
+# Serializes output from multiple threads
+_print_lock = threading.Lock()
+
+# Per-thread list of held-back lines while buffered_output() is active
+_buffers = threading.local()
 
 
 # Global output manager instance
@@ -158,6 +188,48 @@ def set_verbosity(level: int) -> None:
     _output_manager.set_verbosity(level)
 
 
+def debug_enabled() -> bool:
+    """Check whether DEBUG-level messages are currently shown.
+
+    Use this to guard debug messages in per-file loops so their f-strings are
+    not built when the output would be discarded anyway.
+
+    Returns:
+        True if the global verbosity is at DEBUG level (-vvv) or higher
+    """
+    return _output_manager.is_enabled(VerbosityLevel.DEBUG)
+
+
+@contextmanager
+def buffered_output() -> Iterator[list[tuple[str, bool]]]:
+    """Collect the current thread's messages instead of printing them.
+
+    Lets worker threads (e.g. parallel repo updates) keep their output
+    together so it can be shown in one block with replay_output().
+
+    Yields:
+        List that receives (formatted line, goes to stderr) pairs
+    """
+    lines: list[tuple[str, bool]] = []
+    previous = getattr(_buffers, "lines", None)
+    _buffers.lines = lines
+    try:
+        yield lines
+    finally:
+        _buffers.lines = previous
+
+
+def replay_output(lines: list[tuple[str, bool]]) -> None:
+    """Print lines collected by buffered_output() as one uninterrupted block.
+
+    Args:
+        lines: Lines collected by buffered_output()
+    """
+    with _print_lock:
+        for line, to_stderr in lines:
+            print(line, file=sys.stderr if to_stderr else sys.stdout)
+
+
 # Single unified message function
 def message(
     text: str,
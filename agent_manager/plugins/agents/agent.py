@@ -1,16 +1,188 @@
 """Abstract base class for AI agent plugins."""
 
 import fnmatch
+import os
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from agent_manager.core import MergerRegistry
-from agent_manager.output import MessageType, VerbosityLevel, message
+from agent_manager.core import MergerRegistry, create_default_merger_registry
+from agent_manager.output import MessageType, VerbosityLevel, debug_enabled, message
+from agent_manager.utils.files import fast_write_text, output_unchanged, read_files
 
 
-@dataclass
+def _compile_glob_union(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile glob patterns into a single regex matching any of them.
+
+    Args:
+        patterns: fnmatch-style glob patterns
+
+    Returns:
+        Compiled regex; matches nothing when no patterns are given
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+
+# Characters that make an exclude pattern a glob rather than a literal name
+_GLOB_CHARS = frozenset("*?[")
+
+# Metadata header comment syntax by file extension: (comment_start, comment_end).
+# None means the format has no comments and the header is skipped.
+_HASH_COMMENT = ("# ", "")
+_HTML_COMMENT = ("<!-- ", " -->")
+_COMMENT_STYLES: dict[str, tuple[str, str] | None] = {
+    ".json": None,
+    ".yaml": _HASH_COMMENT,
+    ".yml": _HASH_COMMENT,
+    ".txt": _HASH_COMMENT,
+    ".py": _HASH_COMMENT,
+    ".sh": _HASH_COMMENT,
+    ".cursorrules": _HASH_COMMENT,
+    ".clinerules": _HASH_COMMENT,
+    ".md": _HTML_COMMENT,
+    ".markdown": _HTML_COMMENT,
+    ".html": _HTML_COMMENT,
+    ".xml": _HTML_COMMENT,
+}
+
+# Metadata header lines; {start}/{end} are filled with the file's comment syntax
+_METADATA_HEADER_TEMPLATE = (
+    "{start}Generated by agent-manager ({agent_name} agent){end}\n"
+    "{start}File: {file_name}{end}\n"
+    "{start}Sources: {sources}{end}\n"
+    "{start}Hierarchy: {lowest} (lowest) to {highest} (highest priority){end}\n\n"
+)
+
+
+@lru_cache(maxsize=1)
+def _default_merger_registry() -> MergerRegistry:
+    """Get the shared template registry of built-in and external mergers.
+
+    Merger discovery scans packages and entry points, so it runs once per
+    process; agents copy their registrations from this template.
+
+    Returns:
+        MergerRegistry with default mergers registered
+    """
+    return create_default_merger_registry()
+
+
+class _HookTable:
+    """Registered hooks split by how their file pattern has to be matched.
+
+    Exact file names are looked up in a dict, the "*" wildcard matches without
+    any check, and only the remaining glob patterns are tested with a regex
+    (compiled once instead of calling fnmatch.fnmatch() per hook per file).
+    Matching hooks are returned in registration order.
+    """
+
+    __slots__ = ("exact", "patterns", "match_all")
+
+    def __init__(self, hooks: tuple[tuple[str, Callable], ...]):
+        """Partition registered hooks by pattern kind.
+
+        Args:
+            hooks: (file_pattern, hook_function) pairs in registration order
+        """
+        # file_name -> (registration_index, file_pattern, hook_function)
+        self.exact: dict[str, tuple[int, str, Callable]] = {}
+        # (registration_index, file_pattern, regex or None for "*", hook_function)
+        self.patterns: list[tuple[int, str, re.Pattern | None, Callable]] = []
+
+        for index, (pattern, hook_func) in enumerate(hooks):
+            normalized = os.path.normcase(pattern)
+            if normalized == "*":
+                self.patterns.append((index, pattern, None, hook_func))
+            elif _GLOB_CHARS.isdisjoint(normalized):
+                self.exact[normalized] = (index, pattern, hook_func)
+            else:
+                self.patterns.append((index, pattern, re.compile(fnmatch.translate(normalized)), hook_func))
+
+        # Degenerate case (e.g. only the default "*" post-merge hook): every hook
+        # matches every file, so the result is the same for all file names
+        self.match_all: list[tuple[str, Callable]] | None = None
+        if not self.exact and all(regex is None for _, _, regex, _ in self.patterns):
+            self.match_all = [(pattern, hook_func) for _, pattern, _, hook_func in self.patterns]
+
+    def matching(self, file_name: str) -> list[tuple[str, Callable]]:
+        """Get the hooks whose pattern matches a file name.
+
+        Args:
+            file_name: File name (or relative path) to check
+
+        Returns:
+            List of (file_pattern, hook_function) pairs in registration order
+        """
+        if self.match_all is not None:
+            return self.match_all
+
+        file_name = os.path.normcase(file_name)
+        matched = [
+            (index, pattern, hook_func)
+            for index, pattern, regex, hook_func in self.patterns
+            if regex is None or regex.match(file_name)
+        ]
+
+        exact = self.exact.get(file_name)
+        if exact is not None:
+            matched.append(exact)
+            matched.sort(key=lambda match: match[0])
+
+        return [(pattern, hook_func) for _, pattern, hook_func in matched]
+
+
+class _ExcludeMatcher:
+    """Matches file names against a set of exclude patterns.
+
+    Patterns without glob characters are checked with a set lookup first,
+    then "*<suffix>" patterns (e.g. "*.pyc") with a single str.endswith()
+    call; the remaining glob patterns are combined into one compiled regex.
+    Case is normalized like fnmatch.fnmatch() (a no-op on POSIX).
+    """
+
+    __slots__ = ("literals", "suffixes", "glob_regex")
+
+    def __init__(self, patterns: tuple[str, ...]):
+        """Partition patterns into literal names, suffixes, and glob patterns.
+
+        Args:
+            patterns: Exclude patterns (exact names or fnmatch-style globs)
+        """
+        literals = set()
+        suffixes = []
+        globs = []
+        for pattern in patterns:
+            pattern = os.path.normcase(pattern)
+            if _GLOB_CHARS.isdisjoint(pattern):
+                literals.add(pattern)
+            elif pattern.startswith("*") and len(pattern) > 1 and _GLOB_CHARS.isdisjoint(pattern[1:]):
+                suffixes.append(pattern[1:])
+            else:
+                globs.append(pattern)
+
+        self.literals = frozenset(literals)
+        self.suffixes = tuple(suffixes)
+        self.glob_regex = _compile_glob_union(tuple(globs))
+
+    def matches(self, name: str) -> bool:
+        """Check whether a file or directory name is excluded.
+
+        Args:
+            name: Base name to check
+
+        Returns:
+            True if the name matches any exclude pattern
+        """
+        name = os.path.normcase(name)
+        return name in self.literals or name.endswith(self.suffixes) or self.glob_regex.match(name) is not None
+
+
+@dataclass(slots=True, frozen=True)
 class ScopeConfig:
     """Configuration for a single scope.
 
@@ -59,7 +231,30 @@ class AbstractAgent(ABC):
         Returns:
             Sorted list of scope names
         """
-        return sorted(self.scopes.keys())
+        return list(self._get_sorted_scope_names())
+
+    def _get_sorted_scope_names(self) -> tuple[str, ...]:
+        """Get the sorted scope names, computing them only once per agent instance.
+
+        Returns:
+            Sorted tuple of scope names
+        """
+        if self._cached_scope_names is None:
+            self._cached_scope_names = tuple(sorted(self._get_scopes()))
+        return self._cached_scope_names
+
+    def _get_scopes(self) -> dict:
+        """Get the scopes dictionary, building it only once per agent instance.
+
+        Subclasses typically construct a fresh dict on every access to the scopes
+        property, so internal callers go through this cached copy instead.
+
+        Returns:
+            Dictionary mapping scope names to ScopeConfig objects
+        """
+        if self._cached_scopes is None:
+            self._cached_scopes = self.scopes
+        return self._cached_scopes
 
     def get_scope_directory(self, scope: str | None = None) -> Path:
         """Get the output directory for a specific scope.
@@ -76,9 +271,9 @@ class AbstractAgent(ABC):
         if scope is None:
             scope = self.DEFAULT_SCOPE
 
-        scopes = self.scopes
+        scopes = self._get_scopes()
         if scope not in scopes:
-            available = ", ".join(sorted(scopes.keys()))
+            available = ", ".join(self._get_sorted_scope_names())
             raise ValueError(f"Unknown scope '{scope}'. Available scopes: {available}")
 
         return scopes[scope].directory
@@ -106,6 +301,16 @@ class AbstractAgent(ABC):
 
     def __init__(self):
         """Initialize the agent with hook registries and merger registry."""
+        # Per-instance caches, filled on first use. Set before anything below
+        # since hook registration may already look up scopes.
+        self._cached_scopes: dict | None = None
+        self._cached_scope_names: tuple[str, ...] | None = None
+        self._cached_root_level_files: list[str] | None = None
+        self._cached_repo_directory_names: dict[str | None, str] = {}
+        self._hook_tables: dict[int, tuple[tuple, _HookTable]] = {}
+        self._exclude_matcher: _ExcludeMatcher | None = None
+        self._exclude_matcher_key: tuple[str, ...] = ()
+
         # Hook registries: file_pattern -> hook_function
         self.pre_merge_hooks: dict[str, Callable] = {}
         self.post_merge_hooks: dict[str, Callable] = {}
@@ -122,16 +327,83 @@ class AbstractAgent(ABC):
         self._register_default_hooks()
         self.register_hooks()
 
+    def add_exclude_pattern(self, pattern: str) -> None:
+        """Add a pattern to exclude when discovering files.
+
+        Args:
+            pattern: Filename or fnmatch-style glob pattern (e.g., "*.log")
+        """
+        self.exclude_patterns.append(pattern)
+        self._exclude_matcher = None
+
+    def add_pre_merge_hook(self, pattern: str, hook_func: Callable) -> None:
+        """Register a hook to run on matching files before they are merged.
+
+        Equivalent to assigning self.pre_merge_hooks[pattern] = hook_func.
+
+        Args:
+            pattern: Filename or fnmatch-style glob pattern (e.g., "*.md")
+            hook_func: Callable taking (content, entry, file_path) and returning content
+        """
+        self.pre_merge_hooks[pattern] = hook_func
+        self._hook_tables = {}
+
+    def add_post_merge_hook(self, pattern: str, hook_func: Callable) -> None:
+        """Register a hook to run on matching files after they are merged.
+
+        Equivalent to assigning self.post_merge_hooks[pattern] = hook_func.
+
+        Args:
+            pattern: Filename or fnmatch-style glob pattern (e.g., "*.json")
+            hook_func: Callable taking (content, file_name, sources) and returning content
+        """
+        self.post_merge_hooks[pattern] = hook_func
+        self._hook_tables = {}
+
+    def _get_hook_table(self, hooks: dict[str, Callable]) -> _HookTable:
+        """Get the compiled table for a hook registry.
+
+        Tables are cached per registry. The add_*_merge_hook() methods drop the
+        cache; a table is also rebuilt when the registry's contents have changed
+        since the last call, so direct edits to the dict are honored.
+
+        Args:
+            hooks: Hook registry (e.g., self.pre_merge_hooks)
+
+        Returns:
+            Compiled hook table
+        """
+        key = tuple(hooks.items())
+        cached = self._hook_tables.get(id(hooks))
+        if cached is None or cached[0] != key:
+            cached = (key, _HookTable(key))
+            self._hook_tables[id(hooks)] = cached
+        return cached[1]
+
+    def _get_exclude_matcher(self) -> _ExcludeMatcher:
+        """Get the matcher for the current exclude patterns.
+
+        The matcher is cached. add_exclude_pattern() drops the cache; the
+        matcher is also rebuilt when exclude_patterns has changed since the
+        last call, so direct edits to the list are still honored.
+
+        Returns:
+            Matcher to check file names against
+        """
+        patterns = tuple(self.exclude_patterns)
+        if self._exclude_matcher is None or self._exclude_matcher_key != patterns:
+            self._exclude_matcher = _ExcludeMatcher(patterns)
+            self._exclude_matcher_key = patterns
+        return self._exclude_matcher
+
     def register_default_mergers(self) -> None:
         """Register built-in mergers for common file types.
 
-        Uses late import to avoid circular dependency with agent_manager.
+        Registrations are copied from a template registry that is discovered
+        once and shared by all agents.
         """
-        # Late import to avoid circular dependency
-        from agent_manager.agent_manager import create_default_merger_registry
-
-        # Get a pre-configured registry and copy its registrations
-        default_registry = create_default_merger_registry()
+        # Copy so per-agent registrations don't leak into other agents
+        default_registry = _default_merger_registry()
         self.merger_registry.filename_mergers = default_registry.filename_mergers.copy()
         self.merger_registry.extension_mergers = default_registry.extension_mergers.copy()
         self.merger_registry.default_merger = default_registry.default_merger
@@ -186,7 +458,8 @@ class AbstractAgent(ABC):
             Cleaned content
         """
         content = content.rstrip() + "\n"
-        message(f"    Cleaned markdown from {entry['name']}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+        if debug_enabled():
+            message(f"    Cleaned markdown from {entry['name']}", MessageType.DEBUG, VerbosityLevel.DEBUG)
         return content
 
     def _add_metadata_header(self, content: str, file_name: str, sources: list[str]) -> str:
@@ -200,30 +473,24 @@ class AbstractAgent(ABC):
         Returns:
             Content with metadata header
         """
-        file_lower = file_name.lower()
+        # Text from the last "." onwards, so dotfiles like ".cursorrules" match too
+        _, dot, extension = file_name.lower().rpartition(".")
+        comment_style = _COMMENT_STYLES.get(dot + extension, _HASH_COMMENT)
 
         # JSON doesn't support comments, skip header
-        if file_lower.endswith(".json"):
+        if comment_style is None:
             return content
-
-        # Determine comment style based on file extension
-        if file_lower.endswith((".yaml", ".yml", ".txt", ".py", ".sh", ".cursorrules", ".clinerules")):
-            comment_start = "# "
-            comment_end = ""
-        elif file_lower.endswith((".md", ".markdown", ".html", ".xml")):
-            comment_start = "<!-- "
-            comment_end = " -->"
-        else:
-            comment_start = "# "
-            comment_end = ""
+        comment_start, comment_end = comment_style
 
         # Build header with appropriate comment syntax
-        agent_name = self.get_agent_name()
-        header = f"{comment_start}Generated by agent-manager ({agent_name} agent){comment_end}\n"
-        header += f"{comment_start}File: {file_name}{comment_end}\n"
-        header += f"{comment_start}Sources: {' → '.join(sources)}{comment_end}\n"
-        header += (
-            f"{comment_start}Hierarchy: {sources[0]} (lowest) to {sources[-1]} (highest priority){comment_end}\n\n"
+        header = _METADATA_HEADER_TEMPLATE.format(
+            start=comment_start,
+            end=comment_end,
+            agent_name=self.get_agent_name(),
+            file_name=file_name,
+            sources=" → ".join(sources),
+            lowest=sources[0],
+            highest=sources[-1],
         )
 
         return header + content
@@ -305,7 +572,7 @@ class AbstractAgent(ABC):
         Returns:
             Combined list of filenames to discover at repository root
         """
-        if not hasattr(self, "_cached_root_level_files"):
+        if self._cached_root_level_files is None:
             self._cached_root_level_files = self.BASE_ROOT_LEVEL_FILES + self.get_additional_root_level_files()
         return self._cached_root_level_files
 
@@ -324,7 +591,12 @@ class AbstractAgent(ABC):
         repo_dir_name = getattr(self, "_repo_directory_name", None)
         if repo_dir_name:
             return repo_dir_name
-        return self.get_scope_directory(scope).name
+
+        # The name never changes over the agent's lifetime, so memoize it per scope
+        cache = self._cached_repo_directory_names
+        if scope not in cache:
+            cache[scope] = self.get_scope_directory(scope).name
+        return cache[scope]
 
     def _discover_files(self, repo_path: Path, scope: str | None = None) -> list[Path]:
         """Discover configuration files from repository.
@@ -334,6 +606,9 @@ class AbstractAgent(ABC):
            and get_additional_root_level_files())
         2. Agent subdirectory: <repo_path>/<agent_directory_name>/ (e.g., repo/.claude/)
 
+        Files and directories matching exclude_patterns are skipped; an excluded
+        directory is not descended into at all.
+
         Root-level files are discovered first, ensuring they merge BEFORE agent subdirectory
         files when both exist with the same filename. This allows subdirectory files to
         override/extend root-level files.
@@ -351,27 +626,24 @@ class AbstractAgent(ABC):
         root_level_files = self._get_root_level_files()
         for filename in root_level_files:
             file_path = repo_path / filename
-            if file_path.exists() and file_path.is_file():
+            # is_file() is False for missing paths, so one stat covers both checks
+            if file_path.is_file():
                 found_files.append(file_path)
 
         # === Discover agent subdirectory files ===
         agent_dir_name = self.get_repo_directory_name(scope)
         agent_repo_dir = repo_path / agent_dir_name
 
-        if agent_repo_dir.exists() and agent_repo_dir.is_dir():
-            # Recursively find all files in the agent directory
-            for item in agent_repo_dir.rglob("*"):
-                if item.is_dir():
-                    continue
-
-                should_exclude = False
-                for pattern in self.exclude_patterns:
-                    if fnmatch.fnmatch(item.name, pattern):
-                        should_exclude = True
-                        break
+        if agent_repo_dir.is_dir():
+            exclude = self._get_exclude_matcher()
 
-                if not should_exclude:
-                    found_files.append(item)
+            # Recursively find all files in the agent directory. Excluded directories
+            # (e.g. .git, node_modules) are removed from dir_names in place so os.walk
+            # never descends into them. Symlinks to directories are listed in
+            # dir_names but not followed, so they are neither walked nor returned.
+            for root, dir_names, file_names in os.walk(agent_repo_dir):
+                dir_names[:] = [d for d in dir_names if not exclude.matches(d)]
+                found_files.extend(Path(root, f) for f in file_names if not exclude.matches(f))
 
         def sort_key(path: Path) -> tuple:
             """Sort root-level files before subdirectory files, then by name."""
@@ -425,20 +697,26 @@ class AbstractAgent(ABC):
 
         # Validate scope
         output_dir = self.get_scope_directory(scope)
-        scope_config = self.scopes[scope]
+        scope_config = self._get_scopes()[scope]
 
         message(f"\n=== Merging Configurations for scope '{scope}' ===", MessageType.NORMAL, VerbosityLevel.ALWAYS)
         message(f"Output directory: {output_dir}", MessageType.INFO, VerbosityLevel.VERBOSE)
         if scope_config.description:
             message(f"({scope_config.description})\n", MessageType.NORMAL, VerbosityLevel.VERBOSE)
 
+        # Same for every repository in the hierarchy
+        agent_dir_name = self.get_repo_directory_name(scope)
+
         # Track merged files: filename -> (content, source_info_list)
         merged_files: dict[str, tuple[str, list[str]]] = {}
 
+        # Most hierarchies have no scope-restricted entries, so skip the per-entry check
+        has_scope_filters = any("scopes" in entry for entry in config["hierarchy"])
+
         # Process hierarchy from lowest to highest priority (org -> team -> personal)
         for entry in config["hierarchy"]:
             # Check if this entry applies to the current scope
-            if not self._should_include_entry_for_scope(entry, scope):
+            if has_scope_filters and not self._should_include_entry_for_scope(entry, scope):
                 message(
                     f"Skipping '{entry['name']}' (not in scope '{scope}')",
                     MessageType.DEBUG,
@@ -467,20 +745,24 @@ class AbstractAgent(ABC):
 
             message(f"  Found {len(files)} file(s)", MessageType.DEBUG, VerbosityLevel.DEBUG)
 
-            for file_path in files:
-                # Get relative path from agent directory in repo
-                # e.g., repo/.claude/agents/JIRA.md -> agents/JIRA.md
-                agent_repo_dir = repo_path / self.get_repo_directory_name(scope)
-                try:
-                    relative_path = file_path.relative_to(agent_repo_dir)
-                    file_key = str(relative_path)  # Use relative path as key
-                except ValueError:
-                    # Fallback to just filename if relative_to fails
+            # Get relative paths from agent directory in repo by stripping its prefix
+            # e.g., repo/.claude/agents/JIRA.md -> agents/JIRA.md
+            agent_repo_prefix = str(repo_path / agent_dir_name) + os.sep
+
+            # Read all files up front; merging stays serial to keep source order deterministic
+            for file_path, content in zip(files, read_files(files), strict=True):
+                source_path_str = str(file_path)
+                if source_path_str.startswith(agent_repo_prefix):
+                    file_key = source_path_str[len(agent_repo_prefix) :]  # Use relative path as key
+                else:
+                    # Root-level files are keyed by filename
                     file_key = file_path.name
 
                 try:
-                    content = file_path.read_text()
-                    message(f"    Processing: {file_key}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+                    if isinstance(content, Exception):
+                        raise content
+                    if debug_enabled():
+                        message(f"    Processing: {file_key}", MessageType.DEBUG, VerbosityLevel.DEBUG)
 
                     # PRE-MERGE HOOK: Allow plugin-specific preprocessing
                     content = self._run_hook(self.pre_merge_hooks, file_key, content, entry, file_path)
@@ -516,16 +798,30 @@ class AbstractAgent(ABC):
                 VerbosityLevel.ALWAYS,
             )
 
+            # Output directories already created in this run, to skip repeated mkdir calls
+            created_dirs: set[Path] = set()
+
             for file_path_str, (content, sources) in merged_files.items():
                 # POST-MERGE HOOK: Allow plugin-specific postprocessing
                 content = self._run_hook(self.post_merge_hooks, file_path_str, content, None, None, sources)
 
                 # Preserve directory structure: use relative path as-is
                 output_path = output_dir / file_path_str
+                if output_unchanged(output_path, content):
+                    message(
+                        f"  ✓ Unchanged {file_path_str} (from {len(sources)} source(s): {', '.join(sources)})",
+                        MessageType.SUCCESS,
+                        VerbosityLevel.ALWAYS,
+                    )
+                    continue
+
                 try:
                     # Ensure parent directories exist
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    output_path.write_text(content)
+                    parent = output_path.parent
+                    if parent not in created_dirs:
+                        parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(parent)
+                    fast_write_text(output_path, content)
                     message(
                         f"  ✓ Wrote {file_path_str} (from {len(sources)} source(s): {', '.join(sources)})",
                         MessageType.SUCCESS,
@@ -560,20 +856,19 @@ class AbstractAgent(ABC):
         Returns:
             Possibly modified content
         """
-        for pattern, hook_func in hooks.items():
-            if fnmatch.fnmatch(file_name, pattern):
-                try:
-                    # Call hook with available context
-                    if sources is not None:
-                        # Post-merge hook signature
-                        content = hook_func(content, file_name, sources)
-                    else:
-                        # Pre-merge hook signature
-                        content = hook_func(content, entry, file_path)
-                except Exception as e:
-                    message(
-                        f"  Hook error for {file_name} (pattern: {pattern}): {e}",
-                        MessageType.WARNING,
-                        VerbosityLevel.ALWAYS,
-                    )
+        for pattern, hook_func in self._get_hook_table(hooks).matching(file_name):
+            try:
+                # Call hook with available context
+                if sources is not None:
+                    # Post-merge hook signature
+                    content = hook_func(content, file_name, sources)
+                else:
+                    # Pre-merge hook signature
+                    content = hook_func(content, entry, file_path)
+            except Exception as e:
+                message(
+                    f"  Hook error for {file_name} (pattern: {pattern}): {e}",
+                    MessageType.WARNING,
+                    VerbosityLevel.ALWAYS,
+                )
         return content
@@ -1,11 +1,12 @@
 """Repository backend plugins for agent-manager."""
 
 from .abstract_repo import AbstractRepo
-from .git_repo import GitRepo
+from .git_repo import GitRepo, GitRepoError
 from .local_repo import LocalRepo
 
 __all__ = [
     "AbstractRepo",
     "GitRepo",
+    "GitRepoError",
     "LocalRepo",
 ]
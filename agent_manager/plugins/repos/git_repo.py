@@ -1,6 +1,6 @@
 """Git repository implementation."""
 
-import sys
+import threading
 from pathlib import Path
 
 import git
@@ -8,12 +8,38 @@ import git
 from agent_manager.output import MessageType, VerbosityLevel, message
 from agent_manager.plugins.repos.abstract_repo import AbstractRepo
 
+# URL prefixes that always denote git, and HTTP prefixes that do when the URL
+# mentions ".git"
+_GIT_URL_PREFIXES = ("git@", "git://", "ssh://")
+_HTTP_URL_PREFIXES = ("http://", "https://")
+
+# Hosting services whose URLs are treated as git even without ".git"
+_GIT_HOSTS = ("github.com", "gitlab.com", "bitbucket.org")
+
+
+class GitRepoError(RuntimeError):
+    """Exception raised when a git repository cannot be cloned, checked, or updated."""
+
 
 class GitRepo(AbstractRepo):
     """Manages a git repository."""
 
     REPO_TYPE = "git"
 
+    # URLs that passed ls-remote in this process. Failures are not cached so
+    # that a retry (e.g. after fixing credentials) checks the remote again.
+    _validated_urls: set[str] = set()
+
+    # URL -> local path of a clone created in this process. Later clones of the
+    # same URL copy it over file:// instead of downloading from the remote
+    # again. Guarded by a lock since repositories are updated in parallel.
+    _local_clones: dict[str, Path] = {}
+    _local_clones_lock = threading.Lock()
+
+    # URL -> lock held while that URL is being cloned, so parallel clones of
+    # the same URL run one after another and the later ones can copy the first
+    _clone_locks: dict[str, threading.Lock] = {}
+
     @classmethod
     def can_handle_url(cls, url: str) -> bool:
         """Check if this is a git repository URL.
@@ -25,33 +51,36 @@ class GitRepo(AbstractRepo):
             True if this looks like a git URL
         """
         # Check for common git URL patterns
-        git_patterns = [
-            url.startswith("git@"),
-            url.startswith("git://"),
-            url.startswith("ssh://"),
-            url.startswith("http://") and ".git" in url,
-            url.startswith("https://") and ".git" in url,
-            # Also check for common git hosting services
-            "github.com" in url,
-            "gitlab.com" in url,
-            "bitbucket.org" in url,
-        ]
-        return any(git_patterns)
+        if url.startswith(_GIT_URL_PREFIXES):
+            return True
+        if url.startswith(_HTTP_URL_PREFIXES) and ".git" in url:
+            return True
+
+        # Also check for common git hosting services
+        return any(host in url for host in _GIT_HOSTS)
 
     @classmethod
     def validate_url(cls, url: str) -> bool:
         """Validate that the git URL is accessible.
 
+        Successful results are cached for the rest of the process, so each URL
+        costs at most one ls-remote round trip.
+
         Args:
             url: The git URL to validate
 
         Returns:
             True if the repository is accessible, False otherwise
         """
+        if url in cls._validated_urls:
+            message(f"Git URL already validated: {url}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+            return True
+
         try:
             # Use ls-remote to check if the repository is accessible
             git.cmd.Git().ls_remote(url)
             message(f"Git URL validated: {url}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+            cls._validated_urls.add(url)
             return True
         except git.exc.GitCommandError as e:
             message(f"Cannot access git repository: {e}", MessageType.ERROR, VerbosityLevel.ALWAYS)
@@ -60,25 +89,78 @@ class GitRepo(AbstractRepo):
             message(f"Invalid git URL: {e}", MessageType.ERROR, VerbosityLevel.ALWAYS)
             return False
 
-    def __init__(self, name: str, url: str, repos_dir: Path):
+    def __init__(self, name: str, url: str, repos_dir: Path, shallow: bool = True):
         """Initialize a git repository.
 
         Args:
             name: Name of the hierarchy level
             url: Git repository URL
             repos_dir: Base directory where repos are stored
+            shallow: Clone only the latest commit of the default branch. Only
+                the current files are merged, so history is not needed.
 
         Note: Does not clone or validate the repository.
         Call needs_update() and update() to sync the repository.
         """
         super().__init__(name, url, repos_dir)
         self.local_path = repos_dir / name
+        self.shallow = shallow
+        self._git_repo: git.Repo | None = None
+        self._origin_url: str | None = None
+
+    def _get_git_repo(self) -> git.Repo:
+        """Get the git.Repo for the local clone, opening it only once.
+
+        Returns:
+            The local repository
+
+        Raises:
+            git.exc.InvalidGitRepositoryError: If local_path is not a git repository
+            git.exc.NoSuchPathError: If local_path does not exist
+        """
+        if self._git_repo is None:
+            self._git_repo = git.Repo(self.local_path)
+        return self._git_repo
+
+    def _register_local_clone(self) -> None:
+        """Record this repository as a fresh local clone of its URL."""
+        with self._local_clones_lock:
+            self._local_clones.setdefault(self.url, self.local_path)
+
+    def _get_clone_lock(self) -> threading.Lock:
+        """Get the lock that serializes clones of this repository's URL.
+
+        Returns:
+            Lock shared by all GitRepo instances with the same URL
+        """
+        with self._local_clones_lock:
+            return self._clone_locks.setdefault(self.url, threading.Lock())
+
+    def _get_local_source(self) -> Path | None:
+        """Get a clone of the same URL made in this process to copy instead of the remote.
+
+        Only clones created by update() are considered; they are as fresh as the
+        remote. A shallow clone cannot provide the history a full clone needs.
+
+        Returns:
+            Path to the local clone to copy, or None to clone from the remote
+        """
+        with self._local_clones_lock:
+            source = self._local_clones.get(self.url)
+        if source is None or source == self.local_path or not source.exists():
+            return None
+        if not self.shallow and (source / ".git" / "shallow").exists():
+            return None
+        return source
 
     def needs_update(self) -> bool:
         """Check if the repository needs to be cloned or updated.
 
         Returns:
             True if the repository needs to be cloned or pulled
+
+        Raises:
+            GitRepoError: If the local directory is not a valid git repository
         """
         # If it doesn't exist locally, it needs to be cloned
         if not self.local_path.exists():
@@ -87,69 +169,122 @@ class GitRepo(AbstractRepo):
 
         # Check if it's a valid git repository
         try:
-            repo = git.Repo(self.local_path)
+            repo = self._get_git_repo()
 
             # Verify remote URL matches
-            if repo.remotes.origin.url != self.url:
+            origin_url = self._get_origin_url(repo)
+            if origin_url != self.url:
                 message(
-                    f"Repository '{self.name}' remote URL mismatch. "
-                    f"Expected: {self.url}, "
-                    f"Got: {repo.remotes.origin.url}",
+                    f"Repository '{self.name}' remote URL mismatch. Expected: {self.url}, Got: {origin_url}",
                     MessageType.WARNING,
                     VerbosityLevel.ALWAYS,
                 )
 
-            # Check if there are remote updates available
-            # (Note: This requires a fetch, so we'll just return True
-            # and let update() decide if pull is needed)
+            # Compare the remote tip of the current branch with the local HEAD. ls-remote
+            # only lists refs, which is much cheaper than the fetch a pull would do.
+            remote_sha = self._get_remote_branch_sha(repo)
+            if remote_sha is not None and remote_sha == repo.head.commit.hexsha:
+                message(f"Repository '{self.name}' is up to date", MessageType.DEBUG, VerbosityLevel.DEBUG)
+                return False
+
             message(f"Repository '{self.name}' may have updates", MessageType.DEBUG, VerbosityLevel.DEBUG)
             return True
 
         except (git.exc.InvalidGitRepositoryError, git.exc.GitCommandError) as e:
+            raise GitRepoError(f"Directory exists but is not a valid git repository: {self.local_path} ({e})") from e
+
+    def _get_origin_url(self, repo: git.Repo) -> str:
+        """Get the URL of the origin remote, reading the git config only once.
+
+        Args:
+            repo: Local repository
+
+        Returns:
+            URL configured for the origin remote
+        """
+        if self._origin_url is None:
+            self._origin_url = repo.remotes.origin.url
+        return self._origin_url
+
+    def _get_remote_branch_sha(self, repo: git.Repo) -> str | None:
+        """Get the commit the remote's copy of the current branch points to.
+
+        Args:
+            repo: Local repository
+
+        Returns:
+            Commit SHA, or None if it cannot be determined (detached HEAD,
+            branch missing on the remote, network error, ...)
+        """
+        try:
+            branch = repo.active_branch.name
+            output = repo.git.ls_remote("origin", f"refs/heads/{branch}")
+        except (TypeError, git.exc.GitCommandError) as e:
             message(
-                f"Directory exists but is not a valid git repository: {self.local_path}",
-                MessageType.ERROR,
-                VerbosityLevel.ALWAYS,
+                f"Could not check remote branch for '{self.name}': {e}",
+                MessageType.DEBUG,
+                VerbosityLevel.DEBUG,
             )
-            message(f"Error: {e}", MessageType.ERROR, VerbosityLevel.ALWAYS)
-            sys.exit(1)
+            return None
+
+        # Output format: "<sha>\trefs/heads/<branch>"
+        fields = output.split()
+        return fields[0] if fields else None
 
     def update(self) -> None:
         """Update the git repository.
 
-        If the repository doesn't exist, clones it.
-        If it exists, performs a fetch and pull to get the latest changes.
+        If the repository doesn't exist, clones it (only the latest commit when
+        shallow is enabled).
+        If it exists, pulls the latest changes for the current branch.
+
+        Raises:
+            GitRepoError: If cloning or pulling fails
         """
         # If repository doesn't exist, clone it
         if not self.local_path.exists():
             message(f"Cloning '{self.name}' from {self.url}...", MessageType.INFO, VerbosityLevel.EXTRA_VERBOSE)
-            try:
-                git.Repo.clone_from(self.url, self.local_path)
-                message(f"Successfully cloned '{self.name}'", MessageType.SUCCESS, VerbosityLevel.ALWAYS)
-            except git.exc.GitCommandError as e:
-                message(f"Failed to clone repository '{self.name}': {e}", MessageType.ERROR, VerbosityLevel.ALWAYS)
-                sys.exit(1)
-            except Exception as e:
-                message(
-                    f"Unexpected error cloning repository '{self.name}': {e}", MessageType.ERROR, VerbosityLevel.ALWAYS
-                )
-                sys.exit(1)
+            clone_kwargs = {}
+            if self.shallow:
+                clone_kwargs["depth"] = 1
+
+            # Wait for a clone of the same URL running in another thread, so it
+            # can be copied locally instead of downloading everything again
+            with self._get_clone_lock():
+                source = self._get_local_source()
+                if source is not None:
+                    message(
+                        f"Copying '{self.name}' from existing clone at {source}",
+                        MessageType.DEBUG,
+                        VerbosityLevel.DEBUG,
+                    )
+
+                try:
+                    if source is None:
+                        self._git_repo = git.Repo.clone_from(self.url, self.local_path, **clone_kwargs)
+                    else:
+                        # file:// rather than a plain path, since git ignores --depth for local paths
+                        self._git_repo = git.Repo.clone_from(source.as_uri(), self.local_path, **clone_kwargs)
+                        self._git_repo.remotes.origin.set_url(self.url)
+                    self._origin_url = self.url
+                    self._register_local_clone()
+                    message(f"Successfully cloned '{self.name}'", MessageType.SUCCESS, VerbosityLevel.ALWAYS)
+                except git.exc.GitCommandError as e:
+                    raise GitRepoError(f"Failed to clone {self.url}: {e}") from e
+                except Exception as e:
+                    raise GitRepoError(f"Unexpected error cloning {self.url}: {e}") from e
             return
 
         # Repository exists, update it
         message(f"Updating '{self.name}'...", MessageType.INFO, VerbosityLevel.EXTRA_VERBOSE)
 
         try:
-            repo = git.Repo(self.local_path)
-
-            # Fetch latest changes
-            message(f"Fetching changes for '{self.name}'...", MessageType.DEBUG, VerbosityLevel.DEBUG)
-            repo.remotes.origin.fetch()
+            repo = self._get_git_repo()
 
             # Get current branch
             current_branch = repo.active_branch.name
 
-            # Pull changes
+            # Pull changes (pull fetches itself, so no separate fetch round trip)
             message(
                 f"Pulling changes for '{self.name}' (branch: {current_branch})...",
                 MessageType.DEBUG,
@@ -159,18 +294,9 @@ class GitRepo(AbstractRepo):
 
             message(f"Successfully updated '{self.name}'", MessageType.SUCCESS, VerbosityLevel.ALWAYS)
 
-        except git.exc.InvalidGitRepositoryError:
-            message(
-                f"'{self.name}' at {self.local_path} is not a valid git repository",
-                MessageType.ERROR,
-                VerbosityLevel.ALWAYS,
-            )
-            sys.exit(1)
+        except git.exc.InvalidGitRepositoryError as e:
+            raise GitRepoError(f"{self.local_path} is not a valid git repository") from e
         except git.exc.GitCommandError as e:
-            message(f"Failed to update repository '{self.name}': {e}", MessageType.ERROR, VerbosityLevel.ALWAYS)
-            sys.exit(1)
+            raise GitRepoError(f"Failed to pull changes: {e}") from e
         except Exception as e:
-            message(
-                f"Unexpected error updating repository '{self.name}': {e}", MessageType.ERROR, VerbosityLevel.ALWAYS
-            )
-            sys.exit(1)
+            raise GitRepoError(f"Unexpected error pulling changes: {e}") from e
@@ -8,15 +8,21 @@ from .discovery import (
     load_plugin_class,
     set_plugin_enabled,
 )
+from .files import atomic_write_text, fast_read_text, fast_write_text, output_unchanged, read_files
 from .url import is_file_url, resolve_file_path
 
 __all__ = [
+    "atomic_write_text",
     "discover_external_plugins",
+    "fast_read_text",
+    "fast_write_text",
     "filter_disabled_plugins",
     "get_disabled_plugins",
     "is_file_url",
     "is_plugin_disabled",
     "load_plugin_class",
+    "output_unchanged",
+    "read_files",
     "resolve_file_path",
     "set_plugin_enabled",
 ]
@@ -1,13 +1,37 @@
 """Generic plugin discovery utilities for agent-manager."""
 
+import hashlib
 import importlib
 import importlib.metadata
+import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from agent_manager.output import MessageType, VerbosityLevel, message
+from agent_manager.utils.files import atomic_write_text
+
+# Use the libyaml bindings when PyYAML was built with them; they parse and emit
+# an order of magnitude faster than the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+# Config path -> (mtime_ns, size, disabled plugins) from the last successful
+# parse, so repeated lookups skip reading the file until it changes
+_disabled_cache: dict[Path, tuple[int, int, dict[str, list[str]]]] = {}
+
+# Entry points of all installed distributions, persisted between runs since
+# reading every distribution's entry_points.txt dominates cold discovery.
+# None means the default location under the user's cache directory.
+ENTRY_POINT_CACHE_FILE: Path | None = None
 
 # =============================================================================
 # Plugin Enable/Disable Utilities
@@ -33,12 +57,19 @@ def get_disabled_plugins(config_file: Path | None = None) -> dict[str, list[str]
 
     result = {"mergers": [], "agents": [], "repos": []}
 
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except OSError:
         return result
 
+    cached = _disabled_cache.get(config_file)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        # Hand out copies so callers cannot modify the cached lists
+        return {plugin_type: list(names) for plugin_type, names in cached[2].items()}
+
     try:
         with open(config_file) as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=_SafeLoader) or {}
 
         plugins_config = config.get("plugins", {})
         disabled = plugins_config.get("disabled", {})
@@ -46,6 +77,12 @@ def get_disabled_plugins(config_file: Path | None = None) -> dict[str, list[str]
         for plugin_type in result:
             result[plugin_type] = disabled.get(plugin_type, [])
 
+        _disabled_cache[config_file] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            {plugin_type: list(names) for plugin_type, names in result.items()},
+        )
+
     except Exception as e:
         message(f"Failed to read disabled plugins from config: {e}", MessageType.DEBUG, VerbosityLevel.DEBUG)
 
@@ -91,7 +128,7 @@ def set_plugin_enabled(
         # Read existing config
         if config_file.exists():
             with open(config_file) as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=_SafeLoader) or {}
         else:
             config = {}
 
@@ -112,6 +149,7 @@ def set_plugin_enabled(
                 message(f"Enabled {plugin_type[:-1]} plugin: {plugin_name}", MessageType.SUCCESS, VerbosityLevel.ALWAYS)
             else:
                 message(f"Plugin '{plugin_name}' is already enabled", MessageType.INFO, VerbosityLevel.ALWAYS)
+                return True
         else:
             # Add to disabled list
             if plugin_name not in disabled_list:
@@ -121,6 +159,7 @@ def set_plugin_enabled(
                 )
             else:
                 message(f"Plugin '{plugin_name}' is already disabled", MessageType.INFO, VerbosityLevel.ALWAYS)
+                return True
 
         # Clean up empty lists
         if not disabled_list:
@@ -131,8 +170,8 @@ def set_plugin_enabled(
             del config["plugins"]
 
         # Write back to config
-        with open(config_file, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        atomic_write_text(config_file, yaml.dump(config, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False))
+        _disabled_cache.pop(config_file, None)
 
         return True
 
@@ -156,12 +195,14 @@ def filter_disabled_plugins(
     Returns:
         Filtered dictionary with disabled plugins removed
     """
-    disabled = get_disabled_plugins(config_file)
-    disabled_names = disabled.get(plugin_type, [])
+    disabled_names = frozenset(get_disabled_plugins(config_file).get(plugin_type, []))
+    skipped = plugins.keys() & disabled_names
+    if not skipped:
+        return dict(plugins)
 
     filtered = {}
     for name, info in plugins.items():
-        if name in disabled_names:
+        if name in skipped:
             message(f"Skipping disabled {plugin_type[:-1]}: {name}", MessageType.DEBUG, VerbosityLevel.DEBUG)
         else:
             filtered[name] = info
@@ -244,7 +285,7 @@ def _discover_by_package_prefix(
     plugins = {}
 
     try:
-        for dist in importlib.metadata.distributions():
+        for dist in _installed_distributions(tuple(sys.path)):
             # Normalize package name (hyphens to underscores)
             package_name = dist.name.replace("-", "_")
 
@@ -273,6 +314,122 @@ def _discover_by_package_prefix(
     return plugins
 
 
+@lru_cache(maxsize=1)
+def _installed_distributions(search_path: tuple[str, ...]) -> tuple[importlib.metadata.Distribution, ...]:
+    """Scan the search path for installed distributions once.
+
+    Every plugin type scans the same distributions, so the result is kept
+    until sys.path changes.
+
+    Args:
+        search_path: Directories to scan, normally tuple(sys.path)
+
+    Returns:
+        All distributions found on the search path
+    """
+    return tuple(importlib.metadata.distributions(path=list(search_path)))
+
+
+@lru_cache(maxsize=1)
+def _installed_entry_points(search_path: tuple[str, ...]) -> importlib.metadata.EntryPoints:
+    """Collect the entry points of all installed distributions once.
+
+    Args:
+        search_path: sys.path at the time of the call. Only used as the cache
+            key so the scan is repeated when the path changes.
+
+    Returns:
+        Entry points of every installed distribution
+    """
+    fingerprint = _search_path_fingerprint(search_path)
+
+    entry_points = _read_entry_point_cache(fingerprint)
+    if entry_points is None:
+        entry_points = importlib.metadata.entry_points()
+        _write_entry_point_cache(fingerprint, entry_points)
+
+    return entry_points
+
+
+def _search_path_fingerprint(search_path: tuple[str, ...]) -> str:
+    """Fingerprint the interpreter and the directories distributions are found in.
+
+    Installing, upgrading or removing a package adds or removes a *.dist-info
+    directory, which changes the modification time of its parent directory.
+    Only the top-level search path directories are checked, so editing an
+    installed distribution's entry_points.txt in place (for example in an
+    editable install) is not noticed; reinstall the package or delete the
+    entry point cache file to pick up such a change.
+
+    Args:
+        search_path: Directories distributions are found in
+
+    Returns:
+        Hex digest identifying the current set of installed distributions
+    """
+    digest = hashlib.blake2b(sys.version.encode(), digest_size=16)
+    for entry in search_path:
+        try:
+            mtime_ns = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        digest.update(f"\0{entry}\0{mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _entry_point_cache_file() -> Path:
+    """Get the file entry points are persisted in.
+
+    Returns:
+        ENTRY_POINT_CACHE_FILE if set, otherwise entry_points.json under
+        $XDG_CACHE_HOME/agent-manager (~/.cache/agent-manager by default)
+    """
+    if ENTRY_POINT_CACHE_FILE is not None:
+        return ENTRY_POINT_CACHE_FILE
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "agent-manager" / "entry_points.json"
+
+
+def _read_entry_point_cache(fingerprint: str) -> importlib.metadata.EntryPoints | None:
+    """Load entry points persisted by a previous run.
+
+    Args:
+        fingerprint: Fingerprint of the current search path
+
+    Returns:
+        Cached entry points, or None if there is no usable cache for this fingerprint
+    """
+    try:
+        data = json.loads(_entry_point_cache_file().read_text())
+        if data["fingerprint"] != fingerprint:
+            return None
+        return importlib.metadata.EntryPoints(
+            importlib.metadata.EntryPoint(name, value, group) for name, value, group in data["entry_points"]
+        )
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        message(f"Entry point cache not used: {e}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+        return None
+
+
+def _write_entry_point_cache(fingerprint: str, entry_points: importlib.metadata.EntryPoints) -> None:
+    """Persist entry points for the next run.
+
+    Only names, values and groups are stored; plugin classes are still
+    imported and validated through EntryPoint.load() on every run.
+
+    Args:
+        fingerprint: Fingerprint of the current search path
+        entry_points: Entry points to store
+    """
+    try:
+        records = [[ep.name, ep.value, ep.group] for ep in entry_points]
+        cache_file = _entry_point_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(cache_file, json.dumps({"fingerprint": fingerprint, "entry_points": records}))
+    except OSError as e:
+        message(f"Failed to write entry point cache: {e}", MessageType.DEBUG, VerbosityLevel.DEBUG)
+
+
 def _discover_by_entry_points(
     plugin_type: str,
     entry_point_group: str,
@@ -291,7 +448,7 @@ def _discover_by_entry_points(
     plugins = {}
 
     try:
-        entry_points = importlib.metadata.entry_points()
+        entry_points = _installed_entry_points(tuple(sys.path))
 
         # Get entry points for the specified group
         # Python 3.10+ uses select(), older versions use get()
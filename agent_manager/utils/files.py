@@ -0,0 +1,201 @@
+"""File reading and writing utilities for agent-manager."""
+
+import contextlib
+import os
+import secrets
+import stat
+from pathlib import Path
+
+# Permissions requested for a file that does not exist yet; the umask is
+# applied on top, exactly as for Path.write_text()
+DEFAULT_FILE_MODE = 0o666
+
+# Below this many files, reading serially is cheaper than starting threads
+_PARALLEL_READ_THRESHOLD = 4
+_MAX_READ_WORKERS = 8
+
+# Attempts at finding an unused temporary file name before giving up
+_TEMP_NAME_ATTEMPTS = 100
+
+
+def _create_temp_file(path: Path) -> tuple[int, Path]:
+    """Create and open a new temporary file next to a target path.
+
+    Unlike tempfile.mkstemp(), which always uses mode 0o600, the file is
+    created with DEFAULT_FILE_MODE so the umask decides its permissions.
+
+    Args:
+        path: Target file the temporary file will replace
+
+    Returns:
+        Tuple of the open file descriptor and the temporary file path
+
+    Raises:
+        OSError: If no temporary file could be created
+    """
+    for _ in range(_TEMP_NAME_ATTEMPTS):
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, DEFAULT_FILE_MODE), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"Could not find an unused temporary file name for {path}")
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write text to a file atomically.
+
+    The content is written to a temporary file in the same directory, synced
+    to disk, and then renamed over the target with os.replace(). Readers
+    therefore see either the old file or the complete new one, never a
+    truncated file left behind by a crash mid-write.
+
+    Symlinks are followed, so a linked file (e.g. a config.yaml managed in a
+    dotfiles repository) is updated in place of the link. An existing file
+    keeps its permissions; a new one gets DEFAULT_FILE_MODE minus the umask.
+
+    Args:
+        path: Destination file path
+        content: Text to write
+
+    Raises:
+        OSError: If the temporary file cannot be created, written, or renamed
+    """
+    path = path.resolve()
+
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def fast_read_text(file_path: Path) -> str:
+    """Read a small text file with raw os-level calls.
+
+    Skips the buffered TextIOWrapper that Path.read_text() sets up. The
+    content is decoded as UTF-8 first; only if that fails is the file read
+    again with Path.read_text() in the locale encoding. Unlike read_text(),
+    valid UTF-8 is therefore never decoded with a different locale encoding.
+    Newlines are translated as in text-mode open().
+
+    Args:
+        file_path: File to read
+
+    Returns:
+        File content
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        chunk_size = max(os.fstat(fd).st_size, 1) + 1
+        chunks = []
+        while chunk := os.read(fd, chunk_size):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    try:
+        text = b"".join(chunks).decode("utf-8")
+    except UnicodeDecodeError:
+        return file_path.read_text()
+
+    # Universal newlines, as in text-mode open()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def fast_write_text(file_path: Path, content: str) -> None:
+    """Write text to a file with raw os-level calls.
+
+    Skips the buffered TextIOWrapper that Path.write_text() sets up. Unlike
+    write_text(), the content is always encoded as UTF-8 regardless of the
+    locale, and "\\n" is written as-is rather than translated to os.linesep.
+    The file is created with DEFAULT_FILE_MODE (subject to the umask), as
+    write_text() would, or truncated if it exists.
+
+    Args:
+        file_path: File to write
+        content: Text to write
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, DEFAULT_FILE_MODE)
+    try:
+        # os.write() may write fewer bytes than requested
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def output_unchanged(output_path: Path, content: str) -> bool:
+    """Check whether an output file already holds exactly the given content.
+
+    The content is compared as fast_write_text() would write it: UTF-8 with
+    untranslated newlines. The file size is compared first so most changed
+    files are detected without reading them.
+
+    Args:
+        output_path: Existing or new output file
+        content: Content that would be written
+
+    Returns:
+        True if the file exists with identical content, False otherwise
+    """
+    try:
+        if output_path.stat().st_size != len(content.encode("utf-8")):
+            return False
+        return fast_read_text(output_path) == content
+    except (OSError, UnicodeError):
+        return False
+
+
+def _read_text_or_error(file_path: Path) -> str | Exception:
+    """Read a file, returning the exception instead of raising it.
+
+    Args:
+        file_path: File to read
+
+    Returns:
+        File content, or the exception raised while reading it
+    """
+    try:
+        return fast_read_text(file_path)
+    except Exception as e:
+        return e
+
+
+def read_files(files: list[Path]) -> list[str | Exception]:
+    """Read files concurrently, preserving their order.
+
+    File reads release the GIL, so a small thread pool overlaps the I/O of many
+    small config files. Short lists are read serially.
+
+    Args:
+        files: Files to read
+
+    Returns:
+        Content (or read error) for each file, in the same order as files
+    """
+    if len(files) < _PARALLEL_READ_THRESHOLD:
+        return [_read_text_or_error(file_path) for file_path in files]
+
+    # Imported here: concurrent.futures pulls in logging, which commands that
+    # only inspect agents (e.g. listing scopes) never need
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(files))) as executor:
+        return list(executor.map(_read_text_or_error, files))
@@ -1,7 +1,11 @@
 """File URL utilities for agent-manager."""
 
+from functools import lru_cache
 from pathlib import Path
 
+# Prefixes of file:// URLs and plain filesystem paths
+_FILE_URL_PREFIXES = ("file://", "/", "~", "./", "../")
+
 
 def is_file_url(url: str) -> bool:
     """Check if a URL is a file:// URL or a plain filesystem path.
@@ -16,24 +20,12 @@ def is_file_url(url: str) -> bool:
     if url != url.strip():
         return False
 
-    # Explicit file:// protocol
-    if url.startswith("file://"):
-        return True
-
-    # Plain absolute path (Unix-style)
-    if url.startswith("/"):
-        return True
-
-    # Home directory path
-    if url.startswith("~"):
-        return True
-
-    # Relative paths
-    if url.startswith("./") or url.startswith("../"):
+    # file:// protocol, absolute, home-relative, or relative path
+    if url.startswith(_FILE_URL_PREFIXES):
         return True
 
     # Current or parent directory
-    return bool(url == "." or url == "..")
+    return url in (".", "..")
 
 
 def resolve_file_path(url: str) -> Path:
@@ -46,4 +38,17 @@ def resolve_file_path(url: str) -> Path:
         Resolved absolute Path
     """
     path_str = url[7:] if url.startswith("file://") else url
+
+    # Home-relative paths reuse the cached resolved home directory
+    if path_str == "~":
+        return _home_resolved()
+    if path_str.startswith("~/"):
+        return (_home_resolved() / path_str[2:]).resolve()
+
     return Path(path_str).expanduser().resolve()
+
+
+@lru_cache(maxsize=1)
+def _home_resolved() -> Path:
+    """Return the user's home directory, resolved once per process."""
+    return Path.home().resolve()
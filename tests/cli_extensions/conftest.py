@@ -0,0 +1,97 @@
+"""Shared fixtures for cli_extensions tests.
+
+agent_commands is imported inside the fixtures so that collecting the other
+cli_extensions test modules does not pull it in.
+"""
+
+import argparse
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+
+def _build_subparser_tree(*names):
+    """Build spec'd Mock subparsers that hand out a dedicated parser Mock per command name.
+
+    The returned dict maps "subparsers" to the top-level Mock, each name to its
+    parser Mock, and "<name>_sub" to that parser's own subparsers Mock.
+    """
+    subparsers = MagicMock(spec_set=argparse._SubParsersAction)
+    tree = {"subparsers": subparsers}
+    for name in names:
+        parser = MagicMock(spec_set=argparse.ArgumentParser)
+        parser.add_subparsers.return_value = MagicMock(spec_set=argparse._SubParsersAction)
+        tree[name] = parser
+        tree[f"{name}_sub"] = parser.add_subparsers.return_value
+
+    parsers = {name: tree[name] for name in names}
+    subparsers.add_parser.side_effect = lambda name, **kwargs: parsers.get(
+        name, MagicMock(spec_set=argparse.ArgumentParser)
+    )
+    return tree
+
+
+@pytest.fixture(scope="session")
+def subparser_tree():
+    """Provide the factory for spec'd argparse Mock trees."""
+    return _build_subparser_tree
+
+
+@pytest.fixture(scope="session")
+def cli_parser():
+    """Build one real argparse parser with the config and repo commands for the session.
+
+    parse_args does not modify the parser, so every test can share it.
+    """
+    from agent_manager.cli_extensions.config_commands import ConfigCommands
+    from agent_manager.cli_extensions.repo_commands import RepoCommands
+
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+    ConfigCommands.add_cli_arguments(subparsers)
+    RepoCommands.add_cli_arguments(subparsers)
+    return parser
+
+
+@pytest.fixture(scope="session", params=[["claude"], ["claude", "custom"], []], ids=["one", "two", "none"])
+def built_parsers(request):
+    """Run AgentCommands.add_cli_arguments once per agent list and keep the recorded calls.
+
+    Tests must only read the recorded call lists; the Mocks are shared across the session.
+    """
+    from agent_manager.cli_extensions import agent_commands as ac
+
+    scaffold = _build_subparser_tree("agents", "run")
+    with patch.object(ac, "get_agent_names", return_value=request.param):
+        ac.AgentCommands.add_cli_arguments(scaffold["subparsers"])
+    return {"agent_names": request.param, **scaffold}
+
+
+@pytest.fixture(scope="session")
+def _plugin_state_mocks():
+    """Create the discover_agent_plugins/get_disabled_plugins Mocks once per session."""
+    return Mock(return_value={}), Mock(return_value={"agents": []})
+
+
+@pytest.fixture
+def discover_mock(_plugin_state_mocks, monkeypatch):
+    """Patch discover_agent_plugins with the shared Mock; no plugins unless a test sets return_value."""
+    from agent_manager.cli_extensions import agent_commands as ac
+
+    mock = _plugin_state_mocks[0]
+    monkeypatch.setattr(ac, "discover_agent_plugins", mock)
+    yield mock
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.return_value = {}
+
+
+@pytest.fixture
+def disabled_mock(_plugin_state_mocks, monkeypatch):
+    """Patch get_disabled_plugins with the shared Mock; nothing disabled unless a test sets return_value."""
+    from agent_manager.cli_extensions import agent_commands as ac
+
+    mock = _plugin_state_mocks[1]
+    monkeypatch.setattr(ac, "get_disabled_plugins", mock)
+    yield mock
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.return_value = {"agents": []}
@@ -1,82 +1,45 @@
 """Tests for cli_extensions/agent_commands.py - Agent CLI commands."""
 
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
+import pytest
+
+from agent_manager.cli_extensions import agent_commands as ac
 from agent_manager.cli_extensions.agent_commands import AgentCommands
 
+# Keep the CLI tests on one xdist worker so the session fixtures are built once
+pytestmark = pytest.mark.xdist_group("cli_extensions")
+
+# Read-only config shared by the process_cli_command tests
+EMPTY_CONFIG = MappingProxyType({"hierarchy": ()})
+
 
 class TestAgentCommandsAddCliArguments:
     """Test cases for add_cli_arguments method."""
 
-    @patch("agent_manager.cli_extensions.agent_commands.get_agent_names")
-    def test_adds_agents_and_run_parsers(self, mock_get_agent_names):
+    @pytest.mark.slow
+    def test_adds_agents_and_run_parsers(self, built_parsers):
         """Test that add_cli_arguments adds both agents and run parsers."""
-        mock_get_agent_names.return_value = ["claude"]
-
-        mock_subparsers = Mock()
-        mock_parser = Mock()
-        mock_agents_subparsers = Mock()
-        mock_parser.add_subparsers.return_value = mock_agents_subparsers
-        mock_subparsers.add_parser.return_value = mock_parser
-
-        AgentCommands.add_cli_arguments(mock_subparsers)
-
         # Should add both "agents" and "run" parsers
-        calls = [call[0][0] for call in mock_subparsers.add_parser.call_args_list]
+        calls = [call[0][0] for call in built_parsers["subparsers"].add_parser.call_args_list]
         assert "agents" in calls
         assert "run" in calls
 
-    @patch("agent_manager.cli_extensions.agent_commands.get_agent_names")
-    def test_adds_agents_list_subcommand(self, mock_get_agent_names):
+    @pytest.mark.slow
+    def test_adds_agents_list_subcommand(self, built_parsers):
         """Test that add_cli_arguments adds list, enable, and disable subcommands to agents."""
-        mock_get_agent_names.return_value = ["claude"]
-
-        mock_subparsers = Mock()
-        mock_agents_parser = Mock()
-        mock_agents_subparsers = Mock()
-        mock_run_parser = Mock()
-
-        def add_parser_side_effect(name, **kwargs):
-            if name == "agents":
-                return mock_agents_parser
-            elif name == "run":
-                return mock_run_parser
-            return Mock()
-
-        mock_subparsers.add_parser.side_effect = add_parser_side_effect
-        mock_agents_parser.add_subparsers.return_value = mock_agents_subparsers
-
-        AgentCommands.add_cli_arguments(mock_subparsers)
-
         # Check that all three subcommands were added to agents
-        calls = [call[0][0] for call in mock_agents_subparsers.add_parser.call_args_list]
+        calls = [call[0][0] for call in built_parsers["agents_sub"].add_parser.call_args_list]
         assert "list" in calls
         assert "enable" in calls
         assert "disable" in calls
 
-    @patch("agent_manager.cli_extensions.agent_commands.get_agent_names")
-    def test_adds_agent_argument_with_choices(self, mock_get_agent_names):
-        """Test that agent argument includes discovered plugins."""
-        mock_get_agent_names.return_value = ["claude", "custom"]
-
-        mock_subparsers = Mock()
-        mock_agents_parser = Mock()
-        mock_run_parser = Mock()
-        mock_agents_parser.add_subparsers.return_value = Mock()
-
-        def add_parser_side_effect(name, **kwargs):
-            if name == "agents":
-                return mock_agents_parser
-            elif name == "run":
-                return mock_run_parser
-            return Mock()
-
-        mock_subparsers.add_parser.side_effect = add_parser_side_effect
-
-        AgentCommands.add_cli_arguments(mock_subparsers)
-
+    @pytest.mark.slow
+    def test_adds_agent_argument_with_choices(self, built_parsers):
+        """Test that agent argument offers "all" plus every discovered plugin."""
         # Check that add_argument was called on run parser with choices including discovered agents
-        call_args = mock_run_parser.add_argument.call_args_list
+        call_args = built_parsers["run"].add_argument.call_args_list
         # Find the --agent argument
         agent_arg = None
         for call in call_args:
@@ -84,112 +47,86 @@ class TestAgentCommandsAddCliArguments:
                 agent_arg = call
                 break
         assert agent_arg is not None
-        assert agent_arg[1]["choices"] == ["all", "claude", "custom"]
-
-    @patch("agent_manager.cli_extensions.agent_commands.get_agent_names")
-    def test_adds_agent_argument_with_no_plugins(self, mock_get_agent_names):
-        """Test that agent argument works with no plugins."""
-        mock_get_agent_names.return_value = []
+        assert agent_arg[1]["choices"] == ["all", *built_parsers["agent_names"]]
 
-        mock_subparsers = Mock()
-        mock_agents_parser = Mock()
-        mock_run_parser = Mock()
-        mock_agents_parser.add_subparsers.return_value = Mock()
-
-        def add_parser_side_effect(name, **kwargs):
-            if name == "agents":
-                return mock_agents_parser
-            elif name == "run":
-                return mock_run_parser
-            return Mock()
-
-        mock_subparsers.add_parser.side_effect = add_parser_side_effect
-
-        AgentCommands.add_cli_arguments(mock_subparsers)
-
-        # Should still add argument with just "all"
-        call_args = mock_run_parser.add_argument.call_args_list
-        # Find the --agent argument
-        agent_arg = None
-        for call in call_args:
-            if len(call[0]) > 0 and call[0][0] == "--agent":
-                agent_arg = call
-                break
-        assert agent_arg is not None
-        assert agent_arg[1]["choices"] == ["all"]
+    @pytest.mark.slow
+    def test_adds_scope_argument(self, built_parsers):
+        """Test that the run parser accepts a --scope defaulting to "default"."""
+        scope_args = [call for call in built_parsers["run"].add_argument.call_args_list if call[0][0] == "--scope"]
+        assert len(scope_args) == 1
+        assert scope_args[0][1]["default"] == "default"
 
 
 class TestAgentCommandsProcessCliCommand:
     """Test cases for process_cli_command method."""
 
-    @patch("agent_manager.cli_extensions.agent_commands.run_agents")
-    def test_processes_run_command_single_agent(self, mock_run_agents):
+    def test_processes_run_command_single_agent(self, monkeypatch):
         """Test processing run command for single agent."""
-        args = Mock()
-        args.agent = "claude"
-        args.scope = "default"
-        config_data = {"hierarchy": []}
+        args = SimpleNamespace(agent="claude", scope="default")
+        mock_run_agents = Mock()
+        monkeypatch.setattr(ac, "run_agents", mock_run_agents)
 
-        AgentCommands.process_cli_command(args, config_data)
+        AgentCommands.process_cli_command(args, EMPTY_CONFIG)
 
-        mock_run_agents.assert_called_once_with(["claude"], config_data, scope="default")
+        mock_run_agents.assert_called_once_with(["claude"], EMPTY_CONFIG, scope="default")
 
-    @patch("agent_manager.cli_extensions.agent_commands.run_agents")
-    def test_processes_run_command_all_agents(self, mock_run_agents):
+    def test_processes_run_command_all_agents(self, monkeypatch):
         """Test processing run command for all agents."""
-        args = Mock()
-        args.agent = "all"
-        args.scope = "default"
-        config_data = {"hierarchy": []}
+        args = SimpleNamespace(agent="all", scope="default")
+        mock_run_agents = Mock()
+        monkeypatch.setattr(ac, "run_agents", mock_run_agents)
 
-        AgentCommands.process_cli_command(args, config_data)
+        AgentCommands.process_cli_command(args, EMPTY_CONFIG)
 
-        mock_run_agents.assert_called_once_with(["all"], config_data, scope="default")
+        mock_run_agents.assert_called_once_with(["all"], EMPTY_CONFIG, scope="default")
+
+    def test_missing_scope_defaults_to_default(self, monkeypatch):
+        """Test that args without a scope attribute run with the default scope."""
+        args = SimpleNamespace(agent="claude")
+        mock_run_agents = Mock()
+        monkeypatch.setattr(ac, "run_agents", mock_run_agents)
+
+        AgentCommands.process_cli_command(args, EMPTY_CONFIG)
+
+        mock_run_agents.assert_called_once_with(["claude"], EMPTY_CONFIG, scope="default")
 
 
 class TestAgentCommandsProcessAgentsCommand:
     """Test cases for process_agents_command method."""
 
-    def test_no_subcommand_specified(self):
+    def test_no_subcommand_specified(self, monkeypatch):
         """Test that no subcommand shows friendly usage message."""
-        args = Mock()
-        args.agents_command = None
+        args = SimpleNamespace(agents_command=None)
 
-        messages = []
+        mock_message = Mock()
+        monkeypatch.setattr(ac, "message", mock_message)
 
-        def capture_message(text, *args_inner, **kwargs):
-            messages.append(text)
-
-        with patch("agent_manager.cli_extensions.agent_commands.message", side_effect=capture_message):
-            AgentCommands.process_agents_command(args)
+        AgentCommands.process_agents_command(args)
 
-        output = "\n".join(messages)
+        output = "\n".join(c.args[0] for c in mock_message.call_args_list)
         assert "Usage: agent-manager agents <command>" in output
         assert "Available commands:" in output
         assert "list" in output
         assert "enable" in output
         assert "disable" in output
 
-    def test_no_agents_command_attribute(self):
+    def test_no_agents_command_attribute(self, monkeypatch):
         """Test that missing agents_command attribute shows friendly usage."""
         args = Mock(spec=[])  # Mock with no attributes
 
-        messages = []
+        mock_message = Mock()
+        monkeypatch.setattr(ac, "message", mock_message)
 
-        def capture_message(text, *args_inner, **kwargs):
-            messages.append(text)
-
-        with patch("agent_manager.cli_extensions.agent_commands.message", side_effect=capture_message):
-            AgentCommands.process_agents_command(args)
+        AgentCommands.process_agents_command(args)
 
-        output = "\n".join(messages)
+        output = "\n".join(c.args[0] for c in mock_message.call_args_list)
         assert "Usage: agent-manager agents <command>" in output
 
-    @patch("agent_manager.cli_extensions.agent_commands.AgentCommands.list_agents")
-    def test_processes_list_command(self, mock_list_agents):
+    def test_processes_list_command(self, monkeypatch):
         """Test that list command calls list_agents."""
-        args = Mock()
-        args.agents_command = "list"
+        mock_list_agents = Mock()
+        monkeypatch.setattr(AgentCommands, "list_agents", mock_list_agents)
+        args = SimpleNamespace(agents_command="list")
 
         AgentCommands.process_agents_command(args)
 
@@ -199,72 +136,55 @@ class TestAgentCommandsProcessAgentsCommand:
 class TestAgentCommandsListAgents:
     """Test cases for list_agents method."""
 
-    @patch("agent_manager.cli_extensions.agent_commands.get_disabled_plugins")
-    @patch("agent_manager.cli_extensions.agent_commands.discover_agent_plugins")
-    def test_list_agents_with_plugins(self, mock_discover, mock_get_disabled):
+    def test_list_agents_with_plugins(self, monkeypatch, discover_mock, disabled_mock):
         """Test listing agents when plugins are available."""
-        mock_discover.return_value = {
+        plugins = {
             "claude": {"package_name": "am_agent_claude", "source": "package"},
             "custom": {"package_name": "am_agent_custom", "source": "package"},
         }
-        mock_get_disabled.return_value = {"agents": []}
-
-        messages = []
+        discover_mock.return_value = plugins
 
-        def capture_message(text, *args, **kwargs):
-            messages.append(text)
+        mock_message = Mock()
+        monkeypatch.setattr(ac, "message", mock_message)
 
-        with patch("agent_manager.cli_extensions.agent_commands.message", side_effect=capture_message):
-            AgentCommands.list_agents()
+        AgentCommands.list_agents()
 
         # Check that agents are listed
-        output = "\n".join(messages)
+        output = "\n".join(c.args[0] for c in mock_message.call_args_list)
         assert "claude" in output
         assert "am_agent_claude" in output
         assert "custom" in output
         assert "am_agent_custom" in output
         assert "Total: 2 enabled, 0 disabled" in output
 
-    @patch("agent_manager.cli_extensions.agent_commands.get_disabled_plugins")
-    @patch("agent_manager.cli_extensions.agent_commands.discover_agent_plugins")
-    def test_list_agents_no_plugins(self, mock_discover, mock_get_disabled):
+    def test_list_agents_no_plugins(self, monkeypatch, discover_mock, disabled_mock):
         """Test listing agents when no plugins are available."""
-        mock_discover.return_value = {}
-        mock_get_disabled.return_value = {"agents": []}
-
-        messages = []
-
-        def capture_message(text, *args, **kwargs):
-            messages.append(text)
+        mock_message = Mock()
+        monkeypatch.setattr(ac, "message", mock_message)
 
-        with patch("agent_manager.cli_extensions.agent_commands.message", side_effect=capture_message):
-            AgentCommands.list_agents()
+        AgentCommands.list_agents()
 
         # Check that appropriate message is shown
-        output = "\n".join(messages)
+        output = "\n".join(c.args[0] for c in mock_message.call_args_list)
         assert "No agent plugins found" in output
         assert "am_agent_" in output  # Should mention the plugin naming convention
 
-    @patch("agent_manager.cli_extensions.agent_commands.get_disabled_plugins")
-    @patch("agent_manager.cli_extensions.agent_commands.discover_agent_plugins")
-    def test_list_agents_sorted(self, mock_discover, mock_get_disabled):
+    def test_list_agents_sorted(self, monkeypatch, discover_mock, disabled_mock):
         """Test that agents are listed in sorted order."""
-        mock_discover.return_value = {
+        plugins = {
             "zebra": {"package_name": "am_agent_zebra", "source": "package"},
             "alpha": {"package_name": "am_agent_alpha", "source": "package"},
             "middle": {"package_name": "am_agent_middle", "source": "package"},
         }
-        mock_get_disabled.return_value = {"agents": []}
+        discover_mock.return_value = plugins
 
-        messages = []
+        mock_message = Mock()
+        monkeypatch.setattr(ac, "message", mock_message)
 
-        def capture_message(text, *args, **kwargs):
-            messages.append(text)
-
-        with patch("agent_manager.cli_extensions.agent_commands.message", side_effect=capture_message):
-            AgentCommands.list_agents()
+        AgentCommands.list_agents()
 
         # Find lines that contain agent names
+        messages = [c.args[0] for c in mock_message.call_args_list]
         agent_lines = [m for m in messages if "am_agent_" in m and "(" in m]
 
         # Should be in alphabetical order
@@ -272,3 +192,20 @@ class TestAgentCommandsListAgents:
         assert "alpha" in agent_lines[0]
         assert "middle" in agent_lines[1]
         assert "zebra" in agent_lines[2]
+
+    def test_list_agents_shows_disabled(self, monkeypatch, discover_mock, disabled_mock):
+        """Test that disabled agents are listed separately and counted."""
+        discover_mock.return_value = {"claude": {"package_name": "am_agent_claude", "source": "package"}}
+        disabled_mock.return_value = {"agents": ["custom"]}
+
+        mock_message = Mock()
+        monkeypatch.setattr(ac, "message", mock_message)
+
+        AgentCommands.list_agents()
+
+        output = "\n".join(c.args[0] for c in mock_message.call_args_list)
+        assert "Disabled agents:" in output
+        assert "custom (disabled)" in output
+        assert "Total: 1 enabled, 1 disabled" in output
+        discover_mock.assert_called_once_with()
+        disabled_mock.assert_called_once_with()
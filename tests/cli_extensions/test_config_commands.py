@@ -1,13 +1,87 @@
 """Tests for cli_extensions/config_commands.py - Config CLI commands."""
 
-from unittest.mock import Mock, patch
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 import yaml
 
+from agent_manager.cli_extensions import config_commands
 from agent_manager.cli_extensions.config_commands import ConfigCommands
 from agent_manager.config.config import Config
 
+# Keep the CLI tests on one xdist worker so the session fixtures are built once
+pytestmark = pytest.mark.xdist_group("cli_extensions")
+
+# Read-only hierarchies shared by the display and validate_all tests
+ORG_AND_TEAM_CONFIG = MappingProxyType(
+    {
+        "hierarchy": (
+            MappingProxyType({"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}),
+            MappingProxyType({"name": "team", "url": "file:///tmp/team", "repo_type": "file"}),
+        )
+    }
+)
+ORG_AND_BAD_CONFIG = MappingProxyType(
+    {
+        "hierarchy": (
+            MappingProxyType({"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}),
+            MappingProxyType({"name": "bad", "url": "invalid://url", "repo_type": "unknown"}),
+        )
+    }
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _PathsOnly:
+    """Config stand-in exposing only the directory and file paths."""
+
+    config_directory: Path
+    config_file: Path
+    repos_directory: Path
+
+
+def fake_config(**overrides):
+    """Build a duck-typed Config stand-in whose methods are plain Mocks."""
+    config = SimpleNamespace(
+        exists=Mock(return_value=True),
+        read=Mock(return_value={"hierarchy": []}),
+        validate_repo_url=Mock(return_value=True),
+    )
+    vars(config).update(overrides)
+    return config
+
+
+@pytest.fixture(autouse=True)
+def mock_message(monkeypatch):
+    """Silence config_commands output; tests read what was sent from call_args_list."""
+    mock = Mock()
+    monkeypatch.setattr(config_commands, "message", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def _shared_config_mock():
+    """Create the Config Mock once per module."""
+    return Mock(spec=Config)
+
+
+@pytest.fixture
+def config_mock(_shared_config_mock):
+    """Hand out the shared Config Mock and clear it after each test."""
+    yield _shared_config_mock
+    _shared_config_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def cli_args():
+    """Create an empty parsed-arguments namespace for a single test to fill in."""
+    return SimpleNamespace()
+
 
 class TestConfigCommandsAddCliArguments:
     """Test cases for add_cli_arguments method."""
@@ -23,229 +97,190 @@ class TestConfigCommandsAddCliArguments:
         # Should add config parser
         assert mock_subparsers.add_parser.called
 
-    def test_adds_all_subcommands(self):
-        """Test that all config subcommands are added."""
-        import argparse
-
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers(dest="command")
-
-        ConfigCommands.add_cli_arguments(subparsers)
-
-        # Parse each subcommand to verify they exist
-        commands = ["init", "show", "add", "remove", "update", "move", "validate", "export", "import", "where"]
-
-        for cmd in commands:
-            if cmd in ["add", "remove", "update", "move", "import"]:
-                # These require additional arguments
-                continue
-            args = parser.parse_args(["config", cmd])
-            assert args.command == "config"
-            assert args.config_command == cmd
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["init"],
+            ["show"],
+            ["add", "team", "https://github.com/team/repo"],
+            ["remove", "team"],
+            ["update", "team", "--rename", "new-team"],
+            ["move", "team", "--up"],
+            ["validate"],
+            ["export"],
+            ["import", "input.yaml"],
+            ["where"],
+        ],
+        ids=lambda argv: argv[0],
+    )
+    def test_adds_all_subcommands(self, cli_parser, argv):
+        """Test that every config subcommand is registered."""
+        args = cli_parser.parse_args(["config", *argv])
+        assert args.command == "config"
+        assert args.config_command == argv[0]
 
 
 class TestConfigCommandsProcessCliCommand:
     """Test cases for process_cli_command method."""
 
-    def test_processes_init_command(self):
+    @pytest.fixture
+    def command_mocks(self):
+        """Patch the ConfigCommands handlers that process_cli_command dispatches to."""
+        with patch.multiple(
+            ConfigCommands,
+            display=DEFAULT,
+            validate_all=DEFAULT,
+            export_config=DEFAULT,
+            import_config=DEFAULT,
+            show_location=DEFAULT,
+        ) as mocks:
+            yield mocks
+
+    def test_processes_init_command(self, cli_args, config_mock):
         """Test processing of init command."""
-        args = Mock()
-        args.config_command = "init"
+        cli_args.config_command = "init"
 
-        config = Mock(spec=Config)
-
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        config.initialize.assert_called_once_with(skip_if_already_created=False)
+        config_mock.initialize.assert_called_once_with(skip_if_already_created=False)
 
-    @patch("agent_manager.cli_extensions.config_commands.ConfigCommands.display")
-    def test_processes_show_command(self, mock_display):
+    def test_processes_show_command(self, cli_args, config_mock, command_mocks):
         """Test processing of show command."""
-        args = Mock()
-        args.config_command = "show"
-        args.resolve_paths = False
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "show"
+        cli_args.resolve_paths = False
 
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        mock_display.assert_called_once_with(config, resolve_paths=False)
+        command_mocks["display"].assert_called_once_with(config_mock, resolve_paths=False)
 
-    @patch("agent_manager.cli_extensions.config_commands.ConfigCommands.display")
-    def test_processes_show_command_with_resolve(self, mock_display):
+    def test_processes_show_command_with_resolve(self, cli_args, config_mock, command_mocks):
         """Test processing of show command with resolve_paths."""
-        args = Mock()
-        args.config_command = "show"
-        args.resolve_paths = True
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "show"
+        cli_args.resolve_paths = True
 
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        mock_display.assert_called_once_with(config, resolve_paths=True)
+        command_mocks["display"].assert_called_once_with(config_mock, resolve_paths=True)
 
-    def test_processes_add_command(self):
+    def test_processes_add_command(self, cli_args, config_mock):
         """Test processing of add command."""
-        args = Mock()
-        args.config_command = "add"
-        args.name = "team"
-        args.url = "https://github.com/team/repo"
-        args.position = None
+        cli_args.config_command = "add"
+        cli_args.name = "team"
+        cli_args.url = "https://github.com/team/repo"
+        cli_args.position = None
 
-        config = Mock(spec=Config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        ConfigCommands.process_cli_command(args, config)
+        config_mock.add_level.assert_called_once_with("team", "https://github.com/team/repo", None)
 
-        config.add_level.assert_called_once_with("team", "https://github.com/team/repo", None)
-
-    def test_processes_remove_command(self):
+    def test_processes_remove_command(self, cli_args, config_mock):
         """Test processing of remove command."""
-        args = Mock()
-        args.config_command = "remove"
-        args.name = "team"
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "remove"
+        cli_args.name = "team"
 
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        config.remove_level.assert_called_once_with("team")
+        config_mock.remove_level.assert_called_once_with("team")
 
-    def test_processes_update_command(self):
+    def test_processes_update_command(self, cli_args, config_mock):
         """Test processing of update command."""
-        args = Mock()
-        args.config_command = "update"
-        args.name = "team"
-        args.url = "https://github.com/team/new-repo"
-        args.rename = "new-team"
+        cli_args.config_command = "update"
+        cli_args.name = "team"
+        cli_args.url = "https://github.com/team/new-repo"
+        cli_args.rename = "new-team"
 
-        config = Mock(spec=Config)
-
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        config.update_level.assert_called_once_with("team", "https://github.com/team/new-repo", "new-team")
+        config_mock.update_level.assert_called_once_with("team", "https://github.com/team/new-repo", "new-team")
 
-    def test_processes_move_command_with_position(self):
+    def test_processes_move_command_with_position(self, cli_args, config_mock):
         """Test processing of move command with position."""
-        args = Mock()
-        args.config_command = "move"
-        args.name = "team"
-        args.position = 2
-        args.up = False
-        args.down = False
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "move"
+        cli_args.name = "team"
+        cli_args.position = 2
+        cli_args.up = False
+        cli_args.down = False
 
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        config.move_level.assert_called_once_with("team", 2, None)
+        config_mock.move_level.assert_called_once_with("team", 2, None)
 
-    def test_processes_move_command_with_up(self):
+    def test_processes_move_command_with_up(self, cli_args, config_mock):
         """Test processing of move command with up direction."""
-        args = Mock()
-        args.config_command = "move"
-        args.name = "team"
-        args.position = None
-        args.up = True
-        args.down = False
+        cli_args.config_command = "move"
+        cli_args.name = "team"
+        cli_args.position = None
+        cli_args.up = True
+        cli_args.down = False
 
-        config = Mock(spec=Config)
-
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        config.move_level.assert_called_once_with("team", None, "up")
+        config_mock.move_level.assert_called_once_with("team", None, "up")
 
-    def test_processes_move_command_with_down(self):
+    def test_processes_move_command_with_down(self, cli_args, config_mock):
         """Test processing of move command with down direction."""
-        args = Mock()
-        args.config_command = "move"
-        args.name = "team"
-        args.position = None
-        args.up = False
-        args.down = True
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "move"
+        cli_args.name = "team"
+        cli_args.position = None
+        cli_args.up = False
+        cli_args.down = True
 
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        config.move_level.assert_called_once_with("team", None, "down")
+        config_mock.move_level.assert_called_once_with("team", None, "down")
 
-    @patch("agent_manager.cli_extensions.config_commands.ConfigCommands.validate_all")
-    def test_processes_validate_command(self, mock_validate):
+    def test_processes_validate_command(self, cli_args, config_mock, command_mocks):
         """Test processing of validate command."""
-        args = Mock()
-        args.config_command = "validate"
+        cli_args.config_command = "validate"
 
-        config = Mock(spec=Config)
-
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        mock_validate.assert_called_once_with(config)
+        command_mocks["validate_all"].assert_called_once_with(config_mock)
 
-    @patch("agent_manager.cli_extensions.config_commands.ConfigCommands.export_config")
-    def test_processes_export_command(self, mock_export):
+    def test_processes_export_command(self, cli_args, config_mock, command_mocks):
         """Test processing of export command."""
-        args = Mock()
-        args.config_command = "export"
-        args.file = "output.yaml"
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "export"
+        cli_args.file = "output.yaml"
 
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        mock_export.assert_called_once_with(config, "output.yaml")
+        command_mocks["export_config"].assert_called_once_with(config_mock, "output.yaml")
 
-    @patch("agent_manager.cli_extensions.config_commands.ConfigCommands.import_config")
-    def test_processes_import_command(self, mock_import):
+    def test_processes_import_command(self, cli_args, config_mock, command_mocks):
         """Test processing of import command."""
-        args = Mock()
-        args.config_command = "import"
-        args.file = "input.yaml"
+        cli_args.config_command = "import"
+        cli_args.file = "input.yaml"
 
-        config = Mock(spec=Config)
-
-        ConfigCommands.process_cli_command(args, config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        mock_import.assert_called_once_with(config, "input.yaml")
+        command_mocks["import_config"].assert_called_once_with(config_mock, "input.yaml")
 
-    @patch("agent_manager.cli_extensions.config_commands.ConfigCommands.show_location")
-    def test_processes_where_command(self, mock_show):
+    def test_processes_where_command(self, cli_args, config_mock, command_mocks):
         """Test processing of where command."""
-        args = Mock()
-        args.config_command = "where"
+        cli_args.config_command = "where"
 
-        config = Mock(spec=Config)
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
-        ConfigCommands.process_cli_command(args, config)
+        command_mocks["show_location"].assert_called_once_with(config_mock)
 
-        mock_show.assert_called_once_with(config)
-
-    def test_processes_unknown_command(self):
+    def test_processes_unknown_command(self, cli_args, config_mock):
         """Test processing of unknown command."""
-        args = Mock()
-        args.config_command = "unknown"
-
-        config = Mock(spec=Config)
+        cli_args.config_command = "unknown"
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
-            ConfigCommands.process_cli_command(args, config)
+        with pytest.raises(SystemExit):
+            ConfigCommands.process_cli_command(cli_args, config_mock)
 
-    def test_shows_help_when_no_subcommand(self):
+    def test_shows_help_when_no_subcommand(self, cli_args, config_mock, mock_message):
         """Test that no subcommand shows available commands instead of error."""
-        args = Mock()
-        args.config_command = None
+        cli_args.config_command = None
 
-        config = Mock(spec=Config)
-        messages = []
-
-        def capture_message(msg, *args, **kwargs):
-            messages.append(msg)
-
-        with patch("agent_manager.cli_extensions.config_commands.message", side_effect=capture_message):
-            # Should return without error, not raise SystemExit
-            ConfigCommands.process_cli_command(args, config)
+        # Should return without error, not raise SystemExit
+        ConfigCommands.process_cli_command(cli_args, config_mock)
 
         # Should have printed available subcommands
-        assert any("Available" in str(m) or "subcommand" in str(m).lower() for m in messages)
+        assert any(
+            "Available" in str(c.args[0]) or "subcommand" in str(c.args[0]).lower() for c in mock_message.call_args_list
+        )
 
 
 class TestConfigCommandsDisplay:
@@ -253,27 +288,21 @@ class TestConfigCommandsDisplay:
 
     def test_display_shows_hierarchy(self, tmp_path):
         """Test that display shows hierarchy configuration."""
-        config = Mock(spec=Config)
+        config = fake_config()
         config.exists.return_value = True
-        config.read.return_value = {
-            "hierarchy": [
-                {"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"},
-                {"name": "team", "url": "file:///tmp/team", "repo_type": "file"},
-            ]
-        }
+        config.read.return_value = ORG_AND_TEAM_CONFIG
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.display(config)
+        ConfigCommands.display(config)
 
         config.exists.assert_called_once()
         config.read.assert_called_once()
 
     def test_display_errors_when_no_config(self):
         """Test that display errors when config doesn't exist."""
-        config = Mock(spec=Config)
+        config = fake_config()
         config.exists.return_value = False
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
+        with pytest.raises(SystemExit):
             ConfigCommands.display(config)
 
     @patch("agent_manager.cli_extensions.config_commands.create_repo")
@@ -283,13 +312,12 @@ class TestConfigCommandsDisplay:
         mock_repo.get_display_url.return_value = "/resolved/path"
         mock_create.return_value = mock_repo
 
-        config = Mock(spec=Config)
+        config = fake_config()
         config.exists.return_value = True
         config.repos_directory = tmp_path
         config.read.return_value = {"hierarchy": [{"name": "team", "url": "file:///tmp/team", "repo_type": "file"}]}
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.display(config, resolve_paths=True)
+        ConfigCommands.display(config, resolve_paths=True)
 
         mock_create.assert_called_once()
 
@@ -299,60 +327,118 @@ class TestConfigCommandsValidateAll:
 
     def test_validates_all_repositories(self, tmp_path):
         """Test validation of all repositories."""
-        config = Mock(spec=Config)
+        config = fake_config()
         config.exists.return_value = True
-        config.read.return_value = {
-            "hierarchy": [
-                {"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"},
-                {"name": "team", "url": "file:///tmp/team", "repo_type": "file"},
-            ]
-        }
+        config.read.return_value = ORG_AND_TEAM_CONFIG
         config.validate_repo_url.return_value = True
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.validate_all(config)
+        ConfigCommands.validate_all(config)
 
         assert config.validate_repo_url.call_count == 2
 
     def test_validates_all_reports_failures(self):
         """Test that validate_all reports validation failures."""
-        config = Mock(spec=Config)
+        config = fake_config()
+        config.exists.return_value = True
+        config.read.return_value = ORG_AND_BAD_CONFIG
+        config.validate_repo_url.side_effect = [True, False]
+
+        with pytest.raises(SystemExit):
+            ConfigCommands.validate_all(config)
+
+    def test_validates_urls_concurrently(self):
+        """Test that URL checks overlap instead of running one after another."""
+        config = fake_config()
         config.exists.return_value = True
         config.read.return_value = {
             "hierarchy": [
                 {"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"},
-                {"name": "bad", "url": "invalid://url", "repo_type": "unknown"},
+                {"name": "team", "url": "https://github.com/team/repo", "repo_type": "git"},
             ]
         }
-        config.validate_repo_url.side_effect = [True, False]
+        # Each check waits for the other; this only completes if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+        config.validate_repo_url.side_effect = lambda url: barrier.wait() is not None
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
+        ConfigCommands.validate_all(config)
+
+        assert config.validate_repo_url.call_count == 2
+
+    def test_check_messages_follow_their_own_header(self, monkeypatch, capsys):
+        """Test that messages printed by a later check still appear under its own header."""
+        from agent_manager import output
+
+        monkeypatch.setattr(config_commands, "message", output.message)
+        # Send errors to stdout too so the relative order of all lines is captured
+        monkeypatch.setattr(sys, "stderr", sys.stdout)
+        bad_checked = threading.Event()
+
+        def validate_repo_url(url):
+            if url == "invalid://url":
+                output.message("Cannot access git repository: invalid://url", output.MessageType.ERROR)
+                bad_checked.set()
+                return False
+            # The first entry finishes only after the second has printed its error
+            bad_checked.wait(timeout=5)
+            output.message("Checked org")
+            return True
+
+        config = fake_config(validate_repo_url=Mock(side_effect=validate_repo_url))
+        config.read.return_value = ORG_AND_BAD_CONFIG
+
+        with pytest.raises(SystemExit):
+            ConfigCommands.validate_all(config)
+
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert lines[:6] == [
+            "[1/2] org: https://github.com/org/repo",
+            "Checked org",
+            "  ✓ Valid",
+            "[2/2] bad: invalid://url",
+            "Error: Cannot access git repository: invalid://url",
+            "Error:   ✗ Invalid or inaccessible",
+        ]
+
+    def test_reports_results_in_hierarchy_order(self, mock_message):
+        """Test that results are reported in hierarchy order with the matching outcome."""
+        config = fake_config()
+        config.exists.return_value = True
+        config.read.return_value = ORG_AND_BAD_CONFIG
+        config.validate_repo_url.side_effect = lambda url: url != "invalid://url"
+
+        with pytest.raises(SystemExit):
             ConfigCommands.validate_all(config)
 
+        lines = [c.args[0] for c in mock_message.call_args_list]
+        assert lines[1:5] == [
+            "[1/2] org: https://github.com/org/repo",
+            "  ✓ Valid",
+            "[2/2] bad: invalid://url",
+            "  ✗ Invalid or inaccessible",
+        ]
+
     def test_validates_all_errors_when_no_config(self):
         """Test that validate_all errors when config doesn't exist."""
-        config = Mock(spec=Config)
+        config = fake_config()
         config.exists.return_value = False
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
+        with pytest.raises(SystemExit):
             ConfigCommands.validate_all(config)
 
 
 class TestConfigCommandsExportConfig:
     """Test cases for export_config method."""
 
-    def test_exports_to_file(self, tmp_path):
+    def test_exports_to_file(self, tmp_path, config_mock):
         """Test exporting configuration to file."""
         output_file = tmp_path / "export.yaml"
 
-        config = Mock(spec=Config)
-        config.exists.return_value = True
-        config.read.return_value = {
+        config_mock.exists.return_value = True
+        config_mock.read.return_value = {
             "hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git", "repo": Mock()}]
         }
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.export_config(config, str(output_file))
+        ConfigCommands.export_config(config_mock, str(output_file))
 
         assert output_file.exists()
 
@@ -364,34 +450,30 @@ class TestConfigCommandsExportConfig:
         assert exported["hierarchy"][0]["name"] == "org"
         assert "repo" not in exported["hierarchy"][0]  # Should be removed
 
-    def test_exports_to_stdout(self, capsys):
+    def test_exports_to_stdout(self, capsys, config_mock):
         """Test exporting configuration to stdout."""
-        config = Mock(spec=Config)
-        config.exists.return_value = True
-        config.read.return_value = {
+        config_mock.exists.return_value = True
+        config_mock.read.return_value = {
             "hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git", "repo": Mock()}]
         }
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.export_config(config, None)
+        ConfigCommands.export_config(config_mock, None)
 
         captured = capsys.readouterr()
         assert "org" in captured.out
         assert "hierarchy" in captured.out
 
-    def test_exports_with_mergers_section(self, tmp_path):
+    def test_exports_with_mergers_section(self, tmp_path, config_mock):
         """Test that export includes mergers section if present."""
         output_file = tmp_path / "export.yaml"
 
-        config = Mock(spec=Config)
-        config.exists.return_value = True
-        config.read.return_value = {
+        config_mock.exists.return_value = True
+        config_mock.read.return_value = {
             "hierarchy": [{"name": "org", "url": "url", "repo_type": "git", "repo": Mock()}],
             "mergers": {"JsonMerger": {"indent": 2}},
         }
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.export_config(config, str(output_file))
+        ConfigCommands.export_config(config_mock, str(output_file))
 
         with open(output_file) as f:
             exported = yaml.safe_load(f)
@@ -399,13 +481,12 @@ class TestConfigCommandsExportConfig:
         assert "mergers" in exported
         assert exported["mergers"]["JsonMerger"]["indent"] == 2
 
-    def test_export_errors_when_no_config(self):
+    def test_export_errors_when_no_config(self, config_mock):
         """Test that export errors when config doesn't exist."""
-        config = Mock(spec=Config)
-        config.exists.return_value = False
+        config_mock.exists.return_value = False
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
-            ConfigCommands.export_config(config, "output.yaml")
+        with pytest.raises(SystemExit):
+            ConfigCommands.export_config(config_mock, "output.yaml")
 
 
 class TestConfigCommandsImportConfig:
@@ -423,8 +504,7 @@ class TestConfigCommandsImportConfig:
         config.exists.return_value = False
         config.config_file = tmp_path / "config.yaml"
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.import_config(config, str(input_file))
+        ConfigCommands.import_config(config, str(input_file))
 
         config.write.assert_called_once()
 
@@ -440,108 +520,92 @@ class TestConfigCommandsImportConfig:
         config.exists.return_value = True
         config.config_file = tmp_path / "config.yaml"
 
-        with (
-            patch("agent_manager.cli_extensions.config_commands.message"),
-            patch("builtins.input", return_value="no"),
-        ):
+        with patch("builtins.input", return_value="no"):
             ConfigCommands.import_config(config, str(input_file))
 
         # Should not write if user says no
         config.write.assert_not_called()
 
-    def test_import_handles_missing_file(self):
+    def test_import_handles_missing_file(self, config_mock):
         """Test that import handles missing input file."""
-        config = Mock(spec=Config)
+        with pytest.raises(SystemExit):
+            ConfigCommands.import_config(config_mock, "nonexistent.yaml")
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
-            ConfigCommands.import_config(config, "nonexistent.yaml")
-
-    def test_import_handles_invalid_yaml(self, tmp_path):
+    def test_import_handles_invalid_yaml(self, tmp_path, config_mock):
         """Test that import handles invalid YAML."""
         input_file = tmp_path / "invalid.yaml"
         input_file.write_text("invalid: yaml: content:")
 
-        config = Mock(spec=Config)
-
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
-            ConfigCommands.import_config(config, str(input_file))
+        with pytest.raises(SystemExit):
+            ConfigCommands.import_config(config_mock, str(input_file))
 
-    def test_import_validates_structure(self, tmp_path):
+    def test_import_validates_structure(self, tmp_path, config_mock):
         """Test that import validates configuration structure."""
         input_file = tmp_path / "invalid.yaml"
         with open(input_file, "w") as f:
             yaml.dump({"not_hierarchy": []}, f)
 
-        config = Mock(spec=Config)
-
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
-            ConfigCommands.import_config(config, str(input_file))
+        with pytest.raises(SystemExit):
+            ConfigCommands.import_config(config_mock, str(input_file))
 
 
 class TestConfigCommandsShowLocation:
     """Test cases for show_location method."""
 
-    def test_shows_configuration_locations(self, tmp_path):
+    def test_shows_configuration_locations(self, tmp_path, mock_message):
         """Test that show_location displays config file locations."""
-        config = Mock(spec=Config)
-
-        # Mock the path attributes and their exists() methods
-        config.config_directory = Mock()
-        config.config_directory.__str__ = Mock(return_value=str(tmp_path / "config"))
-        config.config_directory.exists = Mock(return_value=False)
-
-        config.config_file = Mock()
-        config.config_file.__str__ = Mock(return_value=str(tmp_path / "config" / "config.yaml"))
-        config.config_file.exists = Mock(return_value=False)
-
-        config.repos_directory = Mock()
-        config.repos_directory.__str__ = Mock(return_value=str(tmp_path / "config" / "repos"))
-        config.repos_directory.exists = Mock(return_value=False)
+        config_dir = tmp_path / "config"
+        config = _PathsOnly(config_dir, config_dir / "config.yaml", config_dir / "repos")
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.show_location(config)
+        ConfigCommands.show_location(config)
 
-        # Should not raise any errors
+        texts = [c.args[0] for c in mock_message.call_args_list]
+        assert f"  Config directory: {config_dir}" in texts
+        assert "  ✗ Configuration file does not exist" in texts
+        assert "  ✗ Config directory does not exist" in texts
+        assert "  ✗ Repos directory does not exist" in texts
 
-    def test_shows_existence_status(self, tmp_path):
+    def test_shows_existence_status(self, tmp_path, mock_message):
         """Test that show_location shows existence status."""
         config_dir = tmp_path / "config"
         config_dir.mkdir()
         config_file = config_dir / "config.yaml"
         config_file.touch()
 
-        config = Mock(spec=Config)
-        config.config_directory = config_dir
-        config.config_file = config_file
-        config.repos_directory = config_dir / "repos"
+        config = _PathsOnly(config_dir, config_file, config_dir / "repos")
+
+        ConfigCommands.show_location(config)
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.show_location(config)
+        texts = [c.args[0] for c in mock_message.call_args_list]
+        assert "  ✓ Configuration file exists" in texts
+        assert "  ✓ Config directory exists" in texts
+        assert "  ✗ Repos directory does not exist" in texts
 
 
 class TestConfigCommandsEdgeCases:
     """Test cases for edge cases and special scenarios."""
 
-    def test_display_handles_unicode_names(self):
+    def test_display_handles_unicode_names(self, config_mock):
         """Test that display handles Unicode in hierarchy names."""
-        config = Mock(spec=Config)
-        config.exists.return_value = True
-        config.read.return_value = {"hierarchy": [{"name": "组织", "url": "https://example.com", "repo_type": "git"}]}
+        config_mock.exists.return_value = True
+        config_mock.read.return_value = {
+            "hierarchy": [{"name": "组织", "url": "https://example.com", "repo_type": "git"}]
+        }
 
-        with patch("agent_manager.cli_extensions.config_commands.message"):
-            ConfigCommands.display(config)
+        ConfigCommands.display(config_mock)
 
-    def test_export_handles_write_error(self, tmp_path):
+    def test_export_handles_write_error(self, tmp_path, config_mock):
         """Test that export handles write errors."""
         output_file = tmp_path / "readonly"
         output_file.mkdir()  # Make it a directory to cause error
 
-        config = Mock(spec=Config)
-        config.exists.return_value = True
-        config.read.return_value = {"hierarchy": [{"name": "org", "url": "url", "repo_type": "git", "repo": Mock()}]}
+        config_mock.exists.return_value = True
+        config_mock.read.return_value = {
+            "hierarchy": [{"name": "org", "url": "url", "repo_type": "git", "repo": Mock()}]
+        }
 
-        with patch("agent_manager.cli_extensions.config_commands.message"), pytest.raises(SystemExit):
-            ConfigCommands.export_config(config, str(output_file))
+        with pytest.raises(SystemExit):
+            ConfigCommands.export_config(config_mock, str(output_file))
 
     def test_import_accepts_yes_variations(self, tmp_path):
         """Test that import accepts various yes responses."""
@@ -556,10 +620,7 @@ class TestConfigCommandsEdgeCases:
         config.config_file = tmp_path / "config.yaml"
 
         for yes_response in ["yes", "y", "YES", "Y"]:
-            with (
-                patch("agent_manager.cli_extensions.config_commands.message"),
-                patch("builtins.input", return_value=yes_response),
-            ):
+            with patch("builtins.input", return_value=yes_response):
                 ConfigCommands.import_config(config, str(input_file))
 
             config.write.assert_called()
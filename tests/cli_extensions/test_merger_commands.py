@@ -1,9 +1,10 @@
 """Tests for mergers/manager.py - Merger CLI management."""
 
 import argparse
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+import yaml
 
 from agent_manager.cli_extensions.merger_commands import MergerCommands
 from agent_manager.config import Config
@@ -12,6 +13,9 @@ from agent_manager.plugins.mergers.json_merger import JsonMerger
 from agent_manager.plugins.mergers.markdown_merger import MarkdownMerger
 from agent_manager.plugins.mergers.yaml_merger import YamlMerger
 
+# Keep the CLI tests on one xdist worker so the session fixtures are built once
+pytestmark = pytest.mark.xdist_group("cli_extensions")
+
 
 @pytest.fixture
 def merger_registry():
@@ -194,45 +198,44 @@ class TestMergerCommandsHelpers:
 class TestMergerCommandsProcessCommand:
     """Test cases for process_cli_command."""
 
-    def test_process_cli_command_list(self, merger_manager, mock_config):
+    def test_process_cli_command_list(self, merger_manager, monkeypatch):
         """Test processing 'mergers list' command."""
         args = argparse.Namespace(mergers_command="list")
+        monkeypatch.setattr(merger_manager, "list_mergers", Mock())
 
-        with patch.object(merger_manager, "list_mergers") as mock_list:
-            merger_manager.process_cli_command(args, mock_config)
-            mock_list.assert_called_once()
+        merger_manager.process_cli_command(args, object())
+
+        merger_manager.list_mergers.assert_called_once_with()
 
-    def test_process_cli_command_show(self, merger_manager, mock_config):
+    def test_process_cli_command_show(self, merger_manager, monkeypatch):
         """Test processing 'mergers show' command."""
         args = argparse.Namespace(mergers_command="show", name="JsonMerger")
+        monkeypatch.setattr(merger_manager, "show_merger", Mock())
 
-        with patch.object(merger_manager, "show_merger") as mock_show:
-            merger_manager.process_cli_command(args, mock_config)
-            mock_show.assert_called_once_with("JsonMerger")
+        merger_manager.process_cli_command(args, object())
+
+        merger_manager.show_merger.assert_called_once_with("JsonMerger")
 
-    def test_process_cli_command_configure(self, merger_manager, mock_config):
+    def test_process_cli_command_configure(self, merger_manager, monkeypatch):
         """Test processing 'mergers configure' command."""
         args = argparse.Namespace(mergers_command="configure", merger=None)
+        config = object()
+        monkeypatch.setattr(merger_manager, "configure_mergers", Mock())
 
-        with patch.object(merger_manager, "configure_mergers") as mock_configure:
-            merger_manager.process_cli_command(args, mock_config)
-            mock_configure.assert_called_once_with(mock_config, None)
+        merger_manager.process_cli_command(args, config)
+
+        merger_manager.configure_mergers.assert_called_once_with(config, None)
 
     def test_process_cli_command_no_subcommand_shows_usage(self, merger_manager, mock_config):
         """Test that no subcommand shows friendly usage message."""
         args = argparse.Namespace()  # No mergers_command
 
-        messages = []
-
-        def capture_message(text, *args_inner, **kwargs):
-            messages.append(text)
-
-        with patch("agent_manager.cli_extensions.merger_commands.message", side_effect=capture_message):
+        with patch("agent_manager.cli_extensions.merger_commands.message") as mock_message:
             merger_manager.process_cli_command(args, mock_config)
 
-        output = "\n".join(messages)
-        assert "Usage: agent-manager mergers <command>" in output
-        assert "Available commands:" in output
+        texts = [c.args[0] for c in mock_message.call_args_list]
+        assert "Usage: agent-manager mergers <command>" in texts
+        assert "Available commands:" in texts
 
 
 class TestMergerCommandsConfigureCommand:
@@ -250,8 +253,6 @@ class TestMergerCommandsConfigureCommand:
         }
 
         # Write the config file directly as YAML to avoid serialization issues
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -276,8 +277,6 @@ class TestMergerCommandsConfigureCommand:
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
 
         # Write the config file directly as YAML to avoid serialization issues
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -304,8 +303,6 @@ class TestMergerCommandsConfigureCommand:
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
 
         # Write the config file directly as YAML to avoid serialization issues
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -340,8 +337,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -367,8 +362,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -394,8 +387,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -417,8 +408,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -446,8 +435,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -472,8 +459,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -498,8 +483,6 @@ class TestMergerCommandsConfigureCommand:
         mock_config.ensure_directories()
 
         config_data = {"hierarchy": [{"name": "test", "url": "https://github.com/test/repo", "repo_type": "git"}]}
-        import yaml
-
         with open(mock_config.config_file, "w") as f:
             yaml.dump(config_data, f)
 
@@ -1,46 +1,40 @@
 """Tests for cli_extensions/repo_commands.py - Repository CLI commands."""
 
-from unittest.mock import Mock
+import pytest
 
 from agent_manager.cli_extensions.repo_commands import RepoCommands
 
+# Keep the CLI tests on one xdist worker so the session fixtures are built once
+pytestmark = pytest.mark.xdist_group("cli_extensions")
+
+
+@pytest.fixture(scope="module")
+def built_repo_parsers(subparser_tree):
+    """Run add_cli_arguments once against a Mock tree; tests only read the recorded calls."""
+    tree = subparser_tree("repos", "update")
+    RepoCommands.add_cli_arguments(tree["subparsers"])
+    return tree
+
 
 class TestRepoCommandsAddCliArguments:
     """Test cases for add_cli_arguments method."""
 
-    def test_adds_update_parser(self):
+    def test_adds_update_parser(self, built_repo_parsers):
         """Test that add_cli_arguments adds repos and update parsers."""
-        mock_subparsers = Mock()
-        mock_parser = Mock()
-        mock_parser.add_subparsers.return_value = Mock()
-        mock_subparsers.add_parser.return_value = mock_parser
-
-        RepoCommands.add_cli_arguments(mock_subparsers)
-
         # Should add both "repos" and "update" parsers
-        calls = [call[0][0] for call in mock_subparsers.add_parser.call_args_list]
+        calls = [call[0][0] for call in built_repo_parsers["subparsers"].add_parser.call_args_list]
         assert "repos" in calls
         assert "update" in calls
 
-    def test_adds_force_argument(self):
-        """Test that update parser includes force argument."""
-        mock_subparsers = Mock()
-        mock_repos_parser = Mock()
-        mock_update_parser = Mock()
-        mock_repos_parser.add_subparsers.return_value = Mock()
-
-        def add_parser_side_effect(name, **kwargs):
-            if name == "repos":
-                return mock_repos_parser
-            elif name == "update":
-                return mock_update_parser
-            return Mock()
-
-        mock_subparsers.add_parser.side_effect = add_parser_side_effect
-
-        RepoCommands.add_cli_arguments(mock_subparsers)
+    def test_adds_repos_subcommands(self, built_repo_parsers):
+        """Test that list, enable, and disable subcommands are added to repos."""
+        calls = [call[0][0] for call in built_repo_parsers["repos_sub"].add_parser.call_args_list]
+        assert calls == ["list", "enable", "disable"]
 
+    def test_adds_force_argument(self, built_repo_parsers):
+        """Test that update parser includes force argument."""
         # Verify force argument was added to update parser
+        mock_update_parser = built_repo_parsers["update"]
         mock_update_parser.add_argument.assert_called_once()
         call_args = mock_update_parser.add_argument.call_args
         assert call_args[0][0] == "--force"
@@ -50,37 +44,21 @@ class TestRepoCommandsAddCliArguments:
 class TestRepoCommandsIntegration:
     """Integration tests for repo commands."""
 
-    def test_add_and_process_workflow(self):
+    def test_add_and_process_workflow(self, cli_parser):
         """Test complete workflow of adding arguments and processing."""
-        import argparse
-
-        # Create parser
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers(dest="command")
-
-        # Add arguments
-        RepoCommands.add_cli_arguments(subparsers)
-
         # Parse update command
-        args = parser.parse_args(["update"])
+        args = cli_parser.parse_args(["update"])
         assert args.command == "update"
         assert args.force is False
 
         # Parse update with force
-        args = parser.parse_args(["update", "--force"])
+        args = cli_parser.parse_args(["update", "--force"])
         assert args.command == "update"
         assert args.force is True
 
-    def test_full_command_flow(self):
+    def test_full_command_flow(self, cli_parser):
         """Test full command flow from argparse to parsing."""
-        import argparse
-
-        # Set up parser
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers(dest="command")
-        RepoCommands.add_cli_arguments(subparsers)
-
         # Parse and verify update command with force
-        args = parser.parse_args(["update", "--force"])
+        args = cli_parser.parse_args(["update", "--force"])
         assert args.command == "update"
         assert args.force is True
@@ -1,13 +1,65 @@
 """Tests for config/config.py - Configuration management."""
 
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
 import yaml
 
+from agent_manager.config import config as config_module
 from agent_manager.config.config import Config, ConfigError
 
+# Use the libyaml bindings for test fixtures when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+# Home directory looked up once for the default-location tests
+_HOME = Path.home()
+
+# The single git level that makes up the smallest valid configuration
+_ORG_LEVEL = MappingProxyType({"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"})
+
+
+def _minimal_config(**overrides):
+    """Return a fresh, valid single-level config that the test is free to mutate or dump."""
+    return {"hierarchy": [dict(_ORG_LEVEL)], **overrides}
+
+
+@pytest.fixture(autouse=True)
+def mock_message(monkeypatch):
+    """Silence config output; tests can inspect what was sent through call_args_list."""
+    mock = Mock()
+    monkeypatch.setattr(config_module, "message", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def config_factory(tmp_path_factory):
+    """Return a factory for Configs rooted in a fresh, not-yet-created directory."""
+
+    def _make(create: bool = False) -> Config:
+        config_dir = tmp_path_factory.mktemp("cfg") / "config"
+        if create:
+            config_dir.mkdir()
+        return Config(config_dir=config_dir)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def prewritten_config(tmp_path_factory):
+    """Write the minimal config to disk once; tests must only read it."""
+    config_dir = tmp_path_factory.mktemp("prewritten") / "config"
+    config_dir.mkdir()
+    with open(config_dir / "config.yaml", "w") as f:
+        yaml.dump(_minimal_config(), f, Dumper=_Dumper)
+    return Config(config_dir=config_dir)
+
 
 class TestConfigError:
     """Test cases for ConfigError exception."""
@@ -46,9 +98,9 @@ class TestConfigInitialization:
         """Test Config initialization with default directory."""
         config = Config()
 
-        assert config.config_directory == Path.home() / ".agent-manager"
-        assert config.config_file == Path.home() / ".agent-manager" / "config.yaml"
-        assert config.repos_directory == Path.home() / ".agent-manager" / "repos"
+        assert config.config_directory == _HOME / ".agent-manager"
+        assert config.config_file == _HOME / ".agent-manager" / "config.yaml"
+        assert config.repos_directory == _HOME / ".agent-manager" / "repos"
 
     def test_custom_config_directory(self, tmp_path):
         """Test Config initialization with custom directory."""
@@ -63,73 +115,64 @@ class TestConfigInitialization:
 class TestConfigEnsureDirectories:
     """Test cases for ensure_directories method."""
 
-    def test_creates_config_directory(self, tmp_path):
+    def test_creates_config_directory(self, config_factory):
         """Test that ensure_directories creates config directory."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
+        config_dir = config.config_directory
 
-        with patch("agent_manager.config.config.message"):
-            config.ensure_directories()
+        config.ensure_directories()
 
         assert config_dir.exists()
         assert config_dir.is_dir()
 
-    def test_creates_repos_directory(self, tmp_path):
+    def test_creates_repos_directory(self, config_factory):
         """Test that ensure_directories creates repos directory."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
+        config_dir = config.config_directory
 
-        with patch("agent_manager.config.config.message"):
-            config.ensure_directories()
+        config.ensure_directories()
 
         repos_dir = config_dir / "repos"
         assert repos_dir.exists()
         assert repos_dir.is_dir()
 
-    def test_idempotent_creation(self, tmp_path):
+    def test_idempotent_creation(self, config_factory):
         """Test that ensure_directories is idempotent."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
+        config_dir = config.config_directory
 
-        with patch("agent_manager.config.config.message"):
-            config.ensure_directories()
-            config.ensure_directories()  # Call again
+        config.ensure_directories()
+        config.ensure_directories()  # Call again
 
         # Should not raise error
         assert config_dir.exists()
 
-    def test_handles_permission_error(self, tmp_path):
+    def test_handles_permission_error(self, config_factory):
         """Test that ensure_directories handles permission errors."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
 
         with (
             patch("pathlib.Path.mkdir", side_effect=PermissionError),
-            patch("agent_manager.config.config.message"),
             pytest.raises(SystemExit),
         ):
             config.ensure_directories()
 
-    def test_handles_os_error(self, tmp_path):
+    def test_handles_os_error(self, config_factory):
         """Test that ensure_directories handles OS errors."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
 
         with (
             patch("pathlib.Path.mkdir", side_effect=OSError("Disk full")),
-            patch("agent_manager.config.config.message"),
             pytest.raises(SystemExit),
         ):
             config.ensure_directories()
 
-    def test_handles_generic_exception(self, tmp_path):
+    def test_handles_generic_exception(self, config_factory):
         """Test that ensure_directories handles unexpected exceptions."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
 
         with (
             patch("pathlib.Path.mkdir", side_effect=RuntimeError("Unexpected error")),
-            patch("agent_manager.config.config.message"),
             pytest.raises(SystemExit),
         ):
             config.ensure_directories()
@@ -150,8 +193,7 @@ class TestConfigValidateRepoUrl:
 
         mock_discover.return_value = [mock_git_repo]
 
-        with patch("agent_manager.config.config.message"):
-            result = Config.validate_repo_url("https://github.com/user/repo")
+        result = Config.validate_repo_url("https://github.com/user/repo")
 
         assert result is True
 
@@ -167,8 +209,7 @@ class TestConfigValidateRepoUrl:
 
         mock_discover.return_value = [mock_local_repo]
 
-        with patch("agent_manager.config.config.message"):
-            result = Config.validate_repo_url("file:///tmp/repo")
+        result = Config.validate_repo_url("file:///tmp/repo")
 
         assert result is True
 
@@ -177,8 +218,7 @@ class TestConfigValidateRepoUrl:
         """Test rejection of invalid URL."""
         mock_detect.return_value = []
 
-        with patch("agent_manager.config.config.message"):
-            result = Config.validate_repo_url("invalid://url")
+        result = Config.validate_repo_url("invalid://url")
 
         assert result is False
 
@@ -194,7 +234,6 @@ class TestConfigValidateRepoUrlEdgeCases:
         with (
             patch("agent_manager.config.config.Config.detect_repo_types", return_value=["nonexistent"]),
             patch("agent_manager.config.config.discover_repo_types", return_value=[]),
-            patch("agent_manager.config.config.message"),
         ):
             result = Config.validate_repo_url(url)
 
@@ -258,8 +297,7 @@ class TestConfigPromptForRepoType:
         url = "https://example.com"
         available = ["git", "file"]
 
-        with patch("agent_manager.config.config.message"):
-            selected = Config.prompt_for_repo_type(url, available)
+        selected = Config.prompt_for_repo_type(url, available)
 
         assert selected == "git"
 
@@ -268,8 +306,7 @@ class TestConfigPromptForRepoType:
         """Test selection of second option."""
         available = ["type1", "type2", "type3"]
 
-        with patch("agent_manager.config.config.message"):
-            selected = Config.prompt_for_repo_type("url", available)
+        selected = Config.prompt_for_repo_type("url", available)
 
         assert selected == "type2"
 
@@ -278,8 +315,7 @@ class TestConfigPromptForRepoType:
         """Test that prompt retries on invalid input."""
         available = ["type1", "type2"]
 
-        with patch("agent_manager.config.config.message"):
-            selected = Config.prompt_for_repo_type("url", available)
+        selected = Config.prompt_for_repo_type("url", available)
 
         # Should eventually select type2
         assert selected == "type2"
@@ -301,41 +337,51 @@ class TestConfigValidate:
         # Should not raise exception
         Config.validate(config)
 
-    def test_rejects_missing_hierarchy(self):
-        """Test rejection of config without hierarchy key."""
-        config = {}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "must contain 'hierarchy' key" in str(exc_info.value)
-
-    def test_rejects_non_list_hierarchy(self):
-        """Test rejection of hierarchy that's not a list."""
-        config = {"hierarchy": "not a list"}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'hierarchy' must be a list" in str(exc_info.value)
-
-    def test_rejects_empty_hierarchy(self):
-        """Test rejection of empty hierarchy."""
-        config = {"hierarchy": []}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'hierarchy' cannot be empty" in str(exc_info.value)
-
-    def test_rejects_non_dict_entry(self):
-        """Test rejection of non-dictionary hierarchy entry."""
-        config = {"hierarchy": ["not a dict"]}
-
+    @pytest.mark.parametrize(
+        ("config", "expected"),
+        [
+            pytest.param({}, "must contain 'hierarchy' key", id="missing-hierarchy"),
+            pytest.param({"hierarchy": "not a list"}, "'hierarchy' must be a list", id="non-list-hierarchy"),
+            pytest.param({"hierarchy": []}, "'hierarchy' cannot be empty", id="empty-hierarchy"),
+            pytest.param({"hierarchy": ["not a dict"]}, "must be a dictionary", id="non-dict-entry"),
+            pytest.param(
+                {"hierarchy": [{"name": 123, "url": "url", "repo_type": "git"}]},
+                "'name' must be a string",
+                id="non-string-name",
+            ),
+            pytest.param(
+                {"hierarchy": [{"name": "", "url": "url", "repo_type": "git"}]},
+                "'name' cannot be empty",
+                id="empty-name",
+            ),
+            pytest.param(
+                {"hierarchy": [{"name": "org", "url": 456, "repo_type": "git"}]},
+                "'url' must be a string",
+                id="non-string-url",
+            ),
+            pytest.param(
+                {"hierarchy": [{"name": "org", "url": "", "repo_type": "git"}]},
+                "'url' cannot be empty",
+                id="empty-url",
+            ),
+            pytest.param(
+                {"hierarchy": [{"name": "org", "url": "url", "repo_type": 789}]},
+                "'repo_type' must be a string",
+                id="non-string-repo-type",
+            ),
+            pytest.param(
+                {"hierarchy": [{"name": "org", "url": "url", "repo_type": ""}]},
+                "'repo_type' cannot be empty",
+                id="empty-repo-type",
+            ),
+        ],
+    )
+    def test_rejects_invalid_config(self, config, expected):
+        """Test that each malformed config is rejected with a specific error."""
         with pytest.raises(ConfigError) as exc_info:
             Config.validate(config)
 
-        assert "must be a dictionary" in str(exc_info.value)
+        assert expected in str(exc_info.value)
 
     def test_rejects_missing_required_keys(self):
         """Test rejection of entry missing required keys."""
@@ -349,60 +395,6 @@ class TestConfigValidate:
         assert "url" in error_str
         assert "repo_type" in error_str
 
-    def test_rejects_non_string_name(self):
-        """Test rejection of non-string name field."""
-        config = {"hierarchy": [{"name": 123, "url": "url", "repo_type": "git"}]}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'name' must be a string" in str(exc_info.value)
-
-    def test_rejects_empty_name(self):
-        """Test rejection of empty name field."""
-        config = {"hierarchy": [{"name": "", "url": "url", "repo_type": "git"}]}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'name' cannot be empty" in str(exc_info.value)
-
-    def test_rejects_non_string_url(self):
-        """Test rejection of non-string url field."""
-        config = {"hierarchy": [{"name": "org", "url": 456, "repo_type": "git"}]}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'url' must be a string" in str(exc_info.value)
-
-    def test_rejects_empty_url(self):
-        """Test rejection of empty url field."""
-        config = {"hierarchy": [{"name": "org", "url": "", "repo_type": "git"}]}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'url' cannot be empty" in str(exc_info.value)
-
-    def test_rejects_non_string_repo_type(self):
-        """Test rejection of non-string repo_type field."""
-        config = {"hierarchy": [{"name": "org", "url": "url", "repo_type": 789}]}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'repo_type' must be a string" in str(exc_info.value)
-
-    def test_rejects_empty_repo_type(self):
-        """Test rejection of empty repo_type field."""
-        config = {"hierarchy": [{"name": "org", "url": "url", "repo_type": ""}]}
-
-        with pytest.raises(ConfigError) as exc_info:
-            Config.validate(config)
-
-        assert "'repo_type' cannot be empty" in str(exc_info.value)
-
     def test_collects_multiple_errors(self):
         """Test that validation collects multiple errors."""
         config = {
@@ -422,54 +414,45 @@ class TestConfigValidate:
 class TestConfigWrite:
     """Test cases for write method."""
 
-    def test_writes_valid_config(self, tmp_path):
+    def test_writes_valid_config(self, config_factory):
         """Test writing valid configuration."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
-        config_dir.mkdir()
+        config = config_factory(create=True)
 
-        config_data = {"hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}]}
+        config_data = _minimal_config()
 
-        with patch("agent_manager.config.config.message"):
-            config.write(config_data)
+        config.write(config_data)
 
         assert config.config_file.exists()
 
         # Verify contents
         with open(config.config_file) as f:
-            written = yaml.safe_load(f)
+            written = yaml.load(f, Loader=_Loader)
 
         assert written["hierarchy"][0]["name"] == "org"
 
-    def test_write_rejects_invalid_config(self, tmp_path):
+    def test_write_rejects_invalid_config(self, config_factory):
         """Test that write rejects invalid configuration."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
-        config_dir.mkdir()
+        config = config_factory(create=True)
 
         invalid_config = {"hierarchy": []}  # Empty hierarchy
 
         with pytest.raises(SystemExit):
             config.write(invalid_config)
 
-    def test_write_handles_os_error(self, tmp_path):
+    def test_write_handles_os_error(self, config_factory):
         """Test that write handles file system errors."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
-        # Don't create directory to cause error
+        config = config_factory()  # Directory is not created, so the write fails
 
-        config_data = {"hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}]}
+        config_data = _minimal_config()
 
         with pytest.raises(SystemExit):
             config.write(config_data)
 
-    def test_write_handles_generic_exception(self, tmp_path):
+    def test_write_handles_generic_exception(self, config_factory):
         """Test that write handles unexpected exceptions."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
-        config_dir.mkdir()
+        config = config_factory(create=True)
 
-        config_data = {"hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}]}
+        config_data = _minimal_config()
 
         # Simulate unexpected exception during YAML dump
         with patch("yaml.dump", side_effect=RuntimeError("Unexpected error")), pytest.raises(SystemExit):
@@ -479,35 +462,20 @@ class TestConfigWrite:
 class TestConfigRead:
     """Test cases for read method."""
 
-    def test_reads_valid_config(self, tmp_path):
+    def test_reads_valid_config(self, prewritten_config):
         """Test reading valid configuration file."""
-        config_dir = tmp_path / "config"
-        config_dir.mkdir()
-
-        config_file = config_dir / "config.yaml"
-        config_data = {"hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}]}
-
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
-
-        config = Config(config_dir=config_dir)
-
-        with (
-            patch("agent_manager.config.config.message"),
-            patch("agent_manager.config.config.create_repo") as mock_create,
-        ):
+        with patch("agent_manager.config.config.create_repo") as mock_create:
             mock_create.return_value = Mock()
-            loaded = config.read()
+            loaded = prewritten_config.read()
 
         assert loaded["hierarchy"][0]["name"] == "org"
         assert "repo" in loaded["hierarchy"][0]
 
-    def test_read_handles_missing_file(self, tmp_path):
+    def test_read_handles_missing_file(self, config_factory):
         """Test that read handles missing configuration file."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
 
-        with patch("agent_manager.config.config.message"), pytest.raises(SystemExit):
+        with pytest.raises(SystemExit):
             config.read()
 
     def test_read_handles_empty_file(self, tmp_path):
@@ -520,7 +488,7 @@ class TestConfigRead:
 
         config = Config(config_dir=config_dir)
 
-        with patch("agent_manager.config.config.message"), pytest.raises(SystemExit):
+        with pytest.raises(SystemExit):
             config.read()
 
     def test_read_handles_invalid_config(self, tmp_path):
@@ -530,33 +498,24 @@ class TestConfigRead:
 
         config_file = config_dir / "config.yaml"
         with open(config_file, "w") as f:
-            yaml.dump({"hierarchy": []}, f)  # Invalid (empty)
+            yaml.dump({"hierarchy": []}, f, Dumper=_Dumper)  # Invalid (empty)
 
         config = Config(config_dir=config_dir)
 
-        with patch("agent_manager.config.config.message"), pytest.raises(SystemExit):
+        with pytest.raises(SystemExit):
             config.read()
 
 
 class TestConfigExists:
     """Test cases for exists method."""
 
-    def test_exists_returns_true_when_file_exists(self, tmp_path):
+    def test_exists_returns_true_when_file_exists(self, prewritten_config):
         """Test that exists returns True when config file exists."""
-        config_dir = tmp_path / "config"
-        config_dir.mkdir()
-
-        config_file = config_dir / "config.yaml"
-        config_file.touch()
-
-        config = Config(config_dir=config_dir)
+        assert prewritten_config.exists() is True
 
-        assert config.exists() is True
-
-    def test_exists_returns_false_when_file_missing(self, tmp_path):
+    def test_exists_returns_false_when_file_missing(self, config_factory):
         """Test that exists returns False when config file doesn't exist."""
-        config_dir = tmp_path / "config"
-        config = Config(config_dir=config_dir)
+        config = config_factory()
 
         assert config.exists() is False
 
@@ -573,7 +532,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch("builtins.input", side_effect=['["org"]', "https://github.com/org/repo"]),
             patch("agent_manager.config.config.Config.validate_repo_url", return_value=True),
             patch("agent_manager.config.config.Config.detect_repo_types", return_value=["git"]),
@@ -593,8 +551,7 @@ class TestConfigInitialize:
 
         config = Config(config_dir=config_dir)
 
-        with patch("agent_manager.config.config.message"):
-            config.initialize(skip_if_already_created=True)
+        config.initialize(skip_if_already_created=True)
 
         # Should not prompt for input
 
@@ -606,7 +563,6 @@ class TestConfigInitialize:
         config.config_file.touch()  # Create existing file
 
         with (
-            patch("agent_manager.config.config.message"),
             patch("builtins.input", return_value="no"),  # Say no to overwrite
         ):
             config.initialize(skip_if_already_created=False)
@@ -623,7 +579,6 @@ class TestConfigInitialize:
         config.config_file.touch()  # Create existing file
 
         with (
-            patch("agent_manager.config.config.message"),
             patch("builtins.input", side_effect=["yes", '["org"]', "https://github.com/org/repo"]),
             patch("agent_manager.config.config.Config.detect_repo_types", return_value=["git"]),
             patch("agent_manager.config.config.Config.validate_repo_url", return_value=True),
@@ -641,7 +596,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=['{"key": "value"}', '["org"]', "https://github.com/org/repo"],
@@ -660,7 +614,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=["[invalid", '["org"]', "https://github.com/org/repo"],
@@ -679,7 +632,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=['["org"]', "", "https://github.com/org/repo"],
@@ -698,7 +650,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=['["org"]', "invalid://bad", "https://github.com/org/repo"],
@@ -721,7 +672,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=["org, team, personal", "url1", "url2", "url3"],
@@ -745,7 +695,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=["  org  ,  team  ", "url1", "url2"],
@@ -766,7 +715,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch("builtins.input", side_effect=['["org", "team"]', "url1", "url2"]),
             patch("agent_manager.config.config.Config.detect_repo_types", return_value=["git"]),
             patch("agent_manager.config.config.Config.validate_repo_url", return_value=True),
@@ -785,7 +733,6 @@ class TestConfigInitialize:
         config.ensure_directories()
 
         with (
-            patch("agent_manager.config.config.message"),
             patch(
                 "builtins.input",
                 side_effect=["org, , team", "org, team", "url1", "url2"],
@@ -901,10 +848,18 @@ class TestConfigNormalizeUrl:
         assert normalized == url
 
 
+@pytest.fixture
+def stub_file_repo_checks(monkeypatch):
+    """Accept every URL as a file repo and skip building repo objects."""
+    monkeypatch.setattr(Config, "validate_repo_url", staticmethod(lambda url: True))
+    monkeypatch.setattr(Config, "detect_repo_types", staticmethod(lambda url: ["file"]))
+    monkeypatch.setattr(config_module, "create_repo", lambda *args, **kwargs: Mock())
+
+
 class TestConfigFileUrlResolution:
     """Integration tests for file:// URL resolution in config operations."""
 
-    def test_initialize_resolves_relative_file_urls(self, tmp_path):
+    def test_initialize_resolves_relative_file_urls(self, tmp_path, stub_file_repo_checks):
         """Test that initialize resolves relative file:// URLs to absolute paths."""
         config_dir = tmp_path / "config"
         repos_dir = tmp_path / "repos"
@@ -919,20 +874,12 @@ class TestConfigFileUrlResolution:
         try:
             os.chdir(tmp_path)
 
-            with (
-                patch("agent_manager.config.config.message"),
-                patch("builtins.input", side_effect=['["org"]', "file://./repos"]),
-                patch("agent_manager.config.config.Config.validate_repo_url", return_value=True),
-                patch(
-                    "agent_manager.config.config.Config.detect_repo_types",
-                    return_value=["file"],
-                ),
-            ):
+            with patch("builtins.input", side_effect=['["org"]', "file://./repos"]):
                 config.initialize()
 
             # Read back the config
             with open(config.config_file) as f:
-                written_config = yaml.safe_load(f)
+                written_config = yaml.load(f, Loader=_Loader)
 
             # URL should be absolute
             url = written_config["hierarchy"][0]["url"]
@@ -942,16 +889,16 @@ class TestConfigFileUrlResolution:
         finally:
             os.chdir(original_cwd)
 
-    def test_add_level_resolves_relative_file_urls(self, tmp_path):
+    def test_add_level_resolves_relative_file_urls(self, tmp_path, stub_file_repo_checks):
         """Test that add_level resolves relative file:// URLs to absolute paths."""
         config_dir = tmp_path / "config"
         config = Config(config_dir=config_dir)
         config.ensure_directories()
 
         # Create initial config with git URL
-        initial_config = {"hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}]}
+        initial_config = _minimal_config()
         with open(config.config_file, "w") as f:
-            yaml.dump(initial_config, f)
+            yaml.dump(initial_config, f, Dumper=_Dumper)
 
         # Create a local repo directory
         local_repo = tmp_path / "local"
@@ -963,20 +910,11 @@ class TestConfigFileUrlResolution:
         try:
             os.chdir(tmp_path)
 
-            with (
-                patch("agent_manager.config.config.message"),
-                patch("agent_manager.config.config.Config.validate_repo_url", return_value=True),
-                patch(
-                    "agent_manager.config.config.Config.detect_repo_types",
-                    return_value=["file"],
-                ),
-                patch("agent_manager.config.config.create_repo"),
-            ):
-                config.add_level("personal", "file://./local")
+            config.add_level("personal", "file://./local")
 
             # Read back the config
             with open(config.config_file) as f:
-                written_config = yaml.safe_load(f)
+                written_config = yaml.load(f, Loader=_Loader)
 
             # New URL should be absolute
             personal_entry = [e for e in written_config["hierarchy"] if e["name"] == "personal"][0]
@@ -987,16 +925,16 @@ class TestConfigFileUrlResolution:
         finally:
             os.chdir(original_cwd)
 
-    def test_update_level_resolves_relative_file_urls(self, tmp_path):
+    def test_update_level_resolves_relative_file_urls(self, tmp_path, stub_file_repo_checks):
         """Test that update_level resolves relative file:// URLs to absolute paths."""
         config_dir = tmp_path / "config"
         config = Config(config_dir=config_dir)
         config.ensure_directories()
 
         # Create initial config
-        initial_config = {"hierarchy": [{"name": "org", "url": "https://github.com/org/repo", "repo_type": "git"}]}
+        initial_config = _minimal_config()
         with open(config.config_file, "w") as f:
-            yaml.dump(initial_config, f)
+            yaml.dump(initial_config, f, Dumper=_Dumper)
 
         # Create a new local repo directory
         new_local = tmp_path / "new_local"
@@ -1008,20 +946,11 @@ class TestConfigFileUrlResolution:
         try:
             os.chdir(tmp_path)
 
-            with (
-                patch("agent_manager.config.config.message"),
-                patch("agent_manager.config.config.Config.validate_repo_url", return_value=True),
-                patch(
-                    "agent_manager.config.config.Config.detect_repo_types",
-                    return_value=["file"],
-                ),
-                patch("agent_manager.config.config.create_repo"),
-            ):
-                config.update_level("org", new_url="file://./new_local")
+            config.update_level("org", new_url="file://./new_local")
 
             # Read back the config
             with open(config.config_file) as f:
-                written_config = yaml.safe_load(f)
+                written_config = yaml.load(f, Loader=_Loader)
 
             # Updated URL should be absolute
             url = written_config["hierarchy"][0]["url"]
@@ -1040,8 +969,7 @@ class TestConfigEdgeCases:
         config_dir = tmp_path / "配置"
         config = Config(config_dir=config_dir)
 
-        with patch("agent_manager.config.config.message"):
-            config.ensure_directories()
+        config.ensure_directories()
 
         assert config_dir.exists()
 
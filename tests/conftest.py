@@ -0,0 +1,41 @@
+"""Shared fixtures for the agent-manager test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_manager.utils import discovery
+
+
+@pytest.fixture(scope="session")
+def resolved_home():
+    """Resolve the user's home directory once per session."""
+    return Path.home().resolve()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def unusable_entry_point_cache(tmp_path_factory):
+    """Keep plugin discovery away from the real entry point cache file.
+
+    The cache file is placed under a regular file, so it can be neither read
+    nor written and no test sees entries persisted by another. Tests of the
+    cache itself point ENTRY_POINT_CACHE_FILE at their own directory.
+    """
+    blocker = tmp_path_factory.mktemp("entry-point-cache") / "not-a-directory"
+    blocker.touch()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(discovery, "ENTRY_POINT_CACHE_FILE", blocker / "entry_points.json")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_discovery_caches():
+    """Clear the in-process discovery caches around every test.
+
+    Each test then scans the (possibly mocked) installed distributions again.
+    """
+    discovery._installed_distributions.cache_clear()
+    discovery._installed_entry_points.cache_clear()
+    yield
+    discovery._installed_distributions.cache_clear()
+    discovery._installed_entry_points.cache_clear()
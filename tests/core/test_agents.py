@@ -29,6 +29,20 @@ class TestDiscoverAgentPlugins:
         )
         assert result == {"claude": {"package_name": "am_agent_claude", "source": "package"}}
 
+    @patch("agent_manager.core.agents.filter_disabled_plugins", side_effect=lambda plugins, _type: plugins)
+    @patch("agent_manager.core.agents.discover_external_plugins")
+    def test_returns_plugins_sorted_by_name(self, mock_discover, _mock_filter):
+        """Test that discovered plugins are ordered by agent name."""
+        mock_discover.return_value = {
+            "zebra": {"package_name": "am_agent_zebra"},
+            "alpha": {"package_name": "am_agent_alpha"},
+            "middle": {"package_name": "am_agent_middle"},
+        }
+
+        result = discover_agent_plugins()
+
+        assert list(result) == ["alpha", "middle", "zebra"]
+
     @patch("agent_manager.core.agents.discover_external_plugins")
     def test_returns_empty_dict_when_no_plugins(self, mock_discover):
         """Test that empty dict is returned when no plugins found."""
@@ -42,8 +56,9 @@ class TestDiscoverAgentPlugins:
 class TestGetAgentNames:
     """Test cases for get_agent_names function."""
 
-    @patch("agent_manager.core.agents.discover_agent_plugins")
-    def test_returns_sorted_names(self, mock_discover):
+    @patch("agent_manager.core.agents.filter_disabled_plugins", side_effect=lambda plugins, _type: plugins)
+    @patch("agent_manager.core.agents.discover_external_plugins")
+    def test_returns_sorted_names(self, mock_discover, _mock_filter):
         """Test that agent names are returned sorted."""
         mock_discover.return_value = {
             "zebra": {"package_name": "am_agent_zebra"},
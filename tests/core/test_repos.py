@@ -11,7 +11,8 @@ from agent_manager.core.repos import (
     get_repo_type_map,
     update_repositories,
 )
-from agent_manager.plugins.repos import AbstractRepo, GitRepo, LocalRepo
+from agent_manager.output import MessageType
+from agent_manager.plugins.repos import AbstractRepo, GitRepo, GitRepoError, LocalRepo
 
 
 class TestDiscoverRepoTypesImportError:
@@ -276,6 +277,126 @@ class TestUpdateRepositories:
         # repo2 should still be attempted
         repo2.update.assert_called_once()
 
+    def test_continues_after_repo_exits(self):
+        """Test that a repo calling sys.exit() does not stop the other updates."""
+        repo1 = MagicMock()
+        repo1.needs_update.return_value = True
+        repo1.update.side_effect = SystemExit(1)
+
+        repo2 = MagicMock()
+        repo2.needs_update.return_value = True
+
+        config_data = {
+            "hierarchy": [
+                {"name": "org", "repo": repo1},
+                {"name": "team", "repo": repo2},
+            ]
+        }
+
+        with patch("agent_manager.core.repos.message") as mock_message, pytest.raises(SystemExit):
+            update_repositories(config_data)
+
+        repo2.update.assert_called_once()
+        error_messages = [c.args[0] for c in mock_message.call_args_list if c.args[1] == MessageType.ERROR]
+        assert "Failed to update 'org'" in error_messages
+
+    def test_reports_git_repo_error(self):
+        """Test that a GitRepoError is reported with its reason and does not stop the others."""
+        repo1 = MagicMock()
+        repo1.needs_update.side_effect = GitRepoError("Directory exists but is not a valid git repository")
+
+        repo2 = MagicMock()
+        repo2.needs_update.return_value = True
+
+        config_data = {
+            "hierarchy": [
+                {"name": "org", "repo": repo1},
+                {"name": "team", "repo": repo2},
+            ]
+        }
+
+        with patch("agent_manager.core.repos.message") as mock_message, pytest.raises(SystemExit):
+            update_repositories(config_data)
+
+        repo2.update.assert_called_once()
+        error_messages = [c.args[0] for c in mock_message.call_args_list if c.args[1] == MessageType.ERROR]
+        assert "Failed to update 'org': Directory exists but is not a valid git repository" in error_messages
+
+    def test_updates_repositories_concurrently(self):
+        """Test that repository updates run in parallel rather than one after another."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+        repos = []
+        for _ in range(3):
+            repo = MagicMock()
+            repo.needs_update.return_value = True
+            # Each update waits until all three are running at the same time
+            repo.update.side_effect = barrier.wait
+            repos.append(repo)
+
+        config_data = {"hierarchy": [{"name": f"repo{i}", "repo": repo} for i, repo in enumerate(repos)]}
+
+        with patch("agent_manager.core.repos.message"):
+            update_repositories(config_data)
+
+        for repo in repos:
+            repo.update.assert_called_once()
+
+    def test_reports_progress_in_hierarchy_order(self):
+        """Test that progress lines follow hierarchy order regardless of completion order."""
+        hierarchy = []
+        for name in ("org", "team", "me"):
+            repo = MagicMock()
+            repo.needs_update.return_value = False
+            hierarchy.append({"name": name, "repo": repo})
+
+        config_data = {"hierarchy": hierarchy}
+
+        with patch("agent_manager.core.repos.message") as mock_message:
+            update_repositories(config_data)
+
+        progress = [c.args[0] for c in mock_message.call_args_list if c.args[0].startswith("[")]
+        assert progress == ["[1/3] org", "[2/3] team", "[3/3] me"]
+
+    def test_repository_messages_follow_their_own_header(self, capsys):
+        """Test that messages from concurrent updates are shown under the right repository."""
+        import threading
+
+        from agent_manager.output import message
+
+        team_done = threading.Event()
+
+        def update_org():
+            message("Cloning org...")
+            # Finish only after team has produced all of its output
+            team_done.wait(timeout=5)
+            message("Successfully cloned org")
+
+        def update_team():
+            message("Cloning team...")
+            message("Successfully cloned team")
+            team_done.set()
+
+        hierarchy = []
+        for name, update in (("org", update_org), ("team", update_team)):
+            repo = MagicMock()
+            repo.needs_update.return_value = True
+            repo.update.side_effect = update
+            hierarchy.append({"name": name, "repo": repo})
+
+        update_repositories({"hierarchy": hierarchy})
+
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert lines[1:7] == [
+            "[1/2] org",
+            "Cloning org...",
+            "Successfully cloned org",
+            "[2/2] team",
+            "Cloning team...",
+            "Successfully cloned team",
+        ]
+
     def test_displays_progress(self):
         """Test that progress is displayed during updates."""
         repo1 = MagicMock()
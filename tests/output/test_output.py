@@ -1,6 +1,16 @@
 """Tests for output/output.py - Output and logging utilities."""
 
-from agent_manager.output import Color, MessageType, OutputManager, VerbosityLevel, message
+from agent_manager.output import (
+    Color,
+    MessageType,
+    OutputManager,
+    VerbosityLevel,
+    buffered_output,
+    debug_enabled,
+    get_output,
+    message,
+    replay_output,
+)
 
 
 class TestVerbosityLevel:
@@ -187,3 +197,69 @@ class TestGlobalMessage:
         assert "Hidden" not in captured.out
 
         mgr.verbosity = original_verbosity
+
+
+class TestIsEnabled:
+    """Test cases for verbosity checks."""
+
+    def test_is_enabled_respects_verbosity(self):
+        """Test that is_enabled compares against the current verbosity."""
+        manager = OutputManager(verbosity=1, use_color=False)
+
+        assert manager.is_enabled(VerbosityLevel.ALWAYS)
+        assert manager.is_enabled(VerbosityLevel.VERBOSE)
+        assert not manager.is_enabled(VerbosityLevel.EXTRA_VERBOSE)
+        assert not manager.is_enabled(VerbosityLevel.DEBUG)
+
+    def test_debug_enabled_follows_global_verbosity(self):
+        """Test that debug_enabled reflects the global output manager."""
+        mgr = get_output()
+        original_verbosity = mgr.verbosity
+
+        try:
+            mgr.verbosity = 2
+            assert not debug_enabled()
+
+            mgr.verbosity = 3
+            assert debug_enabled()
+        finally:
+            mgr.verbosity = original_verbosity
+
+
+class TestBufferedOutput:
+    """Test cases for holding back and replaying messages."""
+
+    def test_buffered_messages_are_not_printed(self, capsys):
+        """Test that messages inside buffered_output() are collected instead of printed."""
+        with buffered_output() as lines:
+            message("Held back")
+            message("Held back error", MessageType.ERROR)
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == ""
+        assert lines == [("Held back", False), ("Error: Held back error", True)]
+
+    def test_replay_output_prints_to_original_streams(self, capsys):
+        """Test that replay_output() sends errors to stderr and the rest to stdout."""
+        with buffered_output() as lines:
+            message("Normal line")
+            message("Broken", MessageType.ERROR)
+
+        replay_output(lines)
+
+        captured = capsys.readouterr()
+        assert captured.out == "Normal line\n"
+        assert captured.err == "Error: Broken\n"
+
+    def test_buffering_is_per_thread(self, capsys):
+        """Test that other threads keep printing while one thread buffers."""
+        import threading
+
+        with buffered_output() as lines:
+            thread = threading.Thread(target=message, args=("From another thread",))
+            thread.start()
+            thread.join()
+
+        assert lines == []
+        assert "From another thread" in capsys.readouterr().out
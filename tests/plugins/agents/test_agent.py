@@ -1,11 +1,16 @@
 """Tests for plugins/agents/agent.py - Abstract agent base class."""
 
+import os
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from agent_manager.plugins.agents.agent import AbstractAgent
+from agent_manager.core import create_default_merger_registry
+from agent_manager.plugins.agents.agent import (
+    AbstractAgent,
+    _default_merger_registry,
+)
 
 
 class ConcreteAgent(AbstractAgent):
@@ -85,6 +90,35 @@ class TestAbstractAgentInitialization:
 
         assert agent.agent_directory == Path.home() / ".testagent"
 
+    def test_default_mergers_discovered_once(self):
+        """Test that merger discovery is shared across agent instances."""
+        _default_merger_registry.cache_clear()
+        try:
+            with patch(
+                "agent_manager.plugins.agents.agent.create_default_merger_registry",
+                wraps=create_default_merger_registry,
+            ) as mock_create:
+                ConcreteAgent()
+                ConcreteAgent()
+
+            mock_create.assert_called_once()
+        finally:
+            _default_merger_registry.cache_clear()
+
+    def test_merger_registries_are_independent(self):
+        """Test that registering a merger on one agent does not affect others."""
+        first = ConcreteAgent()
+        second = ConcreteAgent()
+
+        class CustomMerger:
+            pass
+
+        first.merger_registry.register_extension(".custom", CustomMerger)
+
+        assert ".custom" in first.merger_registry.extension_mergers
+        assert ".custom" not in second.merger_registry.extension_mergers
+        assert ".custom" not in _default_merger_registry().extension_mergers
+
 
 class TestAbstractAgentExcludePatterns:
     """Test cases for exclude pattern management."""
@@ -129,6 +163,75 @@ class TestAbstractAgentExcludePatterns:
         assert "custom.txt" in agent.exclude_patterns
         assert "*.log" in agent.exclude_patterns
 
+    def test_add_exclude_pattern(self):
+        """Test that add_exclude_pattern appends to exclude_patterns."""
+        agent = ConcreteAgent()
+
+        agent.add_exclude_pattern("*.log")
+
+        assert agent.exclude_patterns[-1] == "*.log"
+
+    def test_exclude_matcher_matches_like_fnmatch(self):
+        """Test that the exclude matcher matches the same names as fnmatch."""
+        import fnmatch
+
+        agent = ConcreteAgent()
+        matcher = agent._get_exclude_matcher()
+
+        names = [".git", "module.pyc", "pkg.egg-info", "README.md", "config.yaml", "readme.txt", "venv2"]
+        for name in names:
+            expected = any(fnmatch.fnmatch(name, pattern) for pattern in agent.exclude_patterns)
+            assert matcher.matches(name) == expected, name
+
+    def test_exclude_matcher_partitions_literals_suffixes_and_globs(self):
+        """Test that names go to a set, "*<suffix>" to a tuple, and other globs to the regex."""
+        agent = ConcreteAgent()
+        agent.add_exclude_pattern("cache-?.db")
+        matcher = agent._get_exclude_matcher()
+
+        assert ".git" in matcher.literals
+        assert "node_modules" in matcher.literals
+        assert "*.pyc" not in matcher.literals
+        assert ".pyc" in matcher.suffixes
+        assert ".egg-info" in matcher.suffixes
+        assert matcher.glob_regex.match("cache-1.db")
+        assert not matcher.glob_regex.match("module.pyc")
+        assert not matcher.glob_regex.match(".git")
+
+    def test_exclude_matcher_star_alone_is_not_a_suffix(self):
+        """Test that a bare "*" pattern excludes everything via the regex."""
+        agent = ConcreteAgent()
+        agent.add_exclude_pattern("*")
+        matcher = agent._get_exclude_matcher()
+
+        assert "" not in matcher.suffixes
+        assert matcher.matches("anything.yaml")
+
+    def test_exclude_matcher_rebuilt_when_patterns_change(self):
+        """Test that the exclude matcher picks up patterns added after initialization."""
+        agent = ConcreteAgent()
+        assert not agent._get_exclude_matcher().matches("debug.log")
+
+        agent.add_exclude_pattern("*.log")
+
+        assert agent._get_exclude_matcher().matches("debug.log")
+
+    def test_exclude_matcher_rebuilt_after_direct_edit(self):
+        """Test that patterns appended to exclude_patterns directly are still honored."""
+        agent = ConcreteAgent()
+        assert not agent._get_exclude_matcher().matches("debug.log")
+
+        agent.exclude_patterns.append("*.log")
+
+        assert agent._get_exclude_matcher().matches("debug.log")
+
+    def test_exclude_matcher_with_no_patterns_matches_nothing(self):
+        """Test that an empty exclude list excludes nothing."""
+        agent = ConcreteAgent()
+        agent.exclude_patterns = []
+
+        assert not agent._get_exclude_matcher().matches("anything.txt")
+
 
 class TestAbstractAgentRootLevelFiles:
     """Test cases for root-level file discovery configuration."""
@@ -299,6 +402,37 @@ class TestAbstractAgentFileDiscovery:
         assert "root.yaml" in file_names
         assert len(files) == 3
 
+    def test_discover_files_prunes_excluded_directories(self, tmp_path):
+        """Test that files inside excluded directories are not discovered."""
+        agent_dir = tmp_path / ".testagent"
+        (agent_dir / ".git" / "objects").mkdir(parents=True)
+        (agent_dir / ".git" / "HEAD").touch()
+        (agent_dir / ".git" / "objects" / "abc123").touch()
+        (agent_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (agent_dir / "node_modules" / "pkg" / "index.js").touch()
+        (agent_dir / "config.yaml").touch()
+
+        agent = ConcreteAgent()
+        files = agent._discover_files(tmp_path)
+
+        assert [f.name for f in files] == ["config.yaml"]
+
+    def test_discover_files_skips_symlinked_directories(self, tmp_path):
+        """Test that symlinks to directories are neither followed nor returned as files."""
+        target = tmp_path / "elsewhere"
+        target.mkdir()
+        (target / "outside.txt").touch()
+
+        agent_dir = tmp_path / ".testagent"
+        agent_dir.mkdir()
+        (agent_dir / "config.yaml").touch()
+        (agent_dir / "linked").symlink_to(target, target_is_directory=True)
+
+        agent = ConcreteAgent()
+        files = agent._discover_files(tmp_path)
+
+        assert [f.name for f in files] == ["config.yaml"]
+
     def test_discover_files_ignores_other_agent_directories(self, tmp_path):
         """Test that _discover_files only finds files in its own agent directory."""
         # Create files for .testagent (our agent)
@@ -456,6 +590,166 @@ class TestAbstractAgentGetAgentDirectory:
         assert isinstance(directory, Path)
 
 
+class TestScopeConfig:
+    """Test cases for the ScopeConfig dataclass."""
+
+    def test_is_immutable(self):
+        """Test that scope configs cannot be modified after creation."""
+        from dataclasses import FrozenInstanceError
+
+        from agent_manager.plugins.agents import ScopeConfig
+
+        scope = ScopeConfig(directory=Path("/tmp/.agent"))
+
+        with pytest.raises(FrozenInstanceError):
+            scope.directory = Path("/tmp/other")
+
+    def test_is_hashable_and_compares_by_value(self):
+        """Test that equal scope configs hash equally."""
+        from agent_manager.plugins.agents import ScopeConfig
+
+        first = ScopeConfig(directory=Path("/tmp/.agent"), description="User")
+        second = ScopeConfig(directory=Path("/tmp/.agent"), description="User")
+
+        assert first == second
+        assert len({first, second}) == 1
+
+    def test_has_no_instance_dict(self):
+        """Test that scope configs use slots instead of a per-instance __dict__."""
+        from agent_manager.plugins.agents import ScopeConfig
+
+        assert not hasattr(ScopeConfig(directory=Path("/tmp/.agent")), "__dict__")
+
+
+class TestAbstractAgentScopeCaching:
+    """Test cases for caching of scopes and derived repo directory names."""
+
+    @staticmethod
+    def _make_counting_agent():
+        """Create an agent whose scopes property counts how often it is built."""
+        from agent_manager.plugins.agents import ScopeConfig
+
+        class CountingAgent(AbstractAgent):
+            builds = 0
+
+            @property
+            def scopes(self):
+                type(self).builds += 1
+                return {
+                    "default": ScopeConfig(directory=Path.home() / ".counting", description="Default"),
+                    "project": ScopeConfig(directory=Path("/tmp/project/.counting-project"), description="Project"),
+                }
+
+            def register_hooks(self):
+                pass
+
+        return CountingAgent()
+
+    def test_scopes_built_once(self):
+        """Test that repeated scope lookups build the scopes dict only once."""
+        agent = self._make_counting_agent()
+
+        agent.get_scope_names()
+        agent.get_scope_directory("default")
+        agent.get_scope_directory("project")
+        agent.get_agent_directory()
+
+        assert type(agent).builds == 1
+
+    def test_scope_names_sorted_and_cached(self):
+        """Test that scope names are sorted once and returned as a fresh list."""
+        agent = self._make_counting_agent()
+
+        names = agent.get_scope_names()
+        names.append("mutated")
+
+        assert agent.get_scope_names() == ["default", "project"]
+        assert agent._get_sorted_scope_names() is agent._get_sorted_scope_names()
+
+    def test_unknown_scope_error_lists_available_scopes(self):
+        """Test that the unknown-scope error lists scopes in sorted order."""
+        agent = self._make_counting_agent()
+
+        with pytest.raises(ValueError, match="Available scopes: default, project"):
+            agent.get_scope_directory("missing")
+
+    def test_repo_directory_name_memoized_per_scope(self):
+        """Test that repo directory names are derived once per scope."""
+        agent = self._make_counting_agent()
+
+        with patch.object(agent, "get_scope_directory", wraps=agent.get_scope_directory) as mock_get:
+            assert agent.get_repo_directory_name() == ".counting"
+            assert agent.get_repo_directory_name() == ".counting"
+            assert agent.get_repo_directory_name("project") == ".counting-project"
+            assert agent.get_repo_directory_name("project") == ".counting-project"
+
+        assert mock_get.call_count == 2
+
+    def test_unknown_scope_still_raises(self):
+        """Test that an unknown scope raises and is not cached."""
+        agent = self._make_counting_agent()
+
+        with pytest.raises(ValueError, match="Unknown scope"):
+            agent.get_repo_directory_name("missing")
+        with pytest.raises(ValueError, match="Unknown scope"):
+            agent.get_repo_directory_name("missing")
+
+
+class TestAbstractAgentMetadataHeader:
+    """Test cases for _add_metadata_header method."""
+
+    @pytest.mark.parametrize(
+        ("file_name", "first_line"),
+        [
+            ("settings.yaml", "# Generated by agent-manager"),
+            ("agents/.cursorrules", "# Generated by agent-manager"),
+            ("README.MD", "<!-- Generated by agent-manager"),
+            ("notes.xml", "<!-- Generated by agent-manager"),
+            ("Makefile", "# Generated by agent-manager"),
+        ],
+    )
+    def test_comment_style_by_extension(self, file_name, first_line):
+        """Test that the header uses the comment syntax for the file type."""
+        agent = ConcreteAgent()
+
+        result = agent._add_metadata_header("body\n", file_name, ["org", "personal"])
+
+        assert result.splitlines()[0].startswith(first_line)
+        assert f"File: {file_name}" in result
+        assert result.endswith("body\n")
+
+    def test_html_comments_are_closed(self):
+        """Test that HTML-style header lines end with a closing comment marker."""
+        agent = ConcreteAgent()
+
+        result = agent._add_metadata_header("body\n", "CLAUDE.md", ["org"])
+
+        header_lines = result.split("\n\n")[0].splitlines()
+        assert all(line.endswith(" -->") for line in header_lines)
+
+    def test_header_lines(self):
+        """Test the full header text for a hash-comment file."""
+        agent = ConcreteAgent()
+
+        result = agent._add_metadata_header("body\n", "config.yaml", ["org", "team", "personal"])
+
+        assert result == (
+            "# Generated by agent-manager (testagent agent)\n"
+            "# File: config.yaml\n"
+            "# Sources: org → team → personal\n"
+            "# Hierarchy: org (lowest) to personal (highest priority)\n\n"
+            "body\n"
+        )
+
+    def test_json_has_no_header(self):
+        """Test that JSON files are returned unchanged."""
+        agent = ConcreteAgent()
+
+        result = agent._add_metadata_header('{"a": 1}', "settings.JSON", ["org"])
+
+        assert result == '{"a": 1}'
+
+
 class TestAbstractAgentRunHook:
     """Test cases for hook execution."""
 
@@ -524,6 +818,96 @@ class TestAbstractAgentRunHook:
             # Should return original content despite error
             assert result == content
 
+    def test_run_hook_honors_hooks_added_after_first_run(self, tmp_path):
+        """Test that the compiled hook table picks up later registrations."""
+        agent = ConcreteAgent()
+        entry = {"name": "test"}
+
+        assert agent._run_hook(agent.pre_merge_hooks, "notes.log", "x", entry, tmp_path) == "x"
+
+        agent.pre_merge_hooks["*.log"] = lambda content, entry, file_path: content + "!"
+
+        assert agent._run_hook(agent.pre_merge_hooks, "notes.log", "x", entry, tmp_path) == "x!"
+
+    def test_run_hook_runs_hooks_in_registration_order(self, tmp_path):
+        """Test that every matching hook runs, in the order it was registered."""
+        agent = ConcreteAgent()
+        agent.pre_merge_hooks.clear()
+        agent.add_pre_merge_hook("*", lambda content, entry, file_path: content + "a")
+        agent.add_pre_merge_hook("*.md", lambda content, entry, file_path: content + "b")
+        agent.add_pre_merge_hook("CLAUDE.md", lambda content, entry, file_path: content + "c")
+
+        result = agent._run_hook(agent.pre_merge_hooks, "CLAUDE.md", "", {"name": "test"}, tmp_path)
+
+        assert result == "abc"
+
+    def test_run_hook_keeps_order_across_exact_and_glob_patterns(self, tmp_path):
+        """Test that exact-name hooks run in registration order relative to glob hooks."""
+        agent = ConcreteAgent()
+        agent.pre_merge_hooks.clear()
+        agent.add_pre_merge_hook("CLAUDE.md", lambda content, entry, file_path: content + "exact")
+        agent.add_pre_merge_hook("*.md", lambda content, entry, file_path: content + ",glob")
+        agent.add_pre_merge_hook("*", lambda content, entry, file_path: content + ",all")
+
+        result = agent._run_hook(agent.pre_merge_hooks, "CLAUDE.md", "", {"name": "test"}, tmp_path)
+
+        assert result == "exact,glob,all"
+
+    def test_hook_table_partitions_patterns(self):
+        """Test that exact names, the wildcard, and globs are stored separately."""
+        agent = ConcreteAgent()
+        agent.pre_merge_hooks.clear()
+        agent.add_pre_merge_hook("mcp.json", Mock())
+        agent.add_pre_merge_hook("*", Mock())
+        agent.add_pre_merge_hook("*.md", Mock())
+
+        table = agent._get_hook_table(agent.pre_merge_hooks)
+
+        assert list(table.exact) == ["mcp.json"]
+        assert [(pattern, regex is None) for _, pattern, regex, _ in table.patterns] == [("*", True), ("*.md", False)]
+
+    def test_hook_table_wildcard_only_fast_path(self, tmp_path):
+        """Test that a table of only "*" hooks matches every file without pattern checks."""
+        agent = ConcreteAgent()
+        agent.post_merge_hooks.clear()
+        agent.add_post_merge_hook("*", lambda content, file_name, sources: content + "!")
+
+        table = agent._get_hook_table(agent.post_merge_hooks)
+
+        assert table.match_all is not None
+        assert agent._run_hook(agent.post_merge_hooks, "agents/JIRA.md", "x", None, None, ["org"]) == "x!"
+
+    def test_hook_table_fast_path_disabled_with_other_patterns(self):
+        """Test that the match-all fast path is not used when other patterns are registered."""
+        agent = ConcreteAgent()
+
+        table = agent._get_hook_table(agent.post_merge_hooks)
+
+        assert table.match_all is None
+        assert [pattern for pattern, _ in table.matching("config.yaml")] == ["*"]
+
+    def test_add_post_merge_hook(self):
+        """Test that add_post_merge_hook registers into post_merge_hooks."""
+        agent = ConcreteAgent()
+
+        def hook(content, file_name, sources):
+            return content
+
+        agent.add_post_merge_hook("*.json", hook)
+
+        assert agent.post_merge_hooks["*.json"] is hook
+
+    def test_hook_table_reused_until_hooks_change(self):
+        """Test that the compiled hook table is cached between calls."""
+        agent = ConcreteAgent()
+
+        first = agent._get_hook_table(agent.pre_merge_hooks)
+        assert agent._get_hook_table(agent.pre_merge_hooks) is first
+
+        agent.add_pre_merge_hook("*.log", lambda content, entry, file_path: content)
+
+        assert agent._get_hook_table(agent.pre_merge_hooks) is not first
+
 
 class TestAbstractAgentMergeConfigurations:
     """Test cases for configuration merging."""
@@ -566,6 +950,156 @@ class TestAbstractAgentMergeConfigurations:
         output_file = agent.agent_directory / "config.yaml"
         assert output_file.exists()
 
+    def test_merge_configurations_warns_on_unreadable_file(self, tmp_path):
+        """Test that a file that cannot be read is skipped with a warning."""
+        repo_path = tmp_path / "org"
+        agent_dir = repo_path / ".testagent"
+        agent_dir.mkdir(parents=True)
+        for i in range(5):
+            (agent_dir / f"file{i}.yaml").write_text(f"value: {i}")
+
+        repo = Mock()
+        repo.get_path.return_value = repo_path
+        config = {"hierarchy": [{"name": "org", "repo": repo}]}
+
+        agent = ConcreteAgent()
+        agent.agent_directory = tmp_path / "output"
+        agent.agent_directory.mkdir()
+
+        def read_or_fail(path):
+            if path.name == "file3.yaml":
+                return PermissionError("denied")
+            return path.read_text()
+
+        with (
+            patch("agent_manager.utils.files._read_text_or_error", side_effect=read_or_fail),
+            patch("agent_manager.plugins.agents.agent.message") as mock_message,
+        ):
+            agent.merge_configurations(config)
+
+        written = sorted(p.name for p in agent.agent_directory.iterdir())
+        assert written == ["file0.yaml", "file1.yaml", "file2.yaml", "file4.yaml"]
+        warnings = [c.args[0] for c in mock_message.call_args_list if "Could not process" in c.args[0]]
+        assert warnings == ["    Could not process file3.yaml: denied"]
+
+    def test_merge_configurations_skips_entries_outside_scope(self, tmp_path):
+        """Test that entries restricted to other scopes are not merged."""
+        repos = {}
+        for name in ("org", "team"):
+            agent_dir = tmp_path / name / ".testagent"
+            agent_dir.mkdir(parents=True)
+            (agent_dir / f"{name}.yaml").write_text(f"{name}: true")
+            repos[name] = Mock()
+            repos[name].get_path.return_value = tmp_path / name
+
+        config = {
+            "hierarchy": [
+                {"name": "org", "repo": repos["org"]},
+                {"name": "team", "repo": repos["team"], "scopes": ["project"]},
+            ]
+        }
+
+        agent = ConcreteAgent()
+        agent.agent_directory = tmp_path / "output"
+        agent.agent_directory.mkdir()
+
+        with patch("agent_manager.plugins.agents.agent.message"):
+            agent.merge_configurations(config)
+
+        assert [p.name for p in agent.agent_directory.iterdir()] == ["org.yaml"]
+        repos["team"].get_path.assert_not_called()
+
+    def test_merge_configurations_skips_scope_check_without_scoped_entries(self, tmp_path):
+        """Test that the per-entry scope check is skipped when no entry is scoped."""
+        missing_repo = Mock()
+        missing_repo.get_path.return_value = tmp_path / "nonexistent"
+        config = {"hierarchy": [{"name": "org", "repo": missing_repo}]}
+
+        agent = ConcreteAgent()
+
+        with (
+            patch.object(agent, "_should_include_entry_for_scope") as mock_check,
+            patch("agent_manager.plugins.agents.agent.message"),
+        ):
+            agent.merge_configurations(config)
+
+        mock_check.assert_not_called()
+
+    def test_merge_configurations_skips_rewriting_unchanged_output(self, tmp_path):
+        """Test that an output file with identical content is not rewritten."""
+        repo_path = tmp_path / "org"
+        (repo_path / ".testagent").mkdir(parents=True)
+        (repo_path / ".testagent" / "config.yaml").write_text("org: true\n")
+
+        repo = Mock()
+        repo.get_path.return_value = repo_path
+        config = {"hierarchy": [{"name": "org", "repo": repo}]}
+
+        agent = ConcreteAgent()
+        agent.agent_directory = tmp_path / "output"
+        agent.agent_directory.mkdir()
+        output_file = agent.agent_directory / "config.yaml"
+
+        with patch("agent_manager.plugins.agents.agent.message"):
+            agent.merge_configurations(config)
+        first_content = output_file.read_text()
+        os.utime(output_file, ns=(0, 0))
+
+        with patch("agent_manager.plugins.agents.agent.message"):
+            agent.merge_configurations(config)
+
+        assert output_file.read_text() == first_content
+        assert output_file.stat().st_mtime_ns == 0
+
+    def test_merge_configurations_rewrites_changed_output(self, tmp_path):
+        """Test that an output file whose content differs is rewritten."""
+        repo_path = tmp_path / "org"
+        (repo_path / ".testagent").mkdir(parents=True)
+        (repo_path / ".testagent" / "config.yaml").write_text("org: true\n")
+
+        repo = Mock()
+        repo.get_path.return_value = repo_path
+        config = {"hierarchy": [{"name": "org", "repo": repo}]}
+
+        agent = ConcreteAgent()
+        agent.agent_directory = tmp_path / "output"
+        agent.agent_directory.mkdir()
+        output_file = agent.agent_directory / "config.yaml"
+        output_file.write_text("stale\n")
+
+        with patch("agent_manager.plugins.agents.agent.message"):
+            agent.merge_configurations(config)
+
+        assert "org: true" in output_file.read_text()
+
+    def test_merge_configurations_creates_each_output_directory_once(self, tmp_path):
+        """Test that files sharing a subdirectory only trigger one mkdir."""
+        repo_path = tmp_path / "org"
+        (repo_path / ".testagent" / "agents").mkdir(parents=True)
+        for i in range(3):
+            (repo_path / ".testagent" / "agents" / f"agent{i}.yaml").write_text(f"id: {i}")
+
+        repo = Mock()
+        repo.get_path.return_value = repo_path
+        config = {"hierarchy": [{"name": "org", "repo": repo}]}
+
+        agent = ConcreteAgent()
+        agent.agent_directory = tmp_path / "output"
+        agent.agent_directory.mkdir()
+
+        with (
+            patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir,
+            patch("agent_manager.plugins.agents.agent.message"),
+        ):
+            agent.merge_configurations(config)
+
+        assert [call.args[0] for call in mock_mkdir.call_args_list] == [agent.agent_directory / "agents"]
+        assert sorted(p.name for p in (agent.agent_directory / "agents").iterdir()) == [
+            "agent0.yaml",
+            "agent1.yaml",
+            "agent2.yaml",
+        ]
+
     def test_merge_configurations_handles_missing_repo_path(self, tmp_path):
         """Test that merge_configurations handles missing repository paths."""
         missing_repo = Mock()
@@ -1,11 +1,21 @@
 """Tests for plugins/repos/git_repo.py - Git repository implementation."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 import git
 import pytest
 
-from agent_manager.plugins.repos.git_repo import GitRepo
+from agent_manager.plugins.repos.git_repo import GitRepo, GitRepoError
+
+
+@pytest.fixture(autouse=True)
+def clear_local_clones():
+    """Keep clones registered by one test from being used as references by another."""
+    GitRepo._local_clones.clear()
+    GitRepo._clone_locks.clear()
+    yield
+    GitRepo._local_clones.clear()
+    GitRepo._clone_locks.clear()
 
 
 class TestGitRepoCanHandleUrl:
@@ -59,6 +69,13 @@ class TestGitRepoCanHandleUrl:
 class TestGitRepoValidateUrl:
     """Test cases for GitRepo.validate_url()."""
 
+    @pytest.fixture(autouse=True)
+    def clear_validation_cache(self):
+        """Start and end each test with an empty validation cache."""
+        GitRepo._validated_urls.clear()
+        yield
+        GitRepo._validated_urls.clear()
+
     @patch("agent_manager.plugins.repos.git_repo.git.cmd.Git")
     def test_validate_successful_ls_remote(self, mock_git_cmd):
         """Test that validation succeeds with successful ls-remote."""
@@ -95,6 +112,28 @@ class TestGitRepoValidateUrl:
 
         assert result is False
 
+    @patch("agent_manager.plugins.repos.git_repo.git.cmd.Git")
+    def test_successful_validation_is_cached(self, mock_git_cmd):
+        """Test that a URL is only checked with ls-remote once per process."""
+        mock_git_instance = mock_git_cmd.return_value
+
+        assert GitRepo.validate_url("https://github.com/user/repo.git") is True
+        assert GitRepo.validate_url("https://github.com/user/repo.git") is True
+
+        mock_git_instance.ls_remote.assert_called_once_with("https://github.com/user/repo.git")
+
+    @patch("agent_manager.plugins.repos.git_repo.git.cmd.Git")
+    def test_failed_validation_is_not_cached(self, mock_git_cmd):
+        """Test that a failed URL is checked again on the next call."""
+        mock_git_instance = mock_git_cmd.return_value
+        mock_git_instance.ls_remote.side_effect = [git.exc.GitCommandError("ls-remote", 128), "refs/heads/main"]
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            assert GitRepo.validate_url("https://github.com/user/repo.git") is False
+            assert GitRepo.validate_url("https://github.com/user/repo.git") is True
+
+        assert mock_git_instance.ls_remote.call_count == 2
+
 
 class TestGitRepoInitialization:
     """Test cases for GitRepo initialization."""
@@ -107,6 +146,11 @@ class TestGitRepoInitialization:
         assert repo.url == "https://github.com/user/repo.git"
         assert repo.repos_dir == tmp_path
 
+    def test_shallow_by_default(self, tmp_path):
+        """Test that repositories are cloned shallow unless disabled."""
+        assert GitRepo("test", "https://github.com/user/repo.git", tmp_path).shallow
+        assert not GitRepo("test", "https://github.com/user/repo.git", tmp_path, shallow=False).shallow
+
     def test_local_path_is_under_repos_dir(self, tmp_path):
         """Test that local_path is under repos_dir."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
@@ -136,21 +180,70 @@ class TestGitRepoNeedsUpdate:
         assert repo.needs_update() is True
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
-    def test_needs_update_when_already_cloned(self, mock_repo_class, tmp_path):
-        """Test that needs_update returns True even when repo exists."""
+    def test_needs_update_when_remote_has_new_commits(self, mock_repo_class, tmp_path):
+        """Test that needs_update returns True when the remote branch differs from HEAD."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
         repo.local_path.mkdir(parents=True)
 
         # Mock git.Repo to return a valid repository
         mock_repo_instance = Mock()
         mock_repo_instance.remotes.origin.url = "https://github.com/user/repo.git"
+        mock_repo_instance.active_branch.name = "main"
+        mock_repo_instance.head.commit.hexsha = "a" * 40
+        mock_repo_instance.git.ls_remote.return_value = f"{'b' * 40}\trefs/heads/main"
         mock_repo_class.return_value = mock_repo_instance
 
         with patch("agent_manager.plugins.repos.git_repo.message"):
             result = repo.needs_update()
 
-        # Always returns True to check for remote updates
         assert result is True
+        mock_repo_instance.git.ls_remote.assert_called_once_with("origin", "refs/heads/main")
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_no_update_needed_when_remote_matches_head(self, mock_repo_class, tmp_path):
+        """Test that needs_update returns False when the remote branch is at the local HEAD."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        repo.local_path.mkdir(parents=True)
+
+        mock_repo_instance = Mock()
+        mock_repo_instance.remotes.origin.url = "https://github.com/user/repo.git"
+        mock_repo_instance.active_branch.name = "main"
+        mock_repo_instance.head.commit.hexsha = "a" * 40
+        mock_repo_instance.git.ls_remote.return_value = f"{'a' * 40}\trefs/heads/main"
+        mock_repo_class.return_value = mock_repo_instance
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            assert repo.needs_update() is False
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_needs_update_when_remote_cannot_be_checked(self, mock_repo_class, tmp_path):
+        """Test that needs_update falls back to True when ls-remote fails."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        repo.local_path.mkdir(parents=True)
+
+        mock_repo_instance = Mock()
+        mock_repo_instance.remotes.origin.url = "https://github.com/user/repo.git"
+        mock_repo_instance.active_branch.name = "main"
+        mock_repo_instance.git.ls_remote.side_effect = git.exc.GitCommandError("ls-remote", 128)
+        mock_repo_class.return_value = mock_repo_instance
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            assert repo.needs_update() is True
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_needs_update_when_branch_missing_on_remote(self, mock_repo_class, tmp_path):
+        """Test that needs_update returns True when ls-remote finds no matching branch."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        repo.local_path.mkdir(parents=True)
+
+        mock_repo_instance = Mock()
+        mock_repo_instance.remotes.origin.url = "https://github.com/user/repo.git"
+        mock_repo_instance.active_branch.name = "local-only"
+        mock_repo_instance.git.ls_remote.return_value = ""
+        mock_repo_class.return_value = mock_repo_instance
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            assert repo.needs_update() is True
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
     def test_needs_update_warns_on_url_mismatch(self, mock_repo_class, tmp_path):
@@ -161,6 +254,7 @@ class TestGitRepoNeedsUpdate:
         # Mock git.Repo with different URL
         mock_repo_instance = Mock()
         mock_repo_instance.remotes.origin.url = "https://github.com/other/repo.git"
+        mock_repo_instance.git.ls_remote.return_value = ""
         mock_repo_class.return_value = mock_repo_instance
 
         with patch("agent_manager.plugins.repos.git_repo.message") as mock_message:
@@ -170,17 +264,223 @@ class TestGitRepoNeedsUpdate:
             mock_message.assert_called()
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
-    def test_needs_update_exits_on_invalid_repo(self, mock_repo_class, tmp_path):
-        """Test that needs_update exits when directory is not a valid git repo."""
+    def test_needs_update_raises_on_invalid_repo(self, mock_repo_class, tmp_path):
+        """Test that needs_update raises when directory is not a valid git repo."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
         repo.local_path.mkdir(parents=True)
 
         # Mock git.Repo to raise InvalidGitRepositoryError
         mock_repo_class.side_effect = git.exc.InvalidGitRepositoryError
 
-        with patch("agent_manager.plugins.repos.git_repo.message"), pytest.raises(SystemExit):
+        with (
+            patch("agent_manager.plugins.repos.git_repo.message"),
+            pytest.raises(GitRepoError, match="not a valid git repository"),
+        ):
+            repo.needs_update()
+
+
+class TestGitRepoCaching:
+    """Test cases for caching of the underlying git.Repo object."""
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_git_repo_opened_once(self, mock_repo_class, tmp_path):
+        """Test that needs_update and update share one git.Repo instance."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        repo.local_path.mkdir(parents=True)
+
+        mock_repo_instance = Mock()
+        mock_repo_instance.remotes.origin.url = "https://github.com/user/repo.git"
+        mock_repo_instance.active_branch.name = "main"
+        mock_repo_instance.git.ls_remote.return_value = ""
+        mock_repo_class.return_value = mock_repo_instance
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            repo.needs_update()
+            repo.update()
+
+        mock_repo_class.assert_called_once_with(repo.local_path)
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_origin_url_read_once(self, mock_repo_class, tmp_path):
+        """Test that the origin URL is read from the git config only once."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        repo.local_path.mkdir(parents=True)
+
+        mock_repo_instance = Mock()
+        url_property = PropertyMock(return_value="https://github.com/other/repo.git")
+        type(mock_repo_instance.remotes.origin).url = url_property
+        mock_repo_instance.git.ls_remote.return_value = ""
+        mock_repo_class.return_value = mock_repo_instance
+
+        with patch("agent_manager.plugins.repos.git_repo.message") as mock_message:
+            repo.needs_update()
             repo.needs_update()
 
+        url_property.assert_called_once()
+        warnings = [call.args[0] for call in mock_message.call_args_list if "mismatch" in call.args[0]]
+        assert len(warnings) == 2
+        assert "Got: https://github.com/other/repo.git" in warnings[0]
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_cloned_repo_origin_url_not_read(self, mock_repo_class, tmp_path):
+        """Test that a fresh clone knows its origin URL without reading the config."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        url_property = PropertyMock()
+        type(mock_repo_class.clone_from.return_value.remotes.origin).url = url_property
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            repo.update()
+
+        assert repo._get_origin_url(repo._get_git_repo()) == "https://github.com/user/repo.git"
+        url_property.assert_not_called()
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_cloned_repo_is_reused(self, mock_repo_class, tmp_path):
+        """Test that the repository returned by clone_from is cached."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            repo.update()
+
+        assert repo._get_git_repo() is mock_repo_class.clone_from.return_value
+        mock_repo_class.assert_not_called()
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_failed_open_is_not_cached(self, mock_repo_class, tmp_path):
+        """Test that a failed open is retried on the next call."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        mock_repo_class.side_effect = [git.exc.InvalidGitRepositoryError, Mock()]
+
+        with pytest.raises(git.exc.InvalidGitRepositoryError):
+            repo._get_git_repo()
+        repo._get_git_repo()
+
+        assert mock_repo_class.call_count == 2
+
+
+def _fake_clone(url, path, **kwargs):
+    """Stand in for git.Repo.clone_from by creating the target directory."""
+    path.mkdir(parents=True)
+    return Mock()
+
+
+def _init_source_repo(path):
+    """Create a local git repository with one commit and return its file:// URL."""
+    source = git.Repo.init(path)
+    (path / "README.md").write_text("hello\n")
+    source.index.add(["README.md"])
+    source.index.commit("Initial commit", author=git.Actor("Test", "test@example.com"))
+    return path.as_uri()
+
+
+class TestGitRepoLocalCopy:
+    """Test cases for copying an existing clone of the same URL instead of the remote."""
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_second_clone_copies_first(self, mock_repo_class, tmp_path):
+        """Test that cloning a URL already cloned in this process copies the local clone."""
+        first = GitRepo("first", "https://github.com/user/repo.git", tmp_path)
+        second = GitRepo("second", "https://github.com/user/repo.git", tmp_path)
+        mock_repo_class.clone_from.side_effect = _fake_clone
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            first.update()
+            second.update()
+
+        mock_repo_class.clone_from.assert_called_with((tmp_path / "first").as_uri(), tmp_path / "second", depth=1)
+        second._git_repo.remotes.origin.set_url.assert_called_once_with("https://github.com/user/repo.git")
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_different_urls_do_not_share_clones(self, mock_repo_class, tmp_path):
+        """Test that clones of different URLs are independent."""
+        first = GitRepo("first", "https://github.com/user/one.git", tmp_path)
+        second = GitRepo("second", "https://github.com/user/two.git", tmp_path)
+        mock_repo_class.clone_from.side_effect = _fake_clone
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            first.update()
+            second.update()
+
+        mock_repo_class.clone_from.assert_called_with("https://github.com/user/two.git", tmp_path / "second", depth=1)
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_removed_clone_is_not_copied(self, mock_repo_class, tmp_path):
+        """Test that a registered clone that no longer exists is ignored."""
+        first = GitRepo("first", "https://github.com/user/repo.git", tmp_path)
+        second = GitRepo("second", "https://github.com/user/repo.git", tmp_path)
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            first.update()
+            second.update()
+
+        mock_repo_class.clone_from.assert_called_with("https://github.com/user/repo.git", tmp_path / "second", depth=1)
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_opened_repo_is_not_copied(self, mock_repo_class, tmp_path):
+        """Test that a clone opened from disk, which may be stale, is not used as a source."""
+        existing = GitRepo("existing", "https://github.com/user/repo.git", tmp_path)
+        existing.local_path.mkdir(parents=True)
+        existing._get_git_repo()
+
+        new = GitRepo("new", "https://github.com/user/repo.git", tmp_path)
+
+        assert new._get_local_source() is None
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_parallel_clones_of_same_url_wait_for_first(self, mock_repo_class, tmp_path):
+        """Test that a clone started while the same URL is being cloned copies the first one."""
+        import threading
+        import time
+
+        first = GitRepo("first", "https://github.com/user/repo.git", tmp_path)
+        second = GitRepo("second", "https://github.com/user/repo.git", tmp_path)
+        first_started = threading.Event()
+
+        def clone(url, path, **kwargs):
+            if path == first.local_path:
+                first_started.set()
+                time.sleep(0.1)
+            return _fake_clone(url, path, **kwargs)
+
+        mock_repo_class.clone_from.side_effect = clone
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            thread = threading.Thread(target=first.update)
+            thread.start()
+            assert first_started.wait(timeout=5)
+            second.update()
+            thread.join()
+
+        mock_repo_class.clone_from.assert_called_with((tmp_path / "first").as_uri(), tmp_path / "second", depth=1)
+
+    def test_full_clone_does_not_copy_shallow_clone(self, tmp_path):
+        """Test that a full clone goes to the remote when only a shallow copy exists."""
+        url = _init_source_repo(tmp_path / "source")
+        repos_dir = tmp_path / "repos"
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            GitRepo("first", url, repos_dir).update()
+
+        assert GitRepo("second", url, repos_dir, shallow=False)._get_local_source() is None
+
+    def test_default_shallow_clones_copy_locally(self, tmp_path):
+        """Test that a second default (shallow) clone of a URL copies the first one."""
+        source_path = tmp_path / "source"
+        url = _init_source_repo(source_path)
+        repos_dir = tmp_path / "repos"
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            GitRepo("first", url, repos_dir).update()
+            # The remote is gone, so the second clone can only succeed by copying
+            source_path.rename(tmp_path / "moved")
+            second = GitRepo("second", url, repos_dir)
+            second.update()
+
+        assert (repos_dir / "first" / ".git" / "shallow").exists()
+        assert (repos_dir / "second" / ".git" / "shallow").exists()
+        assert (repos_dir / "second" / "README.md").read_text() == "hello\n"
+        assert second._get_git_repo().remotes.origin.url == url
+
 
 class TestGitRepoUpdate:
     """Test cases for GitRepo.update()."""
@@ -193,19 +493,55 @@ class TestGitRepoUpdate:
         mock_cloned_repo = Mock()
         mock_repo_class.clone_from.return_value = mock_cloned_repo
 
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            repo.update()
+
+        mock_repo_class.clone_from.assert_called_once_with(
+            "https://github.com/user/repo.git", tmp_path / "test", depth=1
+        )
+
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_update_full_clone_when_not_shallow(self, mock_repo_class, tmp_path):
+        """Test that shallow=False clones the full history."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path, shallow=False)
+
         with patch("agent_manager.plugins.repos.git_repo.message"):
             repo.update()
 
         mock_repo_class.clone_from.assert_called_once_with("https://github.com/user/repo.git", tmp_path / "test")
 
+    def test_shallow_clone_pulls_new_commits(self, tmp_path):
+        """Test that a shallow clone fetches only the latest commit and can still be updated."""
+        source = git.Repo.init(tmp_path / "source")
+        author = git.Actor("Test", "test@example.com")
+        for content in ("one", "two"):
+            (tmp_path / "source" / "README.md").write_text(content)
+            source.index.add(["README.md"])
+            source.index.commit(content, author=author)
+        repo = GitRepo("test", f"file://{tmp_path / 'source'}", tmp_path / "repos")
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            repo.update()
+            assert len(list(repo._get_git_repo().iter_commits())) == 1
+
+            (tmp_path / "source" / "README.md").write_text("three")
+            source.index.add(["README.md"])
+            source.index.commit("three", author=author)
+            repo.update()
+
+        assert (repo.local_path / "README.md").read_text() == "three"
+
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
-    def test_update_exits_on_clone_failure(self, mock_repo_class, tmp_path):
-        """Test that update exits when cloning fails."""
+    def test_update_raises_on_clone_failure(self, mock_repo_class, tmp_path):
+        """Test that update raises when cloning fails."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
 
         mock_repo_class.clone_from.side_effect = git.exc.GitCommandError("clone", 128)
 
-        with patch("agent_manager.plugins.repos.git_repo.message"), pytest.raises(SystemExit):
+        with (
+            patch("agent_manager.plugins.repos.git_repo.message"),
+            pytest.raises(GitRepoError, match="Failed to clone"),
+        ):
             repo.update()
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
@@ -217,16 +553,29 @@ class TestGitRepoUpdate:
         # Mock existing repository
         mock_repo_instance = Mock()
         mock_repo_instance.active_branch.name = "main"
-        mock_repo_instance.remotes.origin.fetch.return_value = None
         mock_repo_instance.remotes.origin.pull.return_value = None
         mock_repo_class.return_value = mock_repo_instance
 
         with patch("agent_manager.plugins.repos.git_repo.message"):
             repo.update()
 
-        mock_repo_instance.remotes.origin.fetch.assert_called_once()
         mock_repo_instance.remotes.origin.pull.assert_called_once_with("main")
 
+    @patch("agent_manager.plugins.repos.git_repo.git.Repo")
+    def test_update_does_not_fetch_separately(self, mock_repo_class, tmp_path):
+        """Test that update relies on pull to fetch instead of a separate fetch round trip."""
+        repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
+        repo.local_path.mkdir(parents=True)
+
+        mock_repo_instance = Mock()
+        mock_repo_instance.active_branch.name = "main"
+        mock_repo_class.return_value = mock_repo_instance
+
+        with patch("agent_manager.plugins.repos.git_repo.message"):
+            repo.update()
+
+        mock_repo_instance.remotes.origin.fetch.assert_not_called()
+
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
     def test_update_handles_different_branch(self, mock_repo_class, tmp_path):
         """Test that update handles non-main branches."""
@@ -236,7 +585,6 @@ class TestGitRepoUpdate:
         # Mock repository on 'develop' branch
         mock_repo_instance = Mock()
         mock_repo_instance.active_branch.name = "develop"
-        mock_repo_instance.remotes.origin.fetch.return_value = None
         mock_repo_instance.remotes.origin.pull.return_value = None
         mock_repo_class.return_value = mock_repo_instance
 
@@ -246,31 +594,36 @@ class TestGitRepoUpdate:
         mock_repo_instance.remotes.origin.pull.assert_called_once_with("develop")
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
-    def test_update_exits_on_pull_failure(self, mock_repo_class, tmp_path):
-        """Test that update exits when pull fails."""
+    def test_update_raises_on_pull_failure(self, mock_repo_class, tmp_path):
+        """Test that update raises when pull fails."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
         repo.local_path.mkdir(parents=True)
 
         # Mock repository that fails on pull
         mock_repo_instance = Mock()
         mock_repo_instance.active_branch.name = "main"
-        mock_repo_instance.remotes.origin.fetch.return_value = None
         mock_repo_instance.remotes.origin.pull.side_effect = git.exc.GitCommandError("pull", 1)
         mock_repo_class.return_value = mock_repo_instance
 
-        with patch("agent_manager.plugins.repos.git_repo.message"), pytest.raises(SystemExit):
+        with (
+            patch("agent_manager.plugins.repos.git_repo.message"),
+            pytest.raises(GitRepoError, match="Failed to pull changes"),
+        ):
             repo.update()
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
-    def test_update_exits_on_invalid_repo(self, mock_repo_class, tmp_path):
-        """Test that update exits when local path is not a valid git repo."""
+    def test_update_raises_on_invalid_repo(self, mock_repo_class, tmp_path):
+        """Test that update raises when local path is not a valid git repo."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
         repo.local_path.mkdir(parents=True)
 
         # Mock git.Repo to raise InvalidGitRepositoryError
         mock_repo_class.side_effect = git.exc.InvalidGitRepositoryError
 
-        with patch("agent_manager.plugins.repos.git_repo.message"), pytest.raises(SystemExit):
+        with (
+            patch("agent_manager.plugins.repos.git_repo.message"),
+            pytest.raises(GitRepoError, match="not a valid git repository"),
+        ):
             repo.update()
 
 
@@ -354,11 +707,14 @@ class TestGitRepoEdgeCases:
         assert repo.local_path.name == "test-repo_v2.0"
 
     @patch("agent_manager.plugins.repos.git_repo.git.Repo")
-    def test_update_handles_generic_exception(self, mock_repo_class, tmp_path):
-        """Test that update handles unexpected exceptions."""
+    def test_update_wraps_generic_exception(self, mock_repo_class, tmp_path):
+        """Test that update wraps unexpected exceptions in GitRepoError."""
         repo = GitRepo("test", "https://github.com/user/repo.git", tmp_path)
 
         mock_repo_class.clone_from.side_effect = Exception("Unexpected error")
 
-        with patch("agent_manager.plugins.repos.git_repo.message"), pytest.raises(SystemExit):
+        with (
+            patch("agent_manager.plugins.repos.git_repo.message"),
+            pytest.raises(GitRepoError, match="Unexpected error cloning"),
+        ):
             repo.update()
@@ -1,15 +1,19 @@
 """Tests for utils/discovery.py - Generic plugin discovery utilities."""
 
+import importlib.metadata
+import os
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import yaml
 
+from agent_manager.utils import discovery
 from agent_manager.utils.discovery import (
     _discover_by_entry_points,
     _discover_by_package_prefix,
+    _installed_entry_points,
     discover_external_plugins,
     filter_disabled_plugins,
     get_disabled_plugins,
@@ -106,7 +110,7 @@ class TestDiscoverByEntryPoints:
         mock_ep.value = "am_merger_smart_markdown:SmartMarkdownMerger"
         mock_ep.load.return_value = MockClass
 
-        mock_eps = Mock()
+        mock_eps = MagicMock()
         mock_eps.select.return_value = [mock_ep]
         mock_entry_points.return_value = mock_eps
 
@@ -124,7 +128,7 @@ class TestDiscoverByEntryPoints:
         mock_ep.name = "invalid"
         mock_ep.load.return_value = "not a class"
 
-        mock_eps = Mock()
+        mock_eps = MagicMock()
         mock_eps.select.return_value = [mock_ep]
         mock_entry_points.return_value = mock_eps
 
@@ -142,7 +146,7 @@ class TestDiscoverByEntryPoints:
         mock_ep.name = "broken"
         mock_ep.load.side_effect = Exception("Load failed")
 
-        mock_eps = Mock()
+        mock_eps = MagicMock()
         mock_eps.select.return_value = [mock_ep]
         mock_entry_points.return_value = mock_eps
 
@@ -152,6 +156,149 @@ class TestDiscoverByEntryPoints:
         assert result == {}
 
 
+class TestInstalledDistributionCache:
+    """Test cases for caching of installed distribution scans."""
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.distributions")
+    def test_distributions_scanned_once(self, mock_distributions):
+        """Test that several prefix lookups share one scan of sys.path."""
+        mock_dist = Mock()
+        mock_dist.name = "am-agent-claude"
+        mock_distributions.return_value = [mock_dist]
+
+        _discover_by_package_prefix("agent", "am_agent_")
+        result = _discover_by_package_prefix("agent", "am_agent_")
+
+        mock_distributions.assert_called_once()
+        assert "claude" in result
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.distributions")
+    def test_distributions_rescanned_when_sys_path_changes(self, mock_distributions, monkeypatch):
+        """Test that adding a path entry picks up newly visible distributions."""
+        mock_distributions.return_value = []
+        _discover_by_package_prefix("agent", "am_agent_")
+
+        monkeypatch.syspath_prepend("/nonexistent/plugins")
+        _discover_by_package_prefix("agent", "am_agent_")
+
+        assert mock_distributions.call_count == 2
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.entry_points")
+    def test_entry_points_scanned_once(self, mock_entry_points):
+        """Test that lookups for different groups share one entry point scan."""
+        mock_entry_points.return_value.select.return_value = []
+
+        with patch("agent_manager.utils.discovery.message"):
+            _discover_by_entry_points("merger", "agent_manager.mergers")
+            _discover_by_entry_points("agent", "agent_manager.agents")
+
+        mock_entry_points.assert_called_once()
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.distributions")
+    def test_failed_scan_is_not_cached(self, mock_distributions):
+        """Test that a scan that raised is retried on the next lookup."""
+        mock_dist = Mock()
+        mock_dist.name = "am-agent-claude"
+        mock_distributions.side_effect = [Exception("Discovery failed"), [mock_dist]]
+
+        with patch("agent_manager.utils.discovery.message"):
+            assert _discover_by_package_prefix("agent", "am_agent_") == {}
+
+        assert "claude" in _discover_by_package_prefix("agent", "am_agent_")
+
+
+class TestEntryPointDiskCache:
+    """Test cases for the entry point cache persisted between runs."""
+
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path, monkeypatch):
+        """Give each test its own writable cache file."""
+        monkeypatch.setattr(discovery, "ENTRY_POINT_CACHE_FILE", tmp_path / "cache" / "entry_points.json")
+
+    @staticmethod
+    def _entry_points():
+        return importlib.metadata.EntryPoints(
+            [
+                importlib.metadata.EntryPoint(
+                    "smart_markdown", "am_merger_smart_markdown:SmartMarkdownMerger", "agent_manager.mergers"
+                ),
+                importlib.metadata.EntryPoint("other", "other_package:main", "console_scripts"),
+            ]
+        )
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.entry_points")
+    def test_next_run_reads_cache(self, mock_entry_points):
+        """Test that a later run loads entry points from disk instead of scanning."""
+        mock_entry_points.return_value = self._entry_points()
+        _installed_entry_points(("/site-packages",))
+
+        # Simulate a new process
+        _installed_entry_points.cache_clear()
+        entry_points = _installed_entry_points(("/site-packages",))
+
+        mock_entry_points.assert_called_once()
+        selected = list(entry_points.select(group="agent_manager.mergers"))
+        assert [(ep.name, ep.value) for ep in selected] == [
+            ("smart_markdown", "am_merger_smart_markdown:SmartMarkdownMerger")
+        ]
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.entry_points")
+    def test_changed_search_path_rescans(self, mock_entry_points, tmp_path):
+        """Test that installing a package (changing site-packages) invalidates the cache."""
+        site_packages = tmp_path / "site-packages"
+        site_packages.mkdir()
+        mock_entry_points.return_value = self._entry_points()
+        _installed_entry_points((str(site_packages),))
+
+        (site_packages / "new_plugin-1.0.dist-info").mkdir()
+        os.utime(site_packages, ns=(0, 0))
+        _installed_entry_points.cache_clear()
+        _installed_entry_points((str(site_packages),))
+
+        assert mock_entry_points.call_count == 2
+
+    def test_default_location_honors_xdg_cache_home(self, monkeypatch, tmp_path):
+        """Test that the default cache file lives under $XDG_CACHE_HOME when it is set."""
+        monkeypatch.setattr(discovery, "ENTRY_POINT_CACHE_FILE", None)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        assert discovery._entry_point_cache_file() == tmp_path / "xdg" / "agent-manager" / "entry_points.json"
+
+    def test_default_location_falls_back_to_home_cache(self, monkeypatch, tmp_path):
+        """Test that the default cache file lives under ~/.cache without $XDG_CACHE_HOME."""
+        monkeypatch.setattr(discovery, "ENTRY_POINT_CACHE_FILE", None)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert discovery._entry_point_cache_file() == tmp_path / ".cache" / "agent-manager" / "entry_points.json"
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.entry_points")
+    def test_corrupt_cache_is_ignored(self, mock_entry_points):
+        """Test that an unreadable cache file falls back to scanning."""
+        discovery.ENTRY_POINT_CACHE_FILE.parent.mkdir(parents=True)
+        discovery.ENTRY_POINT_CACHE_FILE.write_text("{not json")
+        mock_entry_points.return_value = self._entry_points()
+
+        with patch("agent_manager.utils.discovery.message"):
+            entry_points = _installed_entry_points(("/site-packages",))
+
+        mock_entry_points.assert_called_once()
+        assert len(list(entry_points.select(group="agent_manager.mergers"))) == 1
+
+    @patch("agent_manager.utils.discovery.importlib.metadata.entry_points")
+    def test_unwritable_cache_does_not_fail_discovery(self, mock_entry_points):
+        """Test that discovery still works when the cache cannot be written."""
+        mock_entry_points.return_value = self._entry_points()
+
+        with (
+            patch("agent_manager.utils.discovery.atomic_write_text", side_effect=OSError("read-only")),
+            patch("agent_manager.utils.discovery.message"),
+        ):
+            entry_points = _installed_entry_points(("/site-packages",))
+
+        assert len(list(entry_points.select(group="agent_manager.mergers"))) == 1
+
+
 class TestDiscoverExternalPlugins:
     """Test cases for discover_external_plugins function."""
 
@@ -288,6 +435,72 @@ class TestGetDisabledPlugins:
             assert result["repos"] == []
 
 
+class TestGetDisabledPluginsCache:
+    """Test cases for caching of parsed plugin state."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end each test with an empty cache."""
+        discovery._disabled_cache.clear()
+        yield
+        discovery._disabled_cache.clear()
+
+    def test_unchanged_config_is_parsed_once(self, tmp_path):
+        """Test that repeated lookups do not reparse an unchanged file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("plugins:\n  disabled:\n    agents: [claude]\n")
+
+        with patch("agent_manager.utils.discovery.yaml.load", wraps=yaml.load) as mock_load:
+            get_disabled_plugins(config_file)
+            result = get_disabled_plugins(config_file)
+
+        assert mock_load.call_count == 1
+        assert result["agents"] == ["claude"]
+
+    def test_modified_config_is_reparsed(self, tmp_path):
+        """Test that a change to the file is picked up."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("plugins:\n  disabled:\n    agents: [claude]\n")
+        get_disabled_plugins(config_file)
+
+        config_file.write_text("plugins:\n  disabled:\n    agents: [cursor, claude]\n")
+
+        assert get_disabled_plugins(config_file)["agents"] == ["cursor", "claude"]
+
+    def test_set_plugin_enabled_invalidates_cache(self, tmp_path):
+        """Test that changing plugin state is visible on the next lookup."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hierarchy: []\n")
+        get_disabled_plugins(config_file)
+
+        with patch("agent_manager.utils.discovery.message"):
+            set_plugin_enabled("agents", "claude", False, config_file)
+
+        assert get_disabled_plugins(config_file)["agents"] == ["claude"]
+
+    def test_returned_lists_do_not_alias_cache(self, tmp_path):
+        """Test that modifying a result does not affect later lookups."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("plugins:\n  disabled:\n    agents: [claude]\n")
+
+        get_disabled_plugins(config_file)["agents"].append("cursor")
+
+        assert get_disabled_plugins(config_file)["agents"] == ["claude"]
+
+    def test_unreadable_config_is_not_cached(self, tmp_path):
+        """Test that a parse failure is retried on the next lookup."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("plugins:\n  disabled:\n    agents: [claude]\n")
+
+        with (
+            patch("agent_manager.utils.discovery.yaml.load", side_effect=yaml.YAMLError("bad")),
+            patch("agent_manager.utils.discovery.message"),
+        ):
+            assert get_disabled_plugins(config_file)["agents"] == []
+
+        assert get_disabled_plugins(config_file)["agents"] == ["claude"]
+
+
 class TestIsPluginDisabled:
     """Test cases for is_plugin_disabled function."""
 
@@ -373,6 +586,44 @@ class TestSetPluginEnabled:
             # Plugins section should be removed entirely
             assert "plugins" not in updated_config
 
+    def test_already_disabled_does_not_write(self, tmp_path):
+        """Test that disabling an already disabled plugin leaves the file alone."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("plugins:\n  disabled:\n    mergers: [smart_markdown]\n")
+
+        with (
+            patch("agent_manager.utils.discovery.message"),
+            patch("agent_manager.utils.discovery.atomic_write_text") as mock_write,
+        ):
+            result = set_plugin_enabled("mergers", "smart_markdown", False, config_file)
+
+        assert result is True
+        mock_write.assert_not_called()
+
+    def test_already_enabled_does_not_create_config(self, tmp_path):
+        """Test that enabling a plugin that is not disabled does not create a config file."""
+        config_file = tmp_path / "config.yaml"
+
+        with patch("agent_manager.utils.discovery.message"):
+            result = set_plugin_enabled("mergers", "smart_markdown", True, config_file)
+
+        assert result is True
+        assert not config_file.exists()
+
+    def test_preserves_existing_config(self):
+        """Test that unrelated settings and their key order survive a rewrite."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.yaml"
+            config_file.write_text("hierarchy:\n- name: org\n  url: https://example.com/org.git\nagents: {}\n")
+
+            with patch("agent_manager.utils.discovery.message"):
+                set_plugin_enabled("mergers", "smart_markdown", False, config_file)
+
+            updated_config = yaml.safe_load(config_file.read_text())
+
+            assert list(updated_config) == ["hierarchy", "agents", "plugins"]
+            assert updated_config["hierarchy"] == [{"name": "org", "url": "https://example.com/org.git"}]
+
 
 class TestFilterDisabledPlugins:
     """Test cases for filter_disabled_plugins function."""
@@ -411,3 +662,30 @@ class TestFilterDisabledPlugins:
             result = filter_disabled_plugins(plugins, "mergers", config_file)
 
             assert len(result) == 2
+
+    def test_returns_copy_when_none_disabled(self):
+        """Test that the input dictionary is never returned or modified."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.yaml"
+            plugins = {"one": {"package": "test1"}}
+
+            result = filter_disabled_plugins(plugins, "mergers", config_file)
+            result["two"] = {"package": "test2"}
+
+            assert plugins == {"one": {"package": "test1"}}
+
+    def test_keeps_plugin_order_and_reports_each_skip(self):
+        """Test that enabled plugins keep their order and each skip is reported."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.yaml"
+            config_file.write_text("plugins:\n  disabled:\n    agents: [b, d, unknown]\n")
+            plugins = {name: {} for name in "abcde"}
+
+            with patch("agent_manager.utils.discovery.message") as mock_message:
+                result = filter_disabled_plugins(plugins, "agents", config_file)
+
+            assert list(result) == ["a", "c", "e"]
+            assert [call.args[0] for call in mock_message.call_args_list] == [
+                "Skipping disabled agent: b",
+                "Skipping disabled agent: d",
+            ]
@@ -0,0 +1,258 @@
+"""Tests for utils/files.py - File reading and writing utilities."""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agent_manager.utils.files import (
+    DEFAULT_FILE_MODE,
+    atomic_write_text,
+    fast_read_text,
+    fast_write_text,
+    output_unchanged,
+    read_files,
+)
+
+
+class TestAtomicWriteText:
+    """Test cases for atomic_write_text function."""
+
+    def test_writes_new_file(self, tmp_path):
+        """Test that a new file is created with the given content."""
+        target = tmp_path / "config.yaml"
+
+        atomic_write_text(target, "hierarchy: []\n")
+
+        assert target.read_text() == "hierarchy: []\n"
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Test that an existing file is fully replaced."""
+        target = tmp_path / "config.yaml"
+        target.write_text("old content that is longer than the new one\n")
+
+        atomic_write_text(target, "new\n")
+
+        assert target.read_text() == "new\n"
+
+    @pytest.mark.parametrize("umask", [0o022, 0o002, 0o077])
+    def test_new_file_mode_follows_umask(self, tmp_path, umask):
+        """Test that new files get the default permissions minus the umask."""
+        target = tmp_path / "config.yaml"
+
+        old_umask = os.umask(umask)
+        try:
+            atomic_write_text(target, "data")
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE(target.stat().st_mode) == DEFAULT_FILE_MODE & ~umask
+
+    def test_writes_through_symlink(self, tmp_path):
+        """Test that a symlinked file is updated and the link is kept."""
+        dotfiles = tmp_path / "dotfiles"
+        dotfiles.mkdir()
+        real_file = dotfiles / "config.yaml"
+        real_file.write_text("old\n")
+        link = tmp_path / "config.yaml"
+        link.symlink_to(real_file)
+
+        atomic_write_text(link, "new\n")
+
+        assert link.is_symlink()
+        assert real_file.read_text() == "new\n"
+        assert sorted(p.name for p in dotfiles.iterdir()) == ["config.yaml"]
+
+    def test_preserves_existing_mode(self, tmp_path):
+        """Test that the permissions of an existing file are kept."""
+        target = tmp_path / "config.yaml"
+        target.write_text("data")
+        os.chmod(target, 0o600)
+
+        atomic_write_text(target, "updated")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+    def test_leaves_no_temp_files(self, tmp_path):
+        """Test that no temporary files remain after a successful write."""
+        target = tmp_path / "config.yaml"
+
+        atomic_write_text(target, "data")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+    def test_failed_replace_keeps_original(self, tmp_path):
+        """Test that the original file survives and temp files are removed on failure."""
+        target = tmp_path / "config.yaml"
+        target.write_text("original")
+
+        with patch("agent_manager.utils.files.os.replace", side_effect=OSError("boom")), pytest.raises(OSError):
+            atomic_write_text(target, "new")
+
+        assert target.read_text() == "original"
+        assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        """Test that writing into a missing directory raises OSError."""
+        target = tmp_path / "missing" / "config.yaml"
+
+        with pytest.raises(OSError):
+            atomic_write_text(target, "data")
+
+
+class TestFastReadText:
+    """Test cases for the fast_read_text helper."""
+
+    def test_reads_utf8_content(self, tmp_path):
+        """Test that UTF-8 content is read unchanged."""
+        file_path = tmp_path / "notes.md"
+        file_path.write_bytes("Sources: org → team\n".encode())
+
+        assert fast_read_text(file_path) == "Sources: org → team\n"
+
+    def test_reads_empty_file(self, tmp_path):
+        """Test that an empty file reads as an empty string."""
+        file_path = tmp_path / "empty.md"
+        file_path.touch()
+
+        assert fast_read_text(file_path) == ""
+
+    def test_translates_newlines_like_read_text(self, tmp_path):
+        """Test that CRLF and CR line endings are translated like Path.read_text()."""
+        file_path = tmp_path / "windows.txt"
+        file_path.write_bytes(b"a\r\nb\rc\n")
+
+        assert fast_read_text(file_path) == file_path.read_text() == "a\nb\nc\n"
+
+    def test_falls_back_for_non_utf8_content(self, tmp_path):
+        """Test that non-UTF-8 content is read through Path.read_text()."""
+        file_path = tmp_path / "latin1.txt"
+        file_path.write_bytes(b"caf\xe9")
+
+        with patch.object(Path, "read_text", return_value="café") as mock_read_text:
+            assert fast_read_text(file_path) == "café"
+
+        mock_read_text.assert_called_once()
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            fast_read_text(tmp_path / "missing.txt")
+
+
+class TestFastWriteText:
+    """Test cases for the fast_write_text helper."""
+
+    def test_writes_utf8_content(self, tmp_path):
+        """Test that content is written as UTF-8."""
+        file_path = tmp_path / "notes.md"
+
+        fast_write_text(file_path, "Sources: org → team\n")
+
+        assert file_path.read_bytes() == "Sources: org → team\n".encode()
+
+    def test_truncates_existing_file(self, tmp_path):
+        """Test that an existing longer file is fully replaced."""
+        file_path = tmp_path / "config.yaml"
+        file_path.write_text("old content that is longer\n")
+
+        fast_write_text(file_path, "new\n")
+
+        assert file_path.read_text() == "new\n"
+
+    def test_newlines_are_not_translated(self, tmp_path):
+        """Test that newlines are written as a bare LF, not os.linesep."""
+        file_path = tmp_path / "merged.md"
+
+        fast_write_text(file_path, "a\nb\n")
+
+        assert file_path.read_bytes() == b"a\nb\n"
+
+    def test_handles_partial_writes(self, tmp_path):
+        """Test that all bytes are written when os.write writes in chunks."""
+        file_path = tmp_path / "chunked.txt"
+        real_write = os.write
+
+        with patch("agent_manager.utils.files.os.write", side_effect=lambda fd, d: real_write(fd, d[:3])):
+            fast_write_text(file_path, "abcdefghij")
+
+        assert file_path.read_text() == "abcdefghij"
+
+    def test_new_file_mode_follows_umask(self, tmp_path):
+        """Test that new files get the same mode write_text() would give them."""
+        old_umask = os.umask(0o002)
+        try:
+            fast_write_text(tmp_path / "merged.md", "content\n")
+            (tmp_path / "reference.md").write_text("content\n")
+        finally:
+            os.umask(old_umask)
+
+        assert (tmp_path / "merged.md").stat().st_mode & 0o777 == 0o664
+        assert (tmp_path / "merged.md").stat().st_mode == (tmp_path / "reference.md").stat().st_mode
+
+
+class TestReadFiles:
+    """Test cases for the read_files helper."""
+
+    def test_reads_files_in_order(self, tmp_path):
+        """Test that contents are returned in input order when read in parallel."""
+        files = []
+        for i in range(20):
+            file_path = tmp_path / f"file{i}.txt"
+            file_path.write_text(f"content {i}")
+            files.append(file_path)
+
+        assert read_files(files) == [f"content {i}" for i in range(20)]
+
+    def test_reads_short_list_serially(self, tmp_path):
+        """Test that short lists are read without a thread pool."""
+        file_path = tmp_path / "only.txt"
+        file_path.write_text("data")
+
+        with patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+            assert read_files([file_path]) == ["data"]
+
+        mock_executor.assert_not_called()
+
+    def test_returns_errors_instead_of_raising(self, tmp_path):
+        """Test that a failed read is returned in place without affecting other files."""
+        files = [tmp_path / f"file{i}.txt" for i in range(5)]
+        for file_path in files:
+            file_path.write_text("ok")
+        files[2].unlink()
+
+        results = read_files(files)
+
+        assert isinstance(results[2], FileNotFoundError)
+        assert results[:2] + results[3:] == ["ok"] * 4
+
+
+class TestOutputUnchanged:
+    """Test cases for the output_unchanged helper."""
+
+    def test_identical_content_is_unchanged(self, tmp_path):
+        """Test that a file holding exactly the content is reported unchanged."""
+        file_path = tmp_path / "merged.md"
+        fast_write_text(file_path, "Sources: org → team\n")
+
+        assert output_unchanged(file_path, "Sources: org → team\n")
+
+    def test_different_content_is_changed(self, tmp_path):
+        """Test that a file with other content of the same size is reported changed."""
+        file_path = tmp_path / "merged.md"
+        file_path.write_bytes(b"abc\n")
+
+        assert not output_unchanged(file_path, "xyz\n")
+
+    def test_crlf_file_is_changed(self, tmp_path):
+        """Test that CRLF line endings differ from what fast_write_text() would write."""
+        file_path = tmp_path / "merged.md"
+        file_path.write_bytes(b"a\r\nb\r\n")
+
+        assert not output_unchanged(file_path, "a\nb\n")
+
+    def test_missing_file_is_changed(self, tmp_path):
+        """Test that a missing output file is reported changed."""
+        assert not output_unchanged(tmp_path / "missing.md", "content\n")
@@ -120,23 +120,28 @@ class TestResolveFilePath:
         assert result.is_absolute()
         assert result == Path("/tmp/test").resolve()
 
-    def test_expands_home_directory_with_file_url(self):
+    def test_expands_home_directory_with_file_url(self, resolved_home):
         """Test that ~/ is expanded to user's home directory with file:// URL."""
-        home = Path.home()
+        home = resolved_home
         result = resolve_file_path("file://~/Documents")
 
         assert result.is_absolute()
         assert str(result).startswith(str(home))
         assert str(result) == str(home / "Documents")
 
-    def test_expands_home_directory_without_file_url(self):
+    def test_expands_home_directory_without_file_url(self, resolved_home):
         """Test that ~/ is expanded without file:// prefix."""
-        home = Path.home()
+        home = resolved_home
         result = resolve_file_path("~/Documents")
 
         assert result.is_absolute()
         assert str(result) == str(home / "Documents")
 
+    def test_expands_bare_home_directory(self, resolved_home):
+        """Test that a bare ~ resolves to the home directory itself."""
+        assert resolve_file_path("~") == resolved_home
+        assert resolve_file_path("file://~") == resolved_home
+
     def test_resolves_relative_path_with_file_url(self):
         """Test that relative paths are resolved to absolute with file:// URL."""
         result = resolve_file_path("file://relative/path")
@@ -288,9 +293,9 @@ class TestUrlUtilsIntegration:
         resolved = resolve_file_path(file_url)
         assert resolved == Path(original_path).resolve()
 
-    def test_home_directory_expansion_consistency(self):
+    def test_home_directory_expansion_consistency(self, resolved_home):
         """Test that ~/ expansion is consistent."""
-        home = Path.home()
+        home = resolved_home
 
         result1 = resolve_file_path("~/test")
         result2 = resolve_file_path("file://~/test")